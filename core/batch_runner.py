@@ -0,0 +1,269 @@
+# core/batch_runner.py
+
+import csv
+import json
+import math
+import time
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+from core.plugin_interface import IPlugin
+
+
+class BatchStats:
+    """Kennzahlen eines Batch-Laufs."""
+
+    def __init__(self):
+        self.rows = 0
+        self.invalid_rows = 0
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.rows} Zeilen in {self.seconds:.3f} s "
+            f"({self.rows_per_second:,.0f} Zeilen/s, {self.invalid_rows} ungueltig)"
+        )
+
+
+class BatchRunner:
+    """Fuehrt einen Plugin-Befehl ohne GUI zeilenweise ueber Eingabedateien aus."""
+
+    def __init__(self, plugin: IPlugin, command_name: str, chunk_size: int = 10000):
+        """
+        Initialisiert einen neuen Batch-Lauf.
+
+        Args:
+            plugin: Das Plugin, dessen Befehl ausgefuehrt wird
+            command_name: Name des auszufuehrenden Befehls
+            chunk_size: Anzahl der Zeilen, die gemeinsam an exec_batch gehen
+
+        Raises:
+            ValueError: Wenn das Plugin den Befehl nicht kennt
+        """
+        commands = {command.name: command for command in plugin.get_info().commands}
+        if command_name not in commands:
+            raise ValueError(
+                f"Unbekannter Befehl: {command_name} "
+                f"(verfuegbar: {', '.join(commands)})"
+            )
+
+        self.plugin = plugin
+        self.command = commands[command_name]
+        self.chunk_size = max(1, chunk_size)
+        # Positionen der Parameter in den Eingabezeilen (None: die ersten Spalten)
+        self.param_indices: Optional[List[int]] = None
+
+    def select_columns(self, columns: Sequence[str], header: Optional[Sequence[str]] = None) -> None:
+        """
+        Legt fest, aus welchen Eingabespalten die Parameter gelesen werden.
+
+        Die uebrigen Spalten werden unveraendert mit ausgegeben, z.B.
+        Rechnungsnummern neben Netto- und Bruttobetrag.
+
+        Args:
+            columns: Je Parameter ein Spaltenname aus der Kopfzeile oder eine
+                Spaltennummer (ab 1)
+            header: Die Kopfzeile der Eingabe, falls vorhanden
+
+        Raises:
+            ValueError: Wenn die Anzahl nicht passt oder eine Spalte fehlt
+        """
+        if len(columns) != len(self.command.param_names):
+            raise ValueError(
+                f"Es werden {len(self.command.param_names)} Spalten benoetigt "
+                f"({', '.join(self.command.param_names)})."
+            )
+
+        indices = []
+        for column in columns:
+            column = column.strip()
+            if column.isdigit() and int(column) > 0:
+                indices.append(int(column) - 1)
+            elif header is not None and column in header:
+                indices.append(list(header).index(column))
+            else:
+                raise ValueError(f"Spalte nicht gefunden: {column}")
+        self.param_indices = indices
+
+    def read_rows(self, stream: TextIO, input_format: str = "csv", delimiter: str = ",",
+                  header: bool = False, columns: Optional[Sequence[str]] = None) -> Iterator[List[Any]]:
+        """
+        Liest Parameterzeilen streamend aus CSV oder JSONL.
+
+        JSONL-Zeilen sind entweder Listen oder Objekte mit den Parameternamen
+        des Befehls (bzw. den gewaehlten Spaltennamen) als Schluessel. Eine
+        CSV-Kopfzeile wird sofort gelesen, damit die Spaltenauswahl vor dem
+        ersten Block feststeht.
+
+        Args:
+            stream: Der Eingabestrom
+            input_format: "csv" oder "jsonl"
+            delimiter: Trennzeichen fuer CSV
+            header: True, wenn die erste CSV-Zeile eine Kopfzeile ist
+            columns: Optionale Spaltenauswahl (siehe select_columns)
+
+        Returns:
+            Iterator[List[Any]]: Eingabezeilen
+        """
+        if input_format == "jsonl":
+            keys = list(self.command.param_names)
+            if columns and not all(column.strip().isdigit() for column in columns):
+                keys = [column.strip() for column in columns]
+            elif columns:
+                self.select_columns(columns)
+            return self._read_jsonl(stream, keys)
+
+        reader = csv.reader(stream, delimiter=delimiter)
+        header_row = next(reader, None) if header else None
+        if columns:
+            self.select_columns(columns, header_row)
+        return (row for row in reader if row)
+
+    @staticmethod
+    def _read_jsonl(stream: TextIO, keys: List[str]) -> Iterator[List[Any]]:
+        """Liest JSONL-Zeilen; Objekte werden ueber keys in Parameterlisten umgewandelt."""
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if isinstance(record, dict):
+                yield [record.get(key, "") for key in keys]
+            else:
+                yield list(record)
+
+    def run(self, rows: Iterable[List[Any]], output: TextIO, output_format: str = "csv",
+            delimiter: str = ",", executor: Optional[Any] = None) -> BatchStats:
+        """
+        Verarbeitet alle Zeilen in Bloecken und schreibt die Ergebnisse sofort.
+
+        Es wird immer nur eine begrenzte Zahl von Bloecken mit chunk_size Zeilen
+        im Speicher gehalten, daher bleibt der Speicherbedarf unabhaengig von
+        der Eingabegroesse.
+
+        Args:
+            rows: Parameterzeilen
+            output: Der Ausgabestrom
+            output_format: "csv" oder "jsonl"
+            delimiter: Trennzeichen fuer CSV
+            executor: Optionaler ParallelBatchExecutor fuer mehrere Prozesse
+
+        Returns:
+            BatchStats: Anzahl der Zeilen, ungueltige Zeilen und Laufzeit
+        """
+        stats = BatchStats()
+        start = time.perf_counter()
+        writer = csv.writer(output, delimiter=delimiter, lineterminator="\n") if output_format == "csv" else None
+
+        chunks = self.chunks(rows)
+        if executor is not None:
+            processed = executor.map_chunks(chunks)
+        else:
+            processed = ((chunk, self.process_chunk(chunk)) for chunk in chunks)
+
+        for chunk, results in processed:
+            for params, values in zip(chunk, results):
+                if values is None:
+                    stats.invalid_rows += 1
+                    values = []
+                # Mehrzeilige Ergebnisse (z.B. Tilgungsplaene): eine Ausgabezeile pro Ergebniszeile
+                result_rows = values.iter_rows() if hasattr(values, "iter_rows") else (values,)
+                for values in result_rows:
+                    if writer is not None:
+                        writer.writerow(list(params) + list(values))
+                    else:
+                        # Decimal-Betraege (Rechenart decimal) als exakter Text
+                        output.write(json.dumps({"params": list(params), "result": list(values)}, default=str) + "\n")
+
+            stats.rows += len(chunk)
+
+        output.flush()
+        stats.seconds = time.perf_counter() - start
+        return stats
+
+    def chunks(self, rows: Iterable[List[Any]]) -> Iterator[List[List[Any]]]:
+        """
+        Teilt die Parameterzeilen in Bloecke von chunk_size Zeilen.
+
+        Args:
+            rows: Parameterzeilen
+
+        Returns:
+            Iterator[List[List[Any]]]: Bloecke von Parameterzeilen
+        """
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def process_chunk(self, chunk: List[List[Any]]) -> List[Optional[List[Any]]]:
+        """
+        Berechnet einen Block von Parameterzeilen ueber exec_batch.
+
+        Fehlende Spalten werden als leere Felder ergaenzt und machen nur ihre
+        Zeile ungueltig. Bricht exec_batch fuer den Block ab, wird jede Zeile
+        einzeln berechnet.
+
+        Args:
+            chunk: Parameterzeilen des Blocks
+
+        Returns:
+            List[Optional[List[Any]]]: Ergebniswerte je Zeile, None fuer ungueltige Zeilen;
+                mehrzeilige Ergebnisse bleiben Objekte mit iter_rows()
+        """
+        param_count = len(self.command.param_names)
+        if self.param_indices is not None:
+            # Gewaehlte Spalten, fehlende Werte als leere Felder
+            padded = [[row[i] if i < len(row) else "" for i in self.param_indices] for row in chunk]
+        else:
+            padded = [(list(row) + [""] * param_count)[:param_count] for row in chunk]
+        columns = [list(column) for column in zip(*padded)]
+
+        try:
+            result = self.plugin.exec_batch(self.command.name, columns)
+        except (TypeError, ValueError, ArithmeticError):
+            if len(chunk) == 1:
+                return [None]
+            # Ein fehlerhafter Wert darf nicht den ganzen Block verwerfen: Zeilen einzeln berechnen
+            return [values for row in chunk for values in self.process_chunk([row])]
+
+        if isinstance(result, tuple):
+            # Tupel von Ergebnisspalten
+            result_rows = zip(*[_to_list(column) for column in result])
+        else:
+            result_rows = _to_list(result)
+
+        return [_flatten(value) for value in result_rows]
+
+
+def _to_list(column: Any) -> List[Any]:
+    """Wandelt eine Ergebnisspalte (Liste oder NumPy-Array) in eine Liste um."""
+    return column.tolist() if hasattr(column, "tolist") else list(column)
+
+
+def _flatten(value: Any) -> Optional[List[Any]]:
+    """
+    Wandelt einen Ergebniswert in Ausgabespalten um.
+
+    Returns:
+        Optional[List[Any]]: Spaltenwerte, None fuer ungueltige Zeilen oder
+            das Ergebnis selbst, wenn es mehrere Zeilen liefert (iter_rows)
+    """
+    if value is None or hasattr(value, "iter_rows"):
+        # Mehrzeilige Ergebnisse werden erst beim Schreiben zeilenweise erzeugt
+        return value
+    if isinstance(value, dict):
+        value = list(value.values())
+    elif not isinstance(value, (tuple, list)):
+        value = [value]
+
+    value = list(value)
+    if all(isinstance(v, float) and math.isnan(v) for v in value):
+        return None
+    return value
@@ -1,12 +1,14 @@
 from datetime import datetime
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 class CalculationLog:
     def __init__(self):
         self.calculations: List[Tuple[str, str]] = []
+        # Ergebnisobjekte mit seitenweiser Anzeige, nach Eintragsindex
+        self.details: Dict[int, Any] = {}
         self.last_date_stamp = None
     
-    def add_calculation(self, calculation: str, result: str) -> None:
+    def add_calculation(self, calculation: str, result: str, details: Optional[Any] = None) -> None:
         current_date = datetime.now().date()
         
         if self.last_date_stamp is None or current_date != self.last_date_stamp:
@@ -14,13 +16,19 @@ class CalculationLog:
             date_stamp = current_date.strftime("%d.%m.%Y")
             self.calculations.append((date_stamp, ""))
         
+        if details is not None:
+            self.details[len(self.calculations)] = details
         self.calculations.append((calculation, result))
     
     def get_calculations(self) -> List[Tuple[str, str]]:
         return self.calculations
     
+    def get_details(self, index: int) -> Optional[Any]:
+        return self.details.get(index)
+    
     def clear(self) -> None:
         self.calculations = []
+        self.details = {}
         self.last_date_stamp = None
     
     def save_to_file(self, filename: str) -> bool:
@@ -0,0 +1,197 @@
+# core/expression_engine.py
+
+from functools import lru_cache
+from typing import Any, Tuple
+import re
+
+# Erlaubte Zeichen eines normalisierten Ausdrucks
+_ALLOWED_CHARS = frozenset("0123456789.+-*/()eE")
+
+# Zahlen (inkl. Exponentenschreibweise) oder einzelne Operatorzeichen
+_TOKEN_PATTERN = re.compile(r"(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|([-+*/()])")
+
+# Opcodes des Postfix-Programms
+_OP_ADD, _OP_SUB, _OP_MUL, _OP_DIV, _OP_NEG = range(5)
+
+_BINARY_OPS = {"+": _OP_ADD, "-": _OP_SUB, "*": _OP_MUL, "/": _OP_DIV}
+_PRECEDENCE = {_OP_ADD: 1, _OP_SUB: 1, _OP_MUL: 2, _OP_DIV: 2, _OP_NEG: 3}
+_LPAREN = -1
+
+
+@lru_cache(maxsize=1024)
+def _compile_expression(expression: str) -> Tuple[Any, ...]:
+    """
+    Uebersetzt einen normalisierten Ausdruck in ein Postfix-Programm.
+    
+    Tokenizer und Operator-Praezedenz-Parser (Shunting-Yard) arbeiten in
+    einem einzigen Durchlauf ohne Rekursion, die Laufzeit ist daher linear
+    in der Laenge des Ausdrucks - auch bei tief verschachtelten Klammern.
+    
+    Args:
+        expression: Der normalisierte Ausdruck (ohne Leerzeichen)
+
+    Returns:
+        Tuple[Any, ...]: Postfix-Programm aus Zahlen (float) und Opcodes (int)
+    
+    Raises:
+        ValueError: Wenn der Ausdruck syntaktisch ungueltig ist
+    """
+    program = []
+    operators = []
+    expect_operand = True
+    pos = 0
+    
+    for match in _TOKEN_PATTERN.finditer(expression):
+        if match.start() != pos:
+            raise ValueError(f"Ungueltiger Wert: {expression[pos:match.start()]}")
+        pos = match.end()
+        
+        number, symbol = match.groups()
+        
+        if number is not None:
+            if not expect_operand:
+                raise ValueError(f"Operator erwartet vor: {number}")
+            program.append(float(number))
+            expect_operand = False
+            
+        elif symbol == "(":
+            if not expect_operand:
+                raise ValueError("Operator erwartet vor '('")
+            operators.append(_LPAREN)
+            
+        elif symbol == ")":
+            if expect_operand:
+                raise ValueError("Operand erwartet vor ')'")
+            while operators and operators[-1] != _LPAREN:
+                program.append(operators.pop())
+            if not operators:
+                raise ValueError("Unbalancierte Klammern")
+            operators.pop()
+            
+        elif expect_operand:
+            # Vorzeichen
+            if symbol == "-":
+                operators.append(_OP_NEG)
+            elif symbol != "+":
+                raise ValueError(f"Operand erwartet vor '{symbol}'")
+                
+        else:
+            # Binaerer Operator, linksassoziativ
+            op = _BINARY_OPS[symbol]
+            precedence = _PRECEDENCE[op]
+            while operators and operators[-1] != _LPAREN and _PRECEDENCE[operators[-1]] >= precedence:
+                program.append(operators.pop())
+            operators.append(op)
+            expect_operand = True
+    
+    if pos != len(expression):
+        raise ValueError(f"Ungueltiger Wert: {expression[pos:]}")
+    
+    if expect_operand:
+        raise ValueError("Unvollstaendiger Ausdruck")
+    
+    while operators:
+        op = operators.pop()
+        if op == _LPAREN:
+            raise ValueError("Unbalancierte Klammern")
+        program.append(op)
+    
+    return tuple(program)
+
+
+def _run_program(program: Tuple[Any, ...]) -> float:
+    """
+    Wertet ein mit _compile_expression erzeugtes Postfix-Programm aus.
+    
+    Args:
+        program: Das Postfix-Programm
+
+    Returns:
+        float: Das Ergebnis der Auswertung
+    
+    Raises:
+        ValueError: Bei Division durch Null
+    """
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    
+    for item in program:
+        if item.__class__ is float:
+            push(item)
+        elif item == _OP_NEG:
+            stack[-1] = -stack[-1]
+        else:
+            right = pop()
+            if item == _OP_ADD:
+                stack[-1] += right
+            elif item == _OP_SUB:
+                stack[-1] -= right
+            elif item == _OP_MUL:
+                stack[-1] *= right
+            else:
+                if right == 0:
+                    raise ValueError("Division durch Null")
+                stack[-1] /= right
+    
+    return stack[0]
+
+
+def normalize_expression(expression: str) -> str:
+    """
+    Bringt einen Ausdruck in die Normalform der Engine.
+    
+    Anzeigeoperatoren (x, :) werden durch *, / ersetzt, Dezimalkommas durch
+    Punkte, und alle Leerzeichen werden entfernt.
+    
+    Args:
+        expression: Der eingegebene Ausdruck
+
+    Returns:
+        str: Der normalisierte Ausdruck
+    """
+    expression = expression.replace("x", "*").replace(":", "/").replace(",", ".")
+    return "".join(expression.split())
+
+
+def evaluate_expression(expression: str) -> float:
+    """
+    Wertet einen mathematischen Ausdruck aus.
+    
+    Der Ausdruck wird normalisiert, einmalig in ein Postfix-Programm
+    uebersetzt (mit gemeinsamem LRU-Cache fuer Grundrechner und
+    Nebenrechner) und anschliessend ausgewertet.
+    
+    Args:
+        expression: Der auszuwertende Ausdruck
+
+    Returns:
+        float: Das Ergebnis der Auswertung
+    
+    Raises:
+        ValueError: Wenn der Ausdruck ungueltig ist
+    """
+    expression = normalize_expression(expression)
+    
+    # Pruefen, ob nur erlaubte Zeichen verwendet werden
+    if not _ALLOWED_CHARS.issuperset(expression):
+        raise ValueError("Ungueltiger Ausdruck: Nur Ziffern und Operatoren (+, -, *, /, (, )) sind erlaubt")
+    
+    # Pruefen auf leeren Ausdruck
+    if not expression:
+        return 0
+    
+    try:
+        return _run_program(_compile_expression(expression))
+    except Exception as e:
+        raise ValueError(f"Fehler bei der Berechnung: {str(e)}")
+
+
+def cache_info():
+    """
+    Gibt die Statistik des Programm-Caches zurueck.
+    
+    Returns:
+        CacheInfo: Treffer, Fehlzugriffe und Groesse des LRU-Caches
+    """
+    return _compile_expression.cache_info()
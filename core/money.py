@@ -0,0 +1,324 @@
+# core/money.py
+
+from decimal import Decimal, InvalidOperation, ROUND_HALF_EVEN, ROUND_HALF_UP, getcontext, localcontext
+from fractions import Fraction
+from functools import partial
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy ist optional, ohne NumPy wird zeilenweise gerechnet
+    np = None
+
+# Rechenarten fuer Geldbetraege
+MONEY_MODES = {
+    "float": "Gleitkomma (schnell)",
+    "decimal": "Dezimal (exakt)",
+    "cents": "Ganzzahlige Cent (exakt)",
+}
+
+# Rundungsregeln fuer halbe Cent
+ROUNDING_MODES = {
+    "kaufmaennisch": ROUND_HALF_UP,
+    "bankers": ROUND_HALF_EVEN,
+}
+
+_CENT = Decimal("0.01")
+
+# Gueltige Stellen fuer Zwischenergebnisse (Zinsfaktoren) in der Rechenart decimal
+DECIMAL_PRECISION = 34
+
+def round_div(numerator: int, denominator: int, rounding: str = "kaufmaennisch") -> int:
+    """
+    Ganzzahlige Division mit Rundung auf die naechste ganze Zahl.
+
+    Args:
+        numerator: Zaehler
+        denominator: Nenner (ungleich 0)
+        rounding: "kaufmaennisch" (halbe Werte von der Null weg) oder "bankers" (zur geraden Zahl)
+
+    Returns:
+        int: Der gerundete Quotient
+    """
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+
+    if rounding == "kaufmaennisch":
+        # Halbe Werte von der Null weg, ohne Fallunterscheidung nach dem Rest
+        if numerator >= 0:
+            return (2 * numerator + denominator) // (2 * denominator)
+        return -((denominator - 2 * numerator) // (2 * denominator))
+
+    q, r = divmod(numerator, denominator)
+    twice = 2 * r
+    if twice > denominator:
+        return q + 1
+    if twice < denominator:
+        return q
+    # Genau ein halber Wert
+    if rounding == "bankers":
+        return q + (q & 1)
+    return q + 1 if q >= 0 else q
+
+
+def round_div_column(numerator: Any, denominator: Any, rounding: str = "kaufmaennisch") -> Any:
+    """
+    Wie round_div, aber fuer ganze Spalten (NumPy-Arrays vom Typ int64 oder object).
+
+    Args:
+        numerator: Zaehler
+        denominator: Nenner (ungleich 0)
+        rounding: "kaufmaennisch" oder "bankers"
+
+    Returns:
+        Any: Die gerundeten Quotienten als Array vom Typ der Eingabe
+    """
+    sign = np.where(denominator < 0, -1, 1)
+    numerator = numerator * sign
+    denominator = denominator * sign
+
+    # // und % statt np.divmod, das fuer dtype=object nicht definiert ist
+    q, r = numerator // denominator, numerator % denominator
+    twice = 2 * r
+    if rounding == "bankers":
+        tie_up = (q & 1) == 1
+    else:
+        tie_up = q >= 0
+    return q + ((twice > denominator) | ((twice == denominator) & tie_up))
+
+
+def _fits_int64(rows: Sequence[Tuple[Optional[int], Optional[int], Optional[int]]]) -> bool:
+    """
+    Prueft, ob die Cent-Formeln fuer alle Zeilen in int64 ohne Ueberlauf rechnen.
+
+    Die Formeln bilden Produkte wie cents * zaehler und cents * 100 * nenner;
+    round_div_column verdoppelt zusaetzlich den Rest. Die Schranke
+    4 * (|cents| + 1) * (|zaehler| + 100 * nenner) deckt all diese Werte ab.
+    """
+    grenze = 2 ** 63
+    for cents, zaehler, nenner in rows:
+        if cents is not None and 4 * (abs(cents) + 1) * (abs(zaehler) + 100 * nenner) >= grenze:
+            return False
+    return True
+
+
+class MoneyContext:
+    """
+    Rechenart fuer Geldbetraege in Kredit- und Prozentrechnung.
+
+    - "float": binaere Gleitkommazahlen wie bisher (schnell, ohne Rundung
+      von Zwischenergebnissen)
+    - "decimal": decimal.Decimal, jedes Ergebnis wird auf Cent gerundet
+    - "cents": Betraege als ganze Cent, Prozentsaetze als exakte Brueche;
+      Ergebnisse werden als Gleitkommazahl mit genau zwei Nachkommastellen
+      ausgegeben
+    """
+
+    def __init__(self, mode: str = "float", rounding: str = "kaufmaennisch"):
+        """
+        Initialisiert eine neue Rechenart.
+
+        Args:
+            mode: "float", "decimal" oder "cents"
+            rounding: "kaufmaennisch" oder "bankers"
+
+        Raises:
+            ValueError: Bei unbekannter Rechenart oder Rundungsregel
+        """
+        if mode not in MONEY_MODES:
+            raise ValueError(f"Unbekannte Rechenart: {mode} (verfuegbar: {', '.join(MONEY_MODES)})")
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Unbekannte Rundungsregel: {rounding} (verfuegbar: {', '.join(ROUNDING_MODES)})")
+        self.mode = mode
+        self.rounding = rounding
+
+    @property
+    def exact(self) -> bool:
+        """True fuer die exakten Rechenarten decimal und cents."""
+        return self.mode != "float"
+
+    def local(self) -> Any:
+        """
+        Decimal-Kontext fuer Zwischenergebnisse (Genauigkeit und Rundungsregel).
+
+        Returns:
+            Any: Kontextmanager fuer eine with-Anweisung
+        """
+        context = getcontext().copy()
+        context.prec = DECIMAL_PRECISION
+        context.rounding = ROUNDING_MODES[self.rounding]
+        return localcontext(context)
+
+    def _decimal(self, value: Any) -> Decimal:
+        """Wandelt eine Eingabe ueber ihre Textdarstellung exakt in Decimal um."""
+        try:
+            return Decimal(str(value).strip().replace(',', '.'))
+        except InvalidOperation:
+            raise ValueError(f"Ungueltige Zahl: {value}")
+
+    def amount(self, value: Any) -> Any:
+        """
+        Wandelt eine Eingabe in einen Geldbetrag der Rechenart um.
+
+        Returns:
+            Any: float, Decimal (auf Cent gerundet) oder int (Cent)
+        """
+        if self.mode == "float":
+            return float(value)
+        betrag = self._decimal(value).quantize(_CENT, rounding=ROUNDING_MODES[self.rounding])
+        if self.mode == "decimal":
+            return betrag
+        return int(betrag.scaleb(2))
+
+    def number(self, value: Any) -> Any:
+        """
+        Wandelt eine Eingabe in eine Zahl fuer Zinsfaktoren und Potenzen um.
+
+        Returns:
+            Any: Decimal in der Rechenart decimal, sonst float
+        """
+        if self.mode == "decimal":
+            return self._decimal(value)
+        return float(value)
+
+    def percent(self, value: Any) -> Any:
+        """
+        Wandelt einen Prozentsatz fuer exakte Anteilsrechnung um.
+
+        Returns:
+            Any: float, Decimal oder Fraction (Rechenart cents)
+        """
+        if self.mode == "cents":
+            return Fraction(self._decimal(value))
+        return self.number(value)
+
+    def fraction(self, amount: Any, numerator: Any, denominator: Any) -> Any:
+        """
+        Berechnet amount * numerator / denominator als Geldbetrag.
+
+        In den exakten Rechenarten wird das Ergebnis mit der gewaehlten
+        Regel auf Cent gerundet, bei "float" wird nicht gerundet.
+
+        Args:
+            amount: Geldbetrag der Rechenart
+            numerator: Zaehler (Zahl, Prozentsatz oder Faktor)
+            denominator: Nenner (ungleich 0)
+
+        Returns:
+            Any: Der Geldbetrag in der Rechenart
+        """
+        if self.mode == "float":
+            return amount * numerator / denominator
+        if self.mode == "decimal":
+            return (amount * numerator / denominator).quantize(_CENT, rounding=ROUNDING_MODES[self.rounding])
+        faktor = Fraction(numerator) / Fraction(denominator)
+        return round_div(amount * faktor.numerator, faktor.denominator, self.rounding)
+
+    def round(self, amount: Any) -> Any:
+        """Rundet einen Geldbetrag auf Cent (bei "float" mit round(x, 2) wie bisher)."""
+        if self.mode == "float":
+            return round(amount, 2)
+        return amount
+
+    def output(self, amount: Any) -> Any:
+        """
+        Wandelt einen Geldbetrag der Rechenart in den Ergebniswert um.
+
+        Returns:
+            Any: float bzw. Decimal; Cent werden zu einer Gleitkommazahl in Euro
+        """
+        if self.mode == "cents":
+            return amount / 100
+        return amount
+
+    def cents_apply(self, func: Callable[..., Any], amounts: Sequence[Any], percents: Sequence[Any],
+                    invalid: Optional[Callable[..., Any]] = None, outputs: int = 1) -> Any:
+        """
+        Wendet eine Geldformel auf Spalten von Betraegen und Prozentsaetzen in ganzen Cent an.
+
+        func(div, cents, zaehler, nenner) erhaelt die Betraege in Cent, die
+        Prozentsaetze exakt als Bruch zaehler/nenner Prozent und eine Funktion
+        div(zaehler, nenner) fuer die gerundete Ganzzahldivision. Betraege
+        werden wie in amount() exakt ueber ihren Text auf Cent gerundet,
+        leere oder ungueltige Zellen machen nur ihre Zeile ungueltig. Mit NumPy
+        wird func einmal mit int64-Arrays aufgerufen, sonst einmal pro Zeile
+        mit Python-Ganzzahlen. Koennten Zwischenprodukte den int64-Bereich
+        verlassen, rechnet NumPy mit Python-Ganzzahlen (dtype=object).
+
+        Args:
+            func: Die Formel, liefert Cent (bzw. ein Tupel mit outputs Werten)
+            amounts: Spalte der Euro-Betraege
+            percents: Spalte der Prozentsaetze
+            invalid: Optionale Bedingung invalid(cents, zaehler, nenner) fuer ungueltige Zeilen
+            outputs: Anzahl der Ergebniswerte, die func pro Zeile liefert
+
+        Returns:
+            Any: Ergebnisspalte bzw. Tupel von Ergebnisspalten in Euro (genau zwei
+                Nachkommastellen); ungueltige Zeilen sind NaN
+        """
+        # Jede Zelle exakt ueber ihren Text umwandeln und wie amount() auf Cent runden
+        rows = [self._cents_row(betrag, satz) for betrag, satz in zip(amounts, percents)]
+
+        if np is not None:
+            unparsed = np.fromiter((cents is None for cents, _, _ in rows), dtype=bool, count=len(rows))
+            # int64 nur, wenn kein Zwischenprodukt ueberlaufen kann, sonst Python-Ganzzahlen
+            dtype = np.int64 if _fits_int64(rows) else object
+            cents = np.array([cents or 0 for cents, _, _ in rows], dtype=dtype)
+            zaehler = np.array([zaehler or 0 for _, zaehler, _ in rows], dtype=dtype)
+            nenner = np.array([nenner or 1 for _, _, nenner in rows], dtype=dtype)
+            mask = unparsed | invalid(cents, zaehler, nenner) if invalid is not None else unparsed
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result = func(lambda n, d: round_div_column(n, np.where(mask, 1, d), self.rounding),
+                              cents, zaehler, nenner)
+            if outputs > 1:
+                return tuple(np.where(mask, np.nan, column / 100).astype(float) for column in result)
+            return np.where(mask, np.nan, result / 100).astype(float)
+
+        div = partial(round_div, rounding=self.rounding)
+        nan_result = float("nan") if outputs == 1 else (float("nan"),) * outputs
+        results = []
+        for cents, zaehler, nenner in rows:
+            if cents is None or (invalid is not None and invalid(cents, zaehler, nenner)):
+                results.append(nan_result)
+            elif outputs > 1:
+                results.append(tuple(value / 100 for value in func(div, cents, zaehler, nenner)))
+            else:
+                results.append(func(div, cents, zaehler, nenner) / 100)
+
+        if outputs > 1:
+            return tuple(list(column) for column in zip(*results)) if results else tuple([] for _ in range(outputs))
+        return results
+
+    def _cents_row(self, betrag: Any, satz: Any) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """
+        Wandelt eine Zeile in (Cent, Zaehler, Nenner des Prozentsatzes) um.
+
+        Wie amount() und percent() ueber die Textdarstellung: Betraege mit der
+        gewaehlten Rundungsregel auf Cent, Prozentsaetze ungerundet als Bruch,
+        damit Batch und exec auch bei halben Cent (z.B. 1.005) und beliebig
+        vielen Nachkommastellen im Satz dasselbe Ergebnis liefern.
+
+        Returns:
+            Tuple: (None, None, None) bei leeren oder ungueltigen Werten
+        """
+        try:
+            cents = self._decimal(betrag).quantize(_CENT, rounding=ROUNDING_MODES[self.rounding]).scaleb(2)
+            prozent = Fraction(self._decimal(satz))
+            return int(cents), prozent.numerator, prozent.denominator
+        except (ValueError, ArithmeticError):
+            return None, None, None
+
+
+# Aktuelle Rechenart (ueber die Oberflaeche oder die Kommandozeile waehlbar)
+_current = MoneyContext()
+
+
+def get_money_context() -> MoneyContext:
+    """Gibt die aktuelle Rechenart fuer Geldbetraege zurueck."""
+    return _current
+
+
+def set_money_context(context: MoneyContext) -> None:
+    """Setzt die Rechenart fuer Geldbetraege."""
+    global _current
+    _current = context
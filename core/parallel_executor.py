@@ -0,0 +1,113 @@
+# core/parallel_executor.py
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from core.batch_runner import BatchRunner
+from core.money import MoneyContext, get_money_context, set_money_context
+from core.plugin_manager import PluginManager
+
+# Batch-Lauf des aktuellen Worker-Prozesses (einmal pro Prozess erzeugt)
+_worker_runner: Optional[BatchRunner] = None
+
+
+def _init_worker(plugin_dir: str, plugin_name: str, command_name: str, money: MoneyContext,
+                 param_indices: Optional[List[int]]) -> None:
+    """Laedt die Plugins einmalig beim Start eines Worker-Prozesses."""
+    global _worker_runner
+    # Rechenart fuer Geldbetraege aus dem Hauptprozess uebernehmen
+    set_money_context(money)
+    plugin_manager = PluginManager(plugin_dir)
+    plugin_manager.load_plugins([plugin_name])
+    plugin = plugin_manager.get_plugin(plugin_name)
+    if plugin is None:
+        raise ValueError(f"Modul {plugin_name} nicht gefunden.")
+    _worker_runner = BatchRunner(plugin, command_name)
+    _worker_runner.param_indices = param_indices
+
+
+def _process_chunk(chunk: List[List[Any]]) -> List[Optional[List[Any]]]:
+    """Berechnet einen Block im Worker-Prozess."""
+    return _worker_runner.process_chunk(chunk)
+
+
+def available_cores() -> int:
+    """
+    Gibt die Anzahl der fuer diesen Prozess nutzbaren CPU-Kerne zurueck.
+
+    Returns:
+        int: Anzahl der Kerne (mindestens 1)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+class ParallelBatchExecutor:
+    """Verteilt Bloecke eines Batch-Laufs auf mehrere Prozesse."""
+
+    def __init__(self, plugin_dir: str, plugin_name: str, command_name: str,
+                 workers: Optional[int] = None, ordered: bool = True,
+                 param_indices: Optional[List[int]] = None):
+        """
+        Initialisiert einen neuen parallelen Batch-Lauf.
+
+        Args:
+            plugin_dir: Verzeichnis der Plugins
+            plugin_name: Name des Moduls, z.B. "credit"
+            command_name: Name des auszufuehrenden Befehls
+            workers: Anzahl der Prozesse (Standard: alle verfuegbaren Kerne)
+            ordered: True, wenn Ergebnisse in Eingabereihenfolge geliefert werden sollen
+            param_indices: Spaltenauswahl des BatchRunner (siehe BatchRunner.select_columns)
+        """
+        self.plugin_dir = plugin_dir
+        self.plugin_name = plugin_name
+        self.command_name = command_name
+        self.workers = workers or available_cores()
+        self.ordered = ordered
+        self.param_indices = param_indices
+
+    def map_chunks(self, chunks: Iterable[List[List[Any]]]) -> Iterator[Tuple[List[List[Any]], List[Optional[List[Any]]]]]:
+        """
+        Berechnet Bloecke parallel und liefert sie als (Block, Ergebnisse).
+
+        Es sind hoechstens zwei Bloecke pro Worker gleichzeitig unterwegs,
+        damit der Speicherbedarf auch bei sehr grossen Eingaben konstant bleibt.
+
+        Args:
+            chunks: Bloecke von Parameterzeilen
+
+        Returns:
+            Iterator: Paare aus Block und Ergebnissen, geordnet oder in Fertigstellungsreihenfolge
+        """
+        max_pending = 2 * self.workers
+        chunks = iter(chunks)
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.plugin_dir, self.plugin_name, self.command_name, get_money_context(), self.param_indices)
+        ) as pool:
+            pending = deque()
+
+            for chunk in chunks:
+                pending.append((chunk, pool.submit(_process_chunk, chunk)))
+                if len(pending) >= max_pending:
+                    yield from self._drain(pending, max_pending - 1)
+
+            yield from self._drain(pending, 0)
+
+    def _drain(self, pending: deque, keep: int):
+        """Liefert fertige Bloecke, bis nur noch keep Bloecke ausstehen."""
+        while len(pending) > keep:
+            if self.ordered:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+                continue
+
+            done, _ = wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+            for entry in [entry for entry in pending if entry[1] in done]:
+                pending.remove(entry)
+                yield entry[0], entry[1].result()
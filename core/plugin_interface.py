@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Callable, Optional, Sequence, Tuple
 
 class Command:
     
-    def __init__(self, name: str, param_names: List[str]):
+    def __init__(self, name: str, param_names: List[str], cacheable: bool = False):
         self.name = name
         self.param_names = param_names
+        # Reine Funktion der Parameter: Ergebnisse duerfen im Ergebnis-Cache landen
+        self.cacheable = cacheable
 
 class PluginInfo:
     
@@ -13,6 +15,44 @@ class PluginInfo:
         self.name = name
         self.commands = commands
 
+class CalculationResult:
+    """
+    Ergebnis eines Plugin-Befehls.
+    
+    Enthaelt den Rohwert sowie eine Funktion, die den Anzeigetext erst beim
+    ersten Zugriff erzeugt. Fuer bestehende Aufrufer verhaelt sich das Objekt
+    wie das Tupel (Text, Wert).
+    """
+    
+    __slots__ = ("value", "_render", "_text")
+    
+    def __init__(self, value: Any, render: Callable[[], str]):
+        self.value = value
+        self._render = render
+        self._text: Optional[str] = None
+    
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self._render()
+            self._render = None
+        return self._text
+    
+    def __iter__(self):
+        yield self.text
+        yield self.value
+    
+    def __getitem__(self, index: int) -> Any:
+        if index in (1, -1):
+            return self.value
+        return (self.text, self.value)[index]
+    
+    def __len__(self) -> int:
+        return 2
+    
+    def __str__(self) -> str:
+        return self.text
+
 class IPlugin(ABC):
     
     @abstractmethod
@@ -24,5 +64,29 @@ class IPlugin(ABC):
         pass
     
     @abstractmethod
-    def exec(self, command_name: str, params: List[float]) -> Tuple[str, Any]:
-        pass
\ No newline at end of file
+    def exec(self, command_name: str, params: List[float]) -> CalculationResult:
+        pass
+    
+    def exec_batch(self, command_name: str, columns: List[Sequence[Any]]) -> Any:
+        """
+        Fuehrt einen Befehl fuer viele Parametersaetze auf einmal aus.
+        
+        columns enthaelt pro Parameter eine Spalte (Liste oder NumPy-Array).
+        Die Standardimplementierung ruft exec zeilenweise auf; Plugins
+        koennen sie mit vektorisierten Varianten ueberschreiben.
+        
+        Returns:
+            Any: Ergebniswerte in Zeilenreihenfolge (vektorisierte Varianten
+                 liefern eine Spalte bzw. ein Tupel von Spalten); Zeilen, fuer
+                 die exec einen ValueError ausloest, sind None bzw. NaN
+        """
+        if not any(command.name == command_name for command in self.get_info().commands):
+            raise ValueError(f"Unbekannter Befehl: {command_name}")
+        
+        results = []
+        for row in zip(*columns):
+            try:
+                results.append(self.exec(command_name, list(row)).value)
+            except ValueError:
+                results.append(None)
+        return results
@@ -1,15 +1,18 @@
 import os
 import importlib.util
-from typing import Dict, List, Optional
-from core.plugin_interface import IPlugin, PluginInfo
+from typing import Any, Dict, List, Optional
+from core.money import get_money_context
+from core.plugin_interface import CalculationResult, IPlugin, PluginInfo
+from core.result_cache import ResultCache
 
 class PluginManager:
-    def __init__(self, plugin_dir: str = "plugins"):
+    def __init__(self, plugin_dir: str = "plugins", cache: Optional[ResultCache] = None):
         self.plugin_dir = plugin_dir
         self.plugins: Dict[str, IPlugin] = {}
         self.plugin_infos: Dict[str, PluginInfo] = {}
+        self.cache = cache if cache is not None else ResultCache()
     
-    def load_plugins(self) -> None:
+    def load_plugins(self, plugin_names: Optional[List[str]] = None) -> None:
         from plugins.basic.basic_calc import BasicCalculator
         basic_calc = BasicCalculator()
         basic_calc.load()
@@ -17,6 +20,8 @@ class PluginManager:
         self.plugin_infos["basic"] = basic_calc.get_info()
         
         available_plugins = ["credit", "geometry", "math_functions", "percentage"]
+        if plugin_names is not None:
+            available_plugins = [name for name in available_plugins if name in plugin_names]
         loaded_count = 0
         
         for plugin_name in available_plugins:
@@ -60,4 +65,28 @@ class PluginManager:
         return list(self.plugin_infos.values())
     
     def get_plugin(self, plugin_name: str) -> Optional[IPlugin]:
-        return self.plugins.get(plugin_name)
\ No newline at end of file
+        return self.plugins.get(plugin_name)
+    
+    def execute(self, plugin_name: str, command_name: str, params: List[Any]) -> CalculationResult:
+        plugin = self.plugins.get(plugin_name)
+        if plugin is None:
+            raise ValueError(f"Unbekanntes Modul: {plugin_name}")
+        
+        command = next((c for c in self.plugin_infos[plugin_name].commands if c.name == command_name), None)
+        if command is None or not command.cacheable:
+            return plugin.exec(command_name, params)
+        
+        # Typ gehoert zum Schluessel (10 und 10.0 werden unterschiedlich angezeigt),
+        # die Rechenart fuer Geldbetraege ebenso
+        money = get_money_context()
+        key = (plugin_name, command_name, tuple((type(p), p) for p in params), money.mode, money.rounding)
+        try:
+            result = self.cache.get(key)
+        except TypeError:
+            # Nicht hashbare Parameter werden nicht zwischengespeichert
+            return plugin.exec(command_name, params)
+        
+        if result is None:
+            result = plugin.exec(command_name, params)
+            self.cache.put(key, result)
+        return result
\ No newline at end of file
@@ -0,0 +1,152 @@
+# core/result_cache.py
+
+import sys
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, Hashable, Optional
+
+# Standardgrenzen des Ergebnis-Caches
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Ab dieser Laenge wird die Groesse einer Sammlung aus einer Stichprobe hochgerechnet
+_SAMPLE_SIZE = 64
+
+# Maximale Verschachtelungstiefe bei der Groessenschaetzung
+_MAX_DEPTH = 4
+
+
+def approximate_size(value: Any, _depth: int = 0) -> int:
+    """
+    Schaetzt den Speicherbedarf eines Ergebniswerts in Bytes.
+
+    Sammlungen werden rekursiv durchlaufen, lange Sammlungen nur anhand
+    der ersten Elemente hochgerechnet; NumPy-Arrays zaehlen mit nbytes,
+    andere Objekte mit ihren Attributen.
+
+    Args:
+        value: Der Ergebniswert
+
+    Returns:
+        int: Geschaetzte Groesse in Bytes
+    """
+    groesse = sys.getsizeof(value, 64)
+    if _depth >= _MAX_DEPTH or isinstance(value, (str, bytes, bytearray, int, float, complex, bool)):
+        return groesse
+
+    if hasattr(value, "nbytes"):
+        return groesse + int(value.nbytes)
+
+    if isinstance(value, dict):
+        elemente = [element for eintrag in value.items() for element in eintrag]
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        elemente = list(islice(value, _SAMPLE_SIZE))
+    elif hasattr(value, "__dict__"):
+        elemente = list(vars(value).values())
+    elif hasattr(value, "__slots__"):
+        elemente = [getattr(value, name) for name in value.__slots__ if hasattr(value, name)]
+    else:
+        return groesse
+
+    if not elemente:
+        return groesse
+    summe = sum(approximate_size(element, _depth + 1) for element in elemente)
+    if isinstance(value, (list, tuple, set, frozenset)) and len(value) > _SAMPLE_SIZE:
+        summe = summe * len(value) // _SAMPLE_SIZE
+    return groesse + summe
+
+
+class ResultCache:
+    """
+    LRU-Cache fuer Ergebnisse deterministischer Plugin-Befehle.
+
+    Begrenzt durch die Anzahl der Eintraege und ihre geschaetzte Groesse;
+    bei Ueberschreitung werden die am laengsten nicht genutzten Eintraege
+    verdraengt. Treffer, Fehlschlaege und Verdraengungen werden gezaehlt.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialisiert einen leeren Cache.
+
+        Args:
+            max_entries: Hoechstzahl der Eintraege
+            max_bytes: Hoechste geschaetzte Gesamtgroesse in Bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Gibt ein gespeichertes Ergebnis zurueck und markiert es als zuletzt genutzt.
+
+        Args:
+            key: Schluessel des Ergebnisses
+
+        Returns:
+            Optional[Any]: Das Ergebnis oder None bei einem Fehlschlag
+        """
+        eintrag = self._entries.get(key)
+        if eintrag is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return eintrag[0]
+
+    def put(self, key: Hashable, result: Any, size: Optional[int] = None) -> bool:
+        """
+        Speichert ein Ergebnis und verdraengt bei Bedarf alte Eintraege.
+
+        Args:
+            key: Schluessel des Ergebnisses
+            result: Das Ergebnis
+            size: Groesse in Bytes (Standard: Schaetzung mit approximate_size)
+
+        Returns:
+            bool: False, wenn das Ergebnis allein schon zu gross fuer den Cache ist
+        """
+        if size is None:
+            size = approximate_size(result)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return False
+
+        alt = self._entries.pop(key, None)
+        if alt is not None:
+            self.bytes -= alt[1]
+        self._entries[key] = (result, size)
+        self.bytes += size
+
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            _, (_, verdraengt) = self._entries.popitem(last=False)
+            self.bytes -= verdraengt
+            self.evictions += 1
+        return True
+
+    def clear(self) -> None:
+        """Leert den Cache (die Zaehler bleiben erhalten)."""
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Gibt die Kennzahlen des Caches zurueck.
+
+        Returns:
+            Dict[str, int]: eintraege, bytes, treffer, fehlschlaege und verdraengungen
+        """
+        return {
+            "eintraege": len(self._entries),
+            "bytes": self.bytes,
+            "treffer": self.hits,
+            "fehlschlaege": self.misses,
+            "verdraengungen": self.evictions,
+        }
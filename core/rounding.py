@@ -0,0 +1,148 @@
+# core/rounding.py
+
+import math
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # NumPy ist optional, ohne NumPy wird Wert fuer Wert gerundet
+    np = None
+
+# Standardanzahl signifikanter Stellen der Rechner
+SIGNIFICANT_DIGITS = 6
+
+# Bis zu diesem Exponenten ist 10.0 ** n exakt darstellbar
+_EXACT_POWER = 22
+
+# Relativer Fehler beim Skalieren, ab dem ein Wert als zu nah an einem halben Wert gilt
+_TIE_TOLERANCE = 1e-15
+
+# Modulweite Namen sparen in round_significant (pro Zeile aufgerufen) die Attributsuche
+_log10, _floor, _isfinite = math.log10, math.floor, math.isfinite
+
+
+def round_significant(value: Any, digits: int = SIGNIFICANT_DIGITS) -> Any:
+    """
+    Rundet einen Wert auf die angegebene Anzahl signifikanter Stellen.
+
+    Rundet ueber round(value, n) statt ueber einen Faktor 10 ** n: Das
+    Ergebnis ist korrekt gerundet, und sehr kleine Werte (bis zu
+    subnormalen Zahlen) laufen nicht mehr ueber. 0, NaN und Unendlich
+    werden unveraendert zurueckgegeben; wird ueber den groessten float-Wert
+    hinaus aufgerundet, ist das Ergebnis Unendlich.
+
+    Args:
+        value: Der zu rundende Wert
+        digits: Anzahl der signifikanten Stellen
+
+    Returns:
+        Any: Der gerundete Wert
+    """
+    if value == 0 or not _isfinite(value):
+        return value
+    try:
+        return round(value, digits - 1 - _floor(_log10(abs(value))))
+    except OverflowError:
+        # Aufgerundet ueber den groessten float-Wert hinaus (wie float("2e308"))
+        return math.copysign(math.inf, value)
+
+
+def _round_scalar(value: float, digits: int) -> float:
+    """round(value, digits); Unendlich statt OverflowError wie in round_significant."""
+    try:
+        return round(value, digits)
+    except OverflowError:
+        return math.copysign(math.inf, value)
+
+
+def round_array(values: Any, digits: Any = 0) -> Any:
+    """
+    Wie round(value, digits), aber fuer ganze Spalten.
+
+    Mit NumPy wird mit einer exakten Zehnerpotenz skaliert und gerundet.
+    Werte, die nach dem Skalieren nicht sicher auf einer Seite eines halben
+    Werts liegen (z.B. 13.205 auf zwei Stellen), sehr grosse Skalierungen
+    sowie Stellenzahlen ausserhalb der exakten Zehnerpotenzen werden
+    einzeln mit round() gerundet, damit das Ergebnis immer mit exec
+    uebereinstimmt.
+
+    Args:
+        values: Die zu rundenden Werte (Liste oder NumPy-Array)
+        digits: Anzahl der Nachkommastellen (Zahl oder Spalte)
+
+    Returns:
+        Any: Die gerundeten Werte (NumPy-Array bzw. Liste)
+    """
+    if np is None:
+        if isinstance(digits, int):
+            return [_round_scalar(value, digits) for value in values]
+        return [_round_scalar(value, int(stellen)) for value, stellen in zip(values, digits)]
+
+    values = np.asarray(values, dtype=float)
+    digits = np.broadcast_to(np.asarray(digits, dtype=float), values.shape)
+    regular = np.isfinite(values) & (values != 0)
+    exakt = regular & (np.abs(digits) <= _EXACT_POWER)
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        faktor = 10.0 ** np.where(exakt, np.abs(digits), 0)
+        skaliert = np.where(digits >= 0, values * faktor, values / faktor)
+        gerundet = np.round(skaliert)
+        result = np.where(regular, np.where(digits >= 0, gerundet / faktor, gerundet * faktor), values)
+
+        # Beim Skalieren entsteht ein Rundungsfehler: nahe an halben Werten einzeln runden
+        abstand = np.abs(np.abs(skaliert - np.floor(skaliert)) - 0.5)
+        unsicher = regular & ~(exakt & np.isfinite(skaliert) & (abstand > np.abs(skaliert) * _TIE_TOLERANCE))
+    flach, werte, stellen = result.reshape(-1), values.reshape(-1), digits.reshape(-1)
+    for i in np.flatnonzero(unsicher):
+        flach[i] = _round_scalar(float(werte[i]), int(stellen[i]))
+    return result
+
+
+def round_significant_array(values: Any, digits: int = SIGNIFICANT_DIGITS) -> Any:
+    """
+    Wie round_significant, aber fuer ganze Spalten.
+
+    Mit NumPy wird die Spalte ueber round_array in einem Durchlauf gerundet
+    und liefert dieselben Werte wie round_significant. Werte, deren
+    Zehnerlogarithmus fast ganzzahlig ist, werden einzeln gerundet, weil
+    die Stellenzahl dort von der Genauigkeit von log10 abhaengt. Ohne NumPy
+    wird jeder Wert einzeln gerundet.
+
+    Args:
+        values: Die zu rundenden Werte (Liste oder NumPy-Array)
+        digits: Anzahl der signifikanten Stellen
+
+    Returns:
+        Any: Die gerundeten Werte (NumPy-Array bzw. Liste)
+    """
+    if np is None:
+        return [round_significant(value, digits) for value in values]
+
+    values = np.asarray(values, dtype=float)
+    regular = np.isfinite(values) & (values != 0)
+    logarithmus = np.log10(np.abs(np.where(regular, values, 1.0)))
+    result = round_array(values, digits - 1 - np.floor(logarithmus))
+
+    grenzfall = regular & (np.abs(logarithmus - np.rint(logarithmus)) < 1e-9)
+    flach, werte = result.reshape(-1), values.reshape(-1)
+    for i in np.flatnonzero(grenzfall):
+        flach[i] = round_significant(float(werte[i]), digits)
+    return result
+
+
+def format_significant(value: Any, digits: int = SIGNIFICANT_DIGITS) -> str:
+    """
+    Formatiert einen Wert mit der angegebenen Anzahl signifikanter Stellen.
+
+    Nur fuer die Anzeige: der Wert selbst bleibt ungerundet, gerundet wird
+    erst, wenn der Text erzeugt wird.
+
+    Args:
+        value: Der anzuzeigende Wert
+        digits: Anzahl der signifikanten Stellen
+
+    Returns:
+        str: Der gerundete Wert als Text
+    """
+    return str(round_significant(value, digits))
+
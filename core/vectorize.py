@@ -0,0 +1,171 @@
+# core/vectorize.py
+
+import math
+from typing import Any, Callable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy ist optional, ohne NumPy wird zeilenweise gerechnet
+    np = None
+
+from core.rounding import round_array, round_significant, round_significant_array
+
+
+def to_float(value: Any) -> float:
+    """Wandelt eine Eingabezelle um; leere oder nicht numerische Werte werden NaN."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class _ScalarOps:
+    """Rechenoperationen fuer einzelne Zahlen (zeilenweiser Fallback ohne NumPy)."""
+
+    pi = math.pi
+    nan = math.nan
+
+    @staticmethod
+    def column(values: Sequence[Any]) -> List[float]:
+        return [to_float(v) for v in values]
+
+    @staticmethod
+    def div(a: float, b: float) -> float:
+        if b == 0:
+            return math.copysign(math.inf, a) if a else math.nan
+        return a / b
+
+    @staticmethod
+    def where(condition: bool, a: float, b: float) -> float:
+        return a if condition else b
+
+    @staticmethod
+    def round(value: float, digits: int = 0) -> float:
+        return round(value, digits)
+
+    @staticmethod
+    def any(values: bool) -> bool:
+        return bool(values)
+
+    round_significant = staticmethod(round_significant)
+    floor = staticmethod(math.floor)
+    abs = staticmethod(abs)
+    power = staticmethod(math.pow)
+    sqrt = staticmethod(math.sqrt)
+    log = staticmethod(math.log)
+    log1p = staticmethod(math.log1p)
+    exp = staticmethod(math.exp)
+    expm1 = staticmethod(math.expm1)
+    sin = staticmethod(math.sin)
+    cos = staticmethod(math.cos)
+    asin = staticmethod(math.asin)
+    acos = staticmethod(math.acos)
+    radians = staticmethod(math.radians)
+    degrees = staticmethod(math.degrees)
+
+
+if np is not None:
+    class _NumpyOps:
+        """Dieselben Operationen auf ganzen Spalten (NumPy-Arrays)."""
+
+        pi = math.pi
+        nan = math.nan
+
+        @staticmethod
+        def column(values: Sequence[Any]):
+            try:
+                return np.asarray(values, dtype=float)
+            except (TypeError, ValueError):
+                # Einzelne leere oder ungueltige Zellen: Zelle fuer Zelle umwandeln
+                return np.fromiter((to_float(v) for v in values), dtype=float, count=len(values))
+
+        @staticmethod
+        def div(a, b):
+            return a / b
+
+        round_significant = staticmethod(round_significant_array)
+        where = staticmethod(np.where)
+        round = staticmethod(round_array)
+        floor = staticmethod(np.floor)
+        any = staticmethod(np.any)
+        abs = staticmethod(np.abs)
+        power = staticmethod(np.power)
+        sqrt = staticmethod(np.sqrt)
+        log = staticmethod(np.log)
+        log1p = staticmethod(np.log1p)
+        exp = staticmethod(np.exp)
+        expm1 = staticmethod(np.expm1)
+        sin = staticmethod(np.sin)
+        cos = staticmethod(np.cos)
+        asin = staticmethod(np.arcsin)
+        acos = staticmethod(np.arccos)
+        radians = staticmethod(np.radians)
+        degrees = staticmethod(np.degrees)
+
+
+# Operationen fuer Einzelrechnungen, damit exec dieselben Formeln wie der Batch nutzen kann
+SCALAR_OPS = _ScalarOps
+
+
+def batch_apply(func: Callable[..., Any], columns: Sequence[Sequence[Any]],
+                invalid: Optional[Callable[..., Any]] = None, outputs: int = 1) -> Any:
+    """
+    Wendet eine Rechenvorschrift auf ganze Parameterspalten an.
+
+    Mit NumPy wird func einmal mit kompletten Arrays aufgerufen, ohne NumPy
+    einmal pro Zeile mit einzelnen Zahlen. func erhaelt als erstes Argument
+    den passenden Operations-Namensraum (sqrt, where, div, round, ...) und
+    muss mit beiden Varianten funktionieren.
+
+    Jede Zelle wird einzeln umgewandelt: Leere oder nicht numerische Werte
+    machen nur ihre eigene Zeile ungueltig, der Rest des Blocks wird
+    trotzdem berechnet.
+
+    Args:
+        func: Rechenvorschrift func(ops, *spalten), liefert einen Wert oder ein Tupel
+        columns: Parameterspalten (Listen oder Arrays gleicher Laenge)
+        invalid: Optionale Bedingung invalid(*spalten) fuer ungueltige Zeilen
+        outputs: Anzahl der Ergebniswerte, die func pro Zeile liefert
+
+    Returns:
+        Any: Ergebnisspalte bzw. Tupel von Ergebnisspalten; ungueltige Zeilen sind NaN
+    """
+    if np is not None:
+        arrays = [_NumpyOps.column(c) for c in columns]
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            result = func(_NumpyOps, *arrays)
+            mask = invalid(*arrays) if invalid is not None else None
+
+        missing = np.zeros(len(arrays[0]), dtype=bool) if arrays else None
+        for array in arrays:
+            missing |= np.isnan(array)
+        if missing is not None and missing.any():
+            mask = missing if mask is None else mask | missing
+
+        if isinstance(result, tuple):
+            result = tuple(np.asarray(r, dtype=float) for r in result)
+            if mask is not None:
+                result = tuple(np.where(mask, np.nan, r) for r in result)
+            return result
+
+        result = np.asarray(result, dtype=float)
+        return np.where(mask, np.nan, result) if mask is not None else result
+
+    rows = zip(*[_ScalarOps.column(c) for c in columns])
+    nan_result = math.nan if outputs == 1 else (math.nan,) * outputs
+    results = []
+
+    for row in rows:
+        if any(v != v for v in row) or (invalid is not None and invalid(*row)):
+            value = None
+        else:
+            try:
+                value = func(_ScalarOps, *row)
+            except (ValueError, ZeroDivisionError, OverflowError):
+                value = None
+
+        results.append(nan_result if value is None else value)
+
+    if outputs > 1:
+        return tuple(list(column) for column in zip(*results)) if results else tuple([] for _ in range(outputs))
+    return results
@@ -6,9 +6,11 @@ from typing import Dict, List, Optional, Any, Tuple
 from core.plugin_manager import PluginManager
 from core.plugin_interface import IPlugin, Command
 from core.calculation_log import CalculationLog
+from core.money import MONEY_MODES, ROUNDING_MODES, MoneyContext, get_money_context, set_money_context
 from gui.theme_manager import ThemeManager
 from gui.triangle_input import TriangleInputPanel
 from gui.side_calculator import SideCalculator
+from gui.paged_result_view import PagedResultView
 
 class MainWindow:
     """Hauptfenster der Anwendung."""
@@ -26,6 +28,7 @@ class MainWindow:
         self.plugin_manager = plugin_manager
         self.calculation_log = calculation_log
         self.current_plugin: Optional[IPlugin] = None
+        self.current_plugin_name: Optional[str] = None
         self.current_command: Optional[Command] = None
         self.theme_manager = ThemeManager(root)
         self.param_entries: List[ttk.Entry] = []
@@ -78,7 +81,7 @@ class MainWindow:
             return
 
         if self.calculation_log.load_from_file(filename):
-            self._update_log_view()
+            self._update_log_view(rebuild=True)
             messagebox.showinfo("Erfolg", "Protokoll erfolgreich geladen.")
         else:
             messagebox.showerror("Fehler", "Fehler beim Laden des Protokolls.")
@@ -87,7 +90,7 @@ class MainWindow:
         """Loescht das Berechnungsprotokoll."""
         if messagebox.askyesno("Bestaetigung", "Moechten Sie das Protokoll wirklich loeschen?"):
             self.calculation_log.clear()
-            self._update_log_view()
+            self._update_log_view(rebuild=True)
             
     def _show_about(self) -> None:
         """Zeigt Informationen ueber die Anwendung an."""
@@ -101,6 +104,29 @@ class MainWindow:
         """oeffnet die Einstellungen fuer das Design."""
         self.theme_manager.open_settings_dialog()
     
+    def _apply_money_settings(self) -> None:
+        """Uebernimmt die im Menue gewaehlte Rechenart fuer Geldbetraege."""
+        set_money_context(MoneyContext(self.money_mode_var.get(), self.rounding_var.get()))
+    
+    def _show_cache_stats(self) -> None:
+        """Zeigt die Kennzahlen des Ergebnis-Caches an."""
+        stats = self.plugin_manager.cache.stats()
+        anfragen = stats["treffer"] + stats["fehlschlaege"]
+        quote = f"{stats['treffer'] / anfragen:.0%}" if anfragen else "-"
+        messagebox.showinfo(
+            "Ergebnis-Cache",
+            f"Eintraege: {stats['eintraege']} (ca. {stats['bytes'] / 1024:.0f} KiB)\n"
+            f"Treffer: {stats['treffer']}\n"
+            f"Fehlschlaege: {stats['fehlschlaege']}\n"
+            f"Trefferquote: {quote}\n"
+            f"Verdraengt: {stats['verdraengungen']}"
+        )
+    
+    def _clear_cache(self) -> None:
+        """Leert den Ergebnis-Cache."""
+        self.plugin_manager.cache.clear()
+        self.status_message("Ergebnis-Cache geleert", 3000)
+    
     def _create_layout(self) -> None:
         """Erstellt das Layout des Hauptfensters."""
         # Oberer Bereich: Menueleiste
@@ -121,6 +147,23 @@ class MainWindow:
         menu_bar.add_cascade(label="Darstellung", menu=view_menu)
         view_menu.add_command(label="Design anpassen", command=self._open_theme_settings)
         
+        # Einstellungen-Menue: Rechenart fuer Geldbetraege
+        money = get_money_context()
+        self.money_mode_var = tk.StringVar(value=money.mode)
+        self.rounding_var = tk.StringVar(value=money.rounding)
+        settings_menu = tk.Menu(menu_bar, tearoff=0)
+        menu_bar.add_cascade(label="Einstellungen", menu=settings_menu)
+        for mode, label in MONEY_MODES.items():
+            settings_menu.add_radiobutton(label=label, value=mode, variable=self.money_mode_var,
+                                          command=self._apply_money_settings)
+        settings_menu.add_separator()
+        for rounding in ROUNDING_MODES:
+            settings_menu.add_radiobutton(label=f"Rundung: {rounding}", value=rounding, variable=self.rounding_var,
+                                          command=self._apply_money_settings)
+        settings_menu.add_separator()
+        settings_menu.add_command(label="Ergebnis-Cache anzeigen", command=self._show_cache_stats)
+        settings_menu.add_command(label="Ergebnis-Cache leeren", command=self._clear_cache)
+        
         # Hilfe-Menue
         help_menu = tk.Menu(menu_bar, tearoff=0)
         menu_bar.add_cascade(label="Hilfe", menu=help_menu)
@@ -197,6 +240,7 @@ class MainWindow:
         self.log_context_menu = tk.Menu(self.log_listbox, tearoff=0)
         self.log_context_menu.add_command(label="Kopieren", command=self._copy_log_entry)
         self.log_context_menu.add_command(label="In Nebenrechner einfuegen", command=self._insert_to_side_calc)
+        self.log_context_menu.add_command(label="Alle Werte anzeigen", command=self._show_log_details)
         
         # Rechtsklick auf Protokollliste
         self.log_listbox.bind("<Button-3>", self._show_log_context_menu)
@@ -285,6 +329,7 @@ class MainWindow:
         for plugin_name, plugin_info in self.plugin_manager.plugin_infos.items():
             if plugin_info.name == module_name:
                 self.current_plugin = self.plugin_manager.get_plugin(plugin_name)
+                self.current_plugin_name = plugin_name
                 break
         
         if not self.current_plugin:
@@ -476,11 +521,12 @@ class MainWindow:
             params.append(value)
         
         try:
-            # Befehl ausfuehren
-            text, result = self.current_plugin.exec(self.current_command.name, params)
+            # Befehl ausfuehren (ueber den Plugin-Manager, damit der Ergebnis-Cache greift)
+            result = self.plugin_manager.execute(self.current_plugin_name, self.current_command.name, params)
+            text = result.text
             
-            # Zu Protokoll hinzufuegen
-            self.calculation_log.add_calculation(text, str(result))
+            # Zu Protokoll hinzufuegen (grosse Ergebnisse seitenweise abrufbar)
+            self.calculation_log.add_calculation(text, str(result.value), self._paged_details(result.value))
             
             # Protokollansicht aktualisieren
             self._update_log_view()
@@ -500,16 +546,27 @@ class MainWindow:
         except Exception as e:
             messagebox.showerror("Fehler", str(e))
             
-    def _update_log_view(self) -> None:
-        """Aktualisiert die Anzeige des Berechnungsprotokolls."""
-        # Listbox leeren
-        self.log_listbox.delete(0, tk.END)
+    def _update_log_view(self, rebuild: bool = False) -> None:
+        """
+        Aktualisiert die Anzeige des Berechnungsprotokolls.
+        
+        Neue Eintraege werden nur angehaengt; die Liste wird nur nach dem
+        Laden oder Loeschen des Protokolls komplett neu aufgebaut.
         
+        Args:
+            rebuild: True, wenn die Anzeige komplett neu aufgebaut werden soll
+        """
         # Protokoll abrufen
         calculations = self.calculation_log.get_calculations()
         
+        shown = self.log_listbox.size()
+        if rebuild or shown > len(calculations):
+            # Listbox leeren
+            self.log_listbox.delete(0, tk.END)
+            shown = 0
+        
         # In umgekehrter Reihenfolge anzeigen (neueste zuerst)
-        for calculation, result in calculations:
+        for calculation, result in calculations[shown:]:
             if result:
                 self.log_listbox.insert(tk.END, f"{calculation}: {result}")
             else:
@@ -588,6 +645,34 @@ class MainWindow:
         # In den Nebenrechner einfuegen
         self.side_calculator.insert_value(value)
     
+    def _paged_details(self, value):
+        """
+        Gibt den Wert zurueck, wenn er seitenweise angezeigt werden kann.
+        
+        Args:
+            value: Der Ergebniswert einer Berechnung
+        
+        Returns:
+            Der Wert selbst oder None
+        """
+        if hasattr(value, "page") and hasattr(value, "count"):
+            return value
+        return None
+    
+    def _show_log_details(self):
+        """Zeigt alle Werte des ausgewaehlten Protokolleintrags seitenweise an."""
+        selection = self.log_listbox.curselection()
+        if not selection:
+            return
+        
+        details = self.calculation_log.get_details(selection[0])
+        if details is None:
+            self.status_message("Keine weiteren Werte vorhanden", 1500)
+            return
+        
+        calculation, _ = self.calculation_log.get_calculations()[selection[0]]
+        PagedResultView(self.root, calculation, details)
+    
     def _add_entry_context_menu(self, entry):
         """
         Fuegt einem Eingabefeld ein Kontextmenue hinzu.
@@ -649,7 +734,8 @@ class MainWindow:
                         break
                 
                 if basic_calc:
-                    calc_str, result = basic_calc.exec("Berechnung", [expression])
+                    calculation = basic_calc.exec("Berechnung", [expression])
+                    calc_str, result = calculation.text, calculation.value
                     
                     # Ergebnis ins Eingabefeld setzen
                     self.current_entry.delete(0, tk.END)
@@ -715,11 +801,12 @@ class MainWindow:
                          "Hoehe h"]:
                 params.append(values.get(param, ""))
             
-            # Befehl ausfuehren
-            text, result = self.current_plugin.exec(self.current_command.name, params)
+            # Befehl ausfuehren (ueber den Plugin-Manager, damit der Ergebnis-Cache greift)
+            result = self.plugin_manager.execute(self.current_plugin_name, self.current_command.name, params)
+            text = result.text
             
-            # Zu Protokoll hinzufuegen
-            self.calculation_log.add_calculation(text, str(result))
+            # Zu Protokoll hinzufuegen (grosse Ergebnisse seitenweise abrufbar)
+            self.calculation_log.add_calculation(text, str(result.value), self._paged_details(result.value))
             
             # Protokollansicht aktualisieren
             self._update_log_view()
@@ -0,0 +1,141 @@
+# gui/paged_result_view.py
+
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+class PagedResultView(tk.Toplevel):
+    """Fenster zum seitenweisen Durchblaettern grosser Ergebnisse."""
+
+    # Zeilen pro Seite bei Tabellen (viele Spalten je Zeile)
+    TABLE_PAGE_SIZE = 50
+
+    def __init__(self, parent, title, result, page_size=500):
+        """
+        Initialisiert ein neues Fenster fuer seitenweise Ergebnisse.
+
+        Args:
+            parent: Das Elternelement des Fensters
+            title: Der Fenstertitel
+            result: Ergebnisobjekt mit count und page(seite, groesse); mit columns
+                wird es als Tabelle angezeigt
+            page_size: Anzahl der Werte pro Seite
+        """
+        super().__init__(parent)
+        self.title(title)
+        self.result = result
+        self.columns = getattr(result, "columns", None)
+        if self.columns is not None:
+            page_size = min(page_size, self.TABLE_PAGE_SIZE)
+        self.geometry("480x520" if self.columns is None else "900x560")
+        self.page_size = page_size
+        self.page_index = 0
+        self.page_count = max(1, (result.count + page_size - 1) // page_size)
+
+        self._create_layout()
+        self._show_page()
+
+    def _create_layout(self):
+        """Erstellt das Layout des Fensters."""
+        unit = "Werte" if self.columns is None else "Zeilen"
+        summary = ttk.Label(self, text=f"{self.result.count} {unit}", font=("Arial", 11, "bold"))
+        summary.pack(fill=tk.X, padx=10, pady=(10, 5))
+
+        # Werte der aktuellen Seite
+        list_container = ttk.Frame(self)
+        list_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        if self.columns is None:
+            self.value_list = tk.Listbox(list_container, font=("Arial", 11), activestyle="none")
+        else:
+            self.value_list = self._create_table(list_container)
+        scrollbar = ttk.Scrollbar(list_container, orient="vertical", command=self.value_list.yview)
+        self.value_list.configure(yscrollcommand=scrollbar.set)
+
+        if self.columns is not None:
+            # Breite Tabellen horizontal scrollen
+            x_scrollbar = ttk.Scrollbar(list_container, orient="horizontal", command=self.value_list.xview)
+            self.value_list.configure(xscrollcommand=x_scrollbar.set)
+            x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+
+        self.value_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Navigation
+        nav_frame = ttk.Frame(self)
+        nav_frame.pack(fill=tk.X, padx=10, pady=10)
+
+        self.prev_button = ttk.Button(nav_frame, text="< Zurueck", command=lambda: self._change_page(-1))
+        self.prev_button.pack(side=tk.LEFT)
+
+        self.page_label = ttk.Label(nav_frame, text="", anchor="center")
+        self.page_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        self.next_button = ttk.Button(nav_frame, text="Weiter >", command=lambda: self._change_page(1))
+        self.next_button.pack(side=tk.RIGHT)
+
+        # Export nur fuer Ergebnisse, die sich selbst als CSV schreiben koennen
+        if hasattr(self.result, "write_csv"):
+            export_button = ttk.Button(self, text="Als CSV exportieren", command=self._export_csv)
+            export_button.pack(fill=tk.X, padx=10, pady=(0, 10))
+
+    def _create_table(self, parent):
+        """
+        Erstellt eine Tabelle mit den Spaltenueberschriften des Ergebnisses.
+
+        Args:
+            parent: Das Elternelement der Tabelle
+
+        Returns:
+            ttk.Treeview: Die Tabelle
+        """
+        column_ids = [str(index) for index in range(len(self.columns))]
+        table = ttk.Treeview(parent, columns=column_ids, show="headings")
+        for column_id, heading in zip(column_ids, self.columns):
+            table.heading(column_id, text=heading)
+            table.column(column_id, width=90, minwidth=60, anchor="e", stretch=False)
+        return table
+
+    def _change_page(self, direction):
+        """
+        Blaettert eine Seite vor oder zurueck.
+
+        Args:
+            direction: -1 fuer zurueck, 1 fuer weiter
+        """
+        new_index = self.page_index + direction
+        if 0 <= new_index < self.page_count:
+            self.page_index = new_index
+            self._show_page()
+
+    def _show_page(self):
+        """Laedt die aktuelle Seite und zeigt sie an."""
+        if self.columns is None:
+            self.value_list.delete(0, tk.END)
+            for value in self.result.page(self.page_index, self.page_size):
+                self.value_list.insert(tk.END, str(value))
+        else:
+            self.value_list.delete(*self.value_list.get_children())
+            for row in self.result.page(self.page_index, self.page_size):
+                self.value_list.insert("", tk.END, values=row)
+
+        self.page_label.config(text=f"Seite {self.page_index + 1} von {self.page_count}")
+        self.prev_button.config(state="normal" if self.page_index > 0 else "disabled")
+        self.next_button.config(state="normal" if self.page_index < self.page_count - 1 else "disabled")
+
+    def _export_csv(self):
+        """Schreibt alle Werte zeilenweise in eine CSV-Datei."""
+        filename = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".csv",
+            filetypes=[("CSV-Dateien", "*.csv"), ("Alle Dateien", "*.*")]
+        )
+
+        if not filename:
+            return
+
+        try:
+            with open(filename, "w", encoding="utf-8", newline="") as f:
+                count = self.result.write_csv(f)
+            messagebox.showinfo("Erfolg", f"{count} Zeilen exportiert.", parent=self)
+        except OSError as e:
+            messagebox.showerror("Fehler", f"Fehler beim Exportieren: {e}", parent=self)
@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
-import math
-import re
+
+from core.expression_engine import evaluate_expression
 
 class SideCalculator(ttk.Frame):
     """Ein einfacher Taschenrechner fuer Nebenrechnungen."""
@@ -116,8 +116,8 @@ class SideCalculator(ttk.Frame):
         expression = expression.replace("x", "*").replace(":", "/")
         
         try:
-            # Fuehre die Berechnung aus
-            result = self._evaluate_expression(expression)
+            # Fuehre die Berechnung mit der gemeinsamen Ausdrucks-Engine aus
+            result = evaluate_expression(expression)
             
             # Anzeige formatieren (Operatoren zurueck in Anzeigeformat)
             display_expr = expression.replace("*", "x").replace("/", ":")
@@ -145,187 +145,6 @@ class SideCalculator(ttk.Frame):
         # Scrolle nach oben
         self.result_list.see(0)
     
-    def _evaluate_expression(self, expression):
-        """
-        Wertet einen mathematischen Ausdruck aus.
-        
-        Args:
-            expression: Der auszuwertende Ausdruck
-
-        Returns:
-            float: Das Ergebnis der Berechnung
-        """
-        # ueberpruefe auf gueltige Zeichen
-        if not re.match(r'^[0-9\s\+\-\*\/\(\)\.\,eE]+$', expression):
-            raise ValueError("Ungueltige Zeichen im Ausdruck")
-        
-        # Komma durch Punkt ersetzen
-        expression = expression.replace(",", ".")
-        
-        # Sicherheitscheck: Keine gefaehrlichen Funktionen
-        if "eval" in expression or "exec" in expression or "__" in expression:
-            raise ValueError("Unerlaubter Ausdruck")
-        
-        # Sichere Auswertung ohne eval
-        # Hier koennten wir ein eigenes Parsing implementieren, aber fuer die
-        # Einfachheit verwenden wir den bestehenden Parser aus basic_calc.py
-        
-        # Vereinfachtes Parsing fuer grundlegende Berechnungen
-        # Dies ist eine vereinfachte Version - eine vollstaendige
-        # Implementierung wuerde den Rahmen sprengen
-        
-        # Entferne alle Leerzeichen
-        expression = expression.replace(" ", "")
-        
-        return self._parse_expression(expression)
-    
-    def _parse_expression(self, expression):
-        """
-        Parst und wertet einen Ausdruck rekursiv aus.
-        
-        Args:
-            expression: Der zu parsende Ausdruck
-
-        Returns:
-            float: Das Ergebnis der Auswertung
-        """
-        # Leerer Ausdruck
-        if not expression:
-            return 0
-        
-        # Auswertung von Klammerausdruecken
-        idx = 0
-        while idx < len(expression):
-            if expression[idx] == '(':
-                # Klammern suchen
-                bracket_count = 1
-                start_idx = idx
-                idx += 1
-                
-                while idx < len(expression) and bracket_count > 0:
-                    if expression[idx] == '(':
-                        bracket_count += 1
-                    elif expression[idx] == ')':
-                        bracket_count -= 1
-                    idx += 1
-                
-                if bracket_count != 0:
-                    raise ValueError("Unbalancierte Klammern")
-                
-                # Subausdruck extrahieren und auswerten
-                sub_expr = expression[start_idx+1:idx-1]
-                sub_result = self._parse_expression(sub_expr)
-                
-                # Subausdruck durch sein Ergebnis ersetzen
-                expression = expression[:start_idx] + str(sub_result) + expression[idx:]
-                
-                # Index zuruecksetzen
-                idx = 0
-            else:
-                idx += 1
-        
-        # Addition und Subtraktion auswerten
-        return self._parse_add_sub(expression)
-    
-    def _parse_add_sub(self, expression):
-        """
-        Wertet Addition und Subtraktion aus.
-        
-        Args:
-            expression: Der auszuwertende Ausdruck
-
-        Returns:
-            float: Das Ergebnis der Auswertung
-        """
-        terms = []
-        operators = []
-        current_term = ""
-        i = 0
-        
-        # Negative Zahl am Anfang behandeln
-        if expression.startswith("-"):
-            expression = "0" + expression
-        
-        while i < len(expression):
-            char = expression[i]
-            
-            if char in "+-" and i > 0 and expression[i-1] not in "+-*/":
-                terms.append(current_term)
-                operators.append(char)
-                current_term = ""
-            else:
-                current_term += char
-            
-            i += 1
-        
-        # Letzten Term hinzufuegen
-        if current_term:
-            terms.append(current_term)
-        
-        # Multiplikation und Division fuer jeden Term auswerten
-        results = [self._parse_mul_div(term) for term in terms]
-        
-        # Addition und Subtraktion anwenden
-        result = results[0]
-        for i in range(len(operators)):
-            if operators[i] == "+":
-                result += results[i+1]
-            else:  # "-"
-                result -= results[i+1]
-        
-        return result
-    
-    def _parse_mul_div(self, expression):
-        """
-        Wertet Multiplikation und Division aus.
-        
-        Args:
-            expression: Der auszuwertende Ausdruck
-
-        Returns:
-            float: Das Ergebnis der Auswertung
-        """
-        factors = []
-        operators = []
-        current_factor = ""
-        i = 0
-        
-        while i < len(expression):
-            char = expression[i]
-            
-            if char in "*/" and i > 0:
-                factors.append(current_factor)
-                operators.append(char)
-                current_factor = ""
-            else:
-                current_factor += char
-            
-            i += 1
-        
-        # Letzten Faktor hinzufuegen
-        if current_factor:
-            factors.append(current_factor)
-        
-        # Faktoren in Zahlen umwandeln
-        numbers = []
-        for factor in factors:
-            try:
-                numbers.append(float(factor))
-            except ValueError:
-                raise ValueError(f"Ungueltiger Wert: {factor}")
-        
-        # Multiplikation und Division anwenden
-        result = numbers[0]
-        for i in range(len(operators)):
-            if operators[i] == "*":
-                result *= numbers[i+1]
-            else:  # "/"
-                if numbers[i+1] == 0:
-                    raise ValueError("Division durch Null")
-                result /= numbers[i+1]
-        
-        return result
-    
     def _clear_entry(self):
         """Leert das Eingabefeld."""
         self.entry_var.set("")
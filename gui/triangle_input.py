@@ -35,7 +35,7 @@ class TriangleInputPanel(ttk.Frame):
             "SSS (drei Seiten)": ["Seite a", "Seite b", "Seite c"],
             "SWS (zwei Seiten, ein Winkel)": ["Seite a", "Seite b", "Winkel C (Grad)"],
             "WSW (zwei Winkel, eine Seite)": ["Winkel A (Grad)", "Seite c", "Winkel B (Grad)"],
-            "SSW (zwei Seiten, gegenueberliegender Winkel)": ["Seite a", "Seite b", "Winkel C (Grad)"],
+            "SSW (zwei Seiten, gegenueberliegender Winkel)": ["Seite a", "Seite b", "Winkel A (Grad)"],
             "Grundseite und Hoehe": ["Seite a", "Hoehe h"]
         }
         
@@ -1,35 +1,155 @@
-import tkinter as tk
-from tkinter import ttk
+import argparse
+import os
+import sys
 
 from core.plugin_manager import PluginManager
 from core.calculation_log import CalculationLog
-from gui.main_window import MainWindow
+from core.money import MONEY_MODES, ROUNDING_MODES, MoneyContext, set_money_context
 
 def main():
     """Hauptfunktion der Anwendung."""
+    if len(sys.argv) > 1:
+        # Kommandozeilenmodus ohne grafische Oberflaeche
+        sys.exit(run_cli(sys.argv[1:]))
+
+    run_gui()
+
+def run_gui():
+    """Startet die grafische Oberflaeche."""
+    # Tkinter erst hier importieren, damit der Batch-Modus ohne Display laeuft
+    import tkinter as tk
+    from tkinter import ttk
+    from gui.main_window import MainWindow
+
     # Wurzelelement der Tkinter-Anwendung erstellen
     root = tk.Tk()
-    
+
     # Plugin-Manager erstellen
     plugin_manager = PluginManager()
-    
+
     # Berechnungsprotokoll erstellen
     calculation_log = CalculationLog()
-    
+
     # Hauptfenster erstellen
     main_window = MainWindow(root, plugin_manager, calculation_log)
-    
+
     # Initialen Theme-Stil anwenden
     style = ttk.Style()
     style.theme_use('clam')  # 'clam' ist ein guter Kompromiss fuer moderne Darstellung
-    
+
     # Tastenkuerzel fuer haeufige Aktionen
     root.bind("<F1>", lambda e: main_window._show_about())
     root.bind("<Control-s>", lambda e: main_window._save_log())
     root.bind("<Control-o>", lambda e: main_window._load_log())
-    
+
     # Tkinter-Hauptschleife starten
     root.mainloop()
 
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Erstellt den Parser fuer die Kommandozeilenargumente."""
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="JustForYou Taschenrechner (ohne Argumente startet die grafische Oberflaeche)"
+    )
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+
+    batch = subparsers.add_parser("batch", help="Befehl eines Moduls ueber eine CSV-/JSONL-Datei ausfuehren")
+    batch.add_argument("--plugin", required=True, help="Modul, z.B. credit, percentage, geometry, math_functions, basic")
+    batch.add_argument("--command", required=True, help="Befehl, z.B. \"Ratenkredit (Laufzeit)\"")
+    batch.add_argument("input", nargs="?", default="-", help="Eingabedatei (Standard: stdin)")
+    batch.add_argument("--format", choices=["csv", "jsonl"], help="Eingabeformat (Standard: nach Dateiendung, sonst csv)")
+    batch.add_argument("--delimiter", default=",", help="Trennzeichen fuer CSV (Standard: ,)")
+    batch.add_argument("--header", action="store_true", help="Erste CSV-Zeile ist eine Kopfzeile")
+    batch.add_argument("--columns", help="Eingabespalten der Parameter, kommagetrennt als Namen aus der Kopfzeile oder Nummern ab 1 (Standard: die ersten Spalten)")
+    batch.add_argument("--chunk-size", type=int, default=10000, help="Zeilen pro Verarbeitungsblock")
+    batch.add_argument("--workers", type=int, default=1, help="Anzahl paralleler Prozesse (0 = alle Kerne, Standard: 1)")
+    batch.add_argument("--money", choices=sorted(MONEY_MODES), default="float", help="Rechenart fuer Geldbetraege in Kredit- und Prozentrechnung (Standard: float)")
+    batch.add_argument("--rounding", choices=sorted(ROUNDING_MODES), default="kaufmaennisch", help="Rundung halber Cent bei --money decimal/cents (Standard: kaufmaennisch)")
+    batch.add_argument("--unordered", action="store_true", help="Ergebnisse in Fertigstellungsreihenfolge ausgeben (nur mit --workers)")
+
+    return parser
+
+def run_cli(argv) -> int:
+    """
+    Fuehrt die Anwendung im Kommandozeilenmodus aus.
+
+    Args:
+        argv: Kommandozeilenargumente ohne Programmnamen
+
+    Returns:
+        int: Exit-Code
+    """
+    args = build_arg_parser().parse_args(argv)
+
+    if args.mode == "batch":
+        return run_batch(args)
+
+    return 2
+
+def run_batch(args) -> int:
+    """
+    Fuehrt einen Batch-Lauf aus und meldet die Durchsatzrate auf stderr.
+
+    Args:
+        args: Die geparsten Argumente des batch-Befehls
+
+    Returns:
+        int: Exit-Code
+    """
+    from core.batch_runner import BatchRunner
+
+    set_money_context(MoneyContext(args.money, args.rounding))
+
+    plugin_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugins")
+    plugin_manager = PluginManager(plugin_dir)
+    plugin_manager.load_plugins([args.plugin])
+
+    plugin = plugin_manager.get_plugin(args.plugin)
+    if plugin is None:
+        print(f"Fehler: Modul {args.plugin} nicht gefunden.", file=sys.stderr)
+        return 1
+
+    try:
+        runner = BatchRunner(plugin, args.command, args.chunk_size)
+    except ValueError as e:
+        print(f"Fehler: {e}", file=sys.stderr)
+        return 1
+
+    input_format = args.format or ("jsonl" if args.input.endswith((".jsonl", ".ndjson")) else "csv")
+
+    if args.input == "-":
+        stream = sys.stdin
+    else:
+        stream = open(args.input, "r", encoding="utf-8", newline="")
+
+    try:
+        columns = args.columns.split(",") if args.columns else None
+        try:
+            rows = runner.read_rows(stream, input_format, args.delimiter, args.header, columns)
+        except ValueError as e:
+            print(f"Fehler: {e}", file=sys.stderr)
+            return 1
+
+        # Erst nach der Kopfzeile starten, damit die Worker die Spaltenauswahl kennen
+        executor = None
+        if args.workers != 1:
+            from core.parallel_executor import ParallelBatchExecutor
+            executor = ParallelBatchExecutor(
+                plugin_dir,
+                args.plugin,
+                args.command,
+                workers=args.workers or None,
+                ordered=not args.unordered,
+                param_indices=runner.param_indices
+            )
+
+        stats = runner.run(rows, sys.stdout, input_format, args.delimiter, executor)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+    print(stats, file=sys.stderr)
+    return 0
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,7 +1,13 @@
 ﻿# plugins/credit/credit_calc.py
 
-from typing import List, Tuple, Any
-from core.plugin_interface import IPlugin, PluginInfo, Command
+import math
+from typing import List, Tuple, Any, Sequence
+from core.money import get_money_context
+from core.plugin_interface import IPlugin, PluginInfo, Command, CalculationResult
+from core.vectorize import SCALAR_OPS, batch_apply
+from plugins.credit.grid import RateGrid, value_range
+from plugins.credit.interest import effective_annual_rate, solve_monthly_rate
+from plugins.credit.schedule import AmortizationSchedule, ScheduleBlock
 
 class CreditCalculator(IPlugin):
     """Implementiert den Kreditrechner."""
@@ -10,9 +16,15 @@ class CreditCalculator(IPlugin):
         """Initialisiert einen neuen Kreditrechner."""
         self.name = "Kreditberechnung"
         self.commands = [
-            Command("Einmalrueckzahlung", ["Kreditbetrag", "Zinssatz", "Laufzeit (Monate)"]),
-            Command("Ratenkredit (Laufzeit)", ["Kreditbetrag", "Zinssatz", "Laufzeit (Monate)"]),
-            Command("Ratenkredit (Ratenhoehe)", ["Kreditbetrag", "Zinssatz", "Ratenhoehe"])
+            Command("Einmalrueckzahlung", ["Kreditbetrag", "Zinssatz", "Laufzeit (Monate)"], cacheable=True),
+            Command("Ratenkredit (Laufzeit)", ["Kreditbetrag", "Zinssatz", "Laufzeit (Monate)"], cacheable=True),
+            Command("Ratenkredit (Ratenhoehe)", ["Kreditbetrag", "Zinssatz", "Ratenhoehe"], cacheable=True),
+            Command("Tilgungsplan", ["Kreditbetrag", "Zinssatz", "Laufzeit (Monate)"], cacheable=True),
+            Command("Effektivzins", ["Kreditbetrag", "Ratenhoehe", "Laufzeit (Monate)"], cacheable=True),
+            Command("Ratenmatrix", [
+                "Kreditbetrag", "Zinssatz von", "Zinssatz bis", "Zinsschritt",
+                "Laufzeit von (Monate)", "Laufzeit bis (Monate)", "Laufzeitschritt (Monate)"
+            ], cacheable=True)
         ]
     
     def load(self) -> None:
@@ -28,7 +40,7 @@ class CreditCalculator(IPlugin):
         """
         return PluginInfo(self.name, self.commands)
     
-    def exec(self, command_name: str, params: List[Any]) -> Tuple[str, Any]:
+    def exec(self, command_name: str, params: List[Any]) -> CalculationResult:
         """
         Fuehrt einen Befehl mit den gegebenen Parametern aus.
         
@@ -37,59 +49,72 @@ class CreditCalculator(IPlugin):
             params: Liste der Parameter
 
         Returns:
-            Tuple[str, Any]: (Formatierter Text der Berechnung, Ergebniswert)
+            CalculationResult: Ergebniswert mit verzoegert erzeugtem Anzeigetext
         """
+        # Geldbetraege je nach Rechenart als float, Decimal oder ganze Cent
+        money = get_money_context()
+        
         if command_name == "Einmalrueckzahlung":
             # Kredit mit einmaliger Rueckzahlung
-            kreditbetrag = float(params[0])
-            zinssatz = float(params[1])
+            kreditbetrag = money.amount(params[0])
+            zinssatz = money.number(params[1])
             laufzeit = int(params[2])
             
-            # Monatlicher Zinssatz
-            monatlicher_zinssatz = zinssatz / 100 / 12
-            
-            # Endbetrag berechnen
-            endbetrag = kreditbetrag * (1 + monatlicher_zinssatz) ** laufzeit
-            zinsen_gesamt = endbetrag - kreditbetrag
+            with money.local():
+                # Monatlicher Zinssatz
+                monatlicher_zinssatz = zinssatz / 100 / 12
+                
+                # Endbetrag berechnen
+                endbetrag = money.fraction(kreditbetrag, (1 + monatlicher_zinssatz) ** laufzeit, 1)
+                zinsen_gesamt = endbetrag - kreditbetrag
             
             # Runden auf 2 Nachkommastellen (Waehrung)
-            endbetrag = round(endbetrag, 2)
-            zinsen_gesamt = round(zinsen_gesamt, 2)
-            
-            return (
-                f"Kreditberechnung: {kreditbetrag} €, Zinsen {zinssatz} %, "
-                f"Laufzeit {laufzeit} Monate → Rueckzahlung {endbetrag} €, "
-                f"Zinsen gesamt {zinsen_gesamt} €",
-                endbetrag
+            endbetrag = money.output(money.round(endbetrag))
+            zinsen_gesamt = money.output(money.round(zinsen_gesamt))
+            kreditbetrag = money.output(kreditbetrag)
+            
+            return CalculationResult(
+                endbetrag,
+                lambda: (
+                    f"Kreditberechnung: {kreditbetrag} €, Zinsen {zinssatz} %, "
+                    f"Laufzeit {laufzeit} Monate → Rueckzahlung {endbetrag} €, "
+                    f"Zinsen gesamt {zinsen_gesamt} €"
+                )
             )
             
         elif command_name == "Ratenkredit (Laufzeit)":
             # Ratenkredit mit Vorgabe der Laufzeit
-            kreditbetrag = float(params[0])
-            zinssatz = float(params[1])
+            kreditbetrag = money.amount(params[0])
+            zinssatz = money.number(params[1])
             laufzeit = int(params[2])
             
-            # Monatlicher Zinssatz
-            monatlicher_zinssatz = zinssatz / 100 / 12
-            
-            # Ratenhoehe berechnen
-            if monatlicher_zinssatz == 0:
-                rate = kreditbetrag / laufzeit
-            else:
-                rate = (kreditbetrag * monatlicher_zinssatz) / (1 - (1 + monatlicher_zinssatz) ** -laufzeit)
+            with money.local():
+                # Monatlicher Zinssatz
+                monatlicher_zinssatz = zinssatz / 100 / 12
+                
+                # Ratenhoehe berechnen
+                if monatlicher_zinssatz == 0:
+                    rate = money.fraction(kreditbetrag, 1, laufzeit)
+                else:
+                    rate = money.fraction(
+                        kreditbetrag, monatlicher_zinssatz, 1 - (1 + monatlicher_zinssatz) ** -laufzeit
+                    )
             
             # Gesamtzinsen
             zinsen_gesamt = rate * laufzeit - kreditbetrag
             
             # Runden auf 2 Nachkommastellen (Waehrung)
-            rate = round(rate, 2)
-            zinsen_gesamt = round(zinsen_gesamt, 2)
-            
-            return (
-                f"Ratenkredit: {kreditbetrag} €, Zinsen {zinssatz} %, "
-                f"Laufzeit {laufzeit} Monate → Rate {rate} €, "
-                f"Zinsen gesamt {zinsen_gesamt} €",
-                rate
+            rate = money.output(money.round(rate))
+            zinsen_gesamt = money.output(money.round(zinsen_gesamt))
+            kreditbetrag = money.output(kreditbetrag)
+            
+            return CalculationResult(
+                rate,
+                lambda: (
+                    f"Ratenkredit: {kreditbetrag} €, Zinsen {zinssatz} %, "
+                    f"Laufzeit {laufzeit} Monate → Rate {rate} €, "
+                    f"Zinsen gesamt {zinsen_gesamt} €"
+                )
             )
             
         elif command_name == "Ratenkredit (Ratenhoehe)":
@@ -108,49 +133,208 @@ class CreditCalculator(IPlugin):
                     f"(mindestens {min_rate:.2f} €)."
                 )
             
-            # Laufzeit berechnen
-            if monatlicher_zinssatz == 0:
-                laufzeit = kreditbetrag / rate
-                schlussrate = rate
-            else:
-                laufzeit = -1 * (
-                    (
-                        (
-                            1 - (kreditbetrag * monatlicher_zinssatz / rate)
-                        )
-                    ) / (
-                        (
-                            1 / (
-                                (1 + monatlicher_zinssatz)
-                            )
-                        )
-                    )
-                )
-                
-                # Laufzeit als ganze Zahl
-                laufzeit_ganzzahl = int(laufzeit)
-                
-                # Schlussrate berechnen
-                restschuld = kreditbetrag
-                for _ in range(laufzeit_ganzzahl):
-                    restschuld = restschuld * (1 + monatlicher_zinssatz) - rate
-                
-                schlussrate = restschuld * (1 + monatlicher_zinssatz)
-                laufzeit = laufzeit_ganzzahl + 1  # +1 fuer die Schlussrate
+            if rate <= 0:
+                raise ValueError("Die Rate muss positiv sein.")
             
-            # Gesamtzinsen
-            zinsen_gesamt = rate * (laufzeit - 1) + schlussrate - kreditbetrag
+            # Laufzeit und Schlussrate in geschlossener Form
+            laufzeit, schlussrate = self._laufzeit_aus_rate(kreditbetrag, monatlicher_zinssatz, rate)
+            
+            # Gesamtzinsen (in den exakten Rechenarten aus den Centbetraegen)
+            betrag, volle_rate, schluss = money.amount(params[0]), money.amount(params[2]), money.amount(schlussrate)
+            zinsen_gesamt = volle_rate * (laufzeit - 1) + schluss - betrag
             
             # Runden
-            laufzeit = round(laufzeit)
-            schlussrate = round(schlussrate, 2)
-            zinsen_gesamt = round(zinsen_gesamt, 2)
-            
-            return (
-                f"Ratenkredit: {kreditbetrag} €, Zinsen {zinssatz} %, "
-                f"Rate {rate} € → Laufzeit {laufzeit} Monate, "
-                f"Schlussrate {schlussrate} €, Zinsen gesamt {zinsen_gesamt} €",
-                laufzeit
+            schlussrate = money.output(money.round(schluss))
+            zinsen_gesamt = money.output(money.round(zinsen_gesamt))
+            kreditbetrag, rate = money.output(betrag), money.output(volle_rate)
+            
+            return CalculationResult(
+                laufzeit,
+                lambda: (
+                    f"Ratenkredit: {kreditbetrag} €, Zinsen {zinssatz} %, "
+                    f"Rate {rate} € → Laufzeit {laufzeit} Monate, "
+                    f"Schlussrate {schlussrate} €, Zinsen gesamt {zinsen_gesamt} €"
+                )
+            )
+        
+        elif command_name == "Tilgungsplan":
+            # Monatlicher Tilgungsplan eines Annuitaetendarlehens
+            kreditbetrag = float(params[0])
+            zinssatz = float(params[1])
+            laufzeit = int(params[2])
+            
+            if kreditbetrag <= 0:
+                raise ValueError("Der Kreditbetrag muss positiv sein.")
+            
+            if laufzeit <= 0:
+                raise ValueError("Die Laufzeit muss mindestens einen Monat betragen.")
+            
+            # Zeilen werden erst beim Blaettern oder Exportieren erzeugt
+            plan = AmortizationSchedule(kreditbetrag, zinssatz, laufzeit, money=money)
+            
+            return CalculationResult(
+                plan,
+                lambda: (
+                    f"Tilgungsplan: {kreditbetrag} €, Zinsen {zinssatz} %, "
+                    f"Laufzeit {laufzeit} Monate → {plan.summary()}"
+                )
+            )
+        
+        elif command_name == "Effektivzins":
+            # Effektiver Jahreszins aus Kreditbetrag, Rate und Laufzeit
+            kreditbetrag = float(params[0])
+            rate = float(params[1])
+            laufzeit = int(params[2])
+            
+            if kreditbetrag <= 0:
+                raise ValueError("Der Kreditbetrag muss positiv sein.")
+            
+            if rate <= 0:
+                raise ValueError("Die Rate muss positiv sein.")
+            
+            if laufzeit <= 0:
+                raise ValueError("Die Laufzeit muss mindestens einen Monat betragen.")
+            
+            # Monatszins iterativ, daraus Soll- und Effektivzins
+            monatlicher_zinssatz = solve_monthly_rate(SCALAR_OPS, kreditbetrag, rate, laufzeit)
+            sollzins = monatlicher_zinssatz * 12 * 100
+            effektivzins = effective_annual_rate(SCALAR_OPS, monatlicher_zinssatz)
+            
+            return CalculationResult(
+                effektivzins,
+                lambda: (
+                    f"Effektivzins: {kreditbetrag} €, Rate {rate} €, "
+                    f"Laufzeit {laufzeit} Monate → Sollzins {sollzins:.4f} %, "
+                    f"effektiver Jahreszins {effektivzins:.4f} %"
+                )
+            )
+        
+        elif command_name == "Ratenmatrix":
+            # Monatsraten fuer alle Kombinationen aus Zinssatz und Laufzeit
+            kreditbetrag = float(params[0])
+            zinssaetze = value_range(float(params[1]), float(params[2]), float(params[3]))
+            laufzeiten = [int(monate) for monate in value_range(int(params[4]), int(params[5]), int(params[6]))]
+            
+            if kreditbetrag <= 0:
+                raise ValueError("Der Kreditbetrag muss positiv sein.")
+            
+            if laufzeiten[0] <= 0:
+                raise ValueError("Die Laufzeit muss mindestens einen Monat betragen.")
+            
+            # Die ganze Matrix in einem vektorisierten Durchlauf
+            matrix = RateGrid(kreditbetrag, zinssaetze, laufzeiten)
+            
+            return CalculationResult(
+                matrix,
+                lambda: (
+                    f"Ratenmatrix: {kreditbetrag} €, Zinsen {zinssaetze[0]} bis {zinssaetze[-1]} %, "
+                    f"Laufzeit {laufzeiten[0]} bis {laufzeiten[-1]} Monate → {matrix.summary()}"
+                )
+            )
+        
+        raise ValueError(f"Unbekannter Befehl: {command_name}")
+    
+    # Restschuld bis zu einem halben Cent wird mit der letzten vollen Rate beglichen
+    RESTSCHULD_TOLERANZ = 0.005
+    
+    def _laufzeit_aus_rate(self, kreditbetrag: float, monatlicher_zinssatz: float, rate: float) -> Tuple[int, float]:
+        """
+        Berechnet Anzahl der Raten und Schlussrate bei vorgegebener Ratenhoehe.
+        
+        Die Anzahl n der Raten folgt aus der Annuitaetenformel
+        n = -ln(1 - K * r / R) / ln(1 + r). Nach k = floor(n) vollen Raten
+        bleibt die Restschuld K * q^k - R * (q^k - 1) / r mit q = 1 + r,
+        die mit einer verzinsten Schlussrate getilgt wird. Der Aufwand ist
+        unabhaengig von der Laufzeit.
+        
+        Args:
+            kreditbetrag: Der Kreditbetrag K
+            monatlicher_zinssatz: Monatszins r als Dezimalzahl
+            rate: Die Monatsrate R (groesser als K * r)
+
+        Returns:
+            Tuple[int, float]: (Anzahl der Raten, Schlussrate)
+        """
+        r = monatlicher_zinssatz
+        
+        if r == 0:
+            volle_raten = math.floor(kreditbetrag / rate)
+            restschuld = kreditbetrag - volle_raten * rate
+        else:
+            n = -math.log(1 - kreditbetrag * r / rate) / math.log1p(r)
+            volle_raten = math.floor(n)
+            q_k = (1 + r) ** volle_raten
+            restschuld = kreditbetrag * q_k - rate * (q_k - 1) / r
+        
+        if volle_raten > 0 and restschuld <= self.RESTSCHULD_TOLERANZ:
+            # Kein nennenswerter Rest: die letzte volle Rate ist die Schlussrate
+            return volle_raten, rate + restschuld
+        
+        return volle_raten + 1, restschuld * (1 + r)
+    
+    def exec_batch(self, command_name: str, columns: List[Sequence[Any]]) -> Any:
+        """
+        Fuehrt einen Befehl vektorisiert fuer ganze Parameterspalten aus.
+        
+        Args:
+            command_name: Name des auszufuehrenden Befehls
+            columns: Je Parameter eine Spalte (Liste oder NumPy-Array)
+
+        Returns:
+            Any: Ergebnisspalte; ungueltige Zeilen sind NaN
+        """
+        money = get_money_context()
+        
+        if command_name == "Tilgungsplan":
+            # Ein Plan je Kredit; die Zeilen werden beim Schreiben blockweise erzeugt
+            return ScheduleBlock(*columns, money=money).schedules()
+        
+        if money.exact and command_name not in ("Ratenkredit (Ratenhoehe)", "Effektivzins"):
+            # Exakte Geldbetraege zeilenweise ueber exec (Laufzeit und Zinssatz sind in jeder Rechenart gleich)
+            return super().exec_batch(command_name, columns)
+        
+        if command_name == "Einmalrueckzahlung":
+            # Endbetrag, auf Cent gerundet
+            return batch_apply(
+                lambda ops, betrag, zins, monate: ops.round(betrag * (1 + zins / 100 / 12) ** monate, 2),
+                columns
+            )
+            
+        elif command_name == "Ratenkredit (Laufzeit)":
+            # Annuitaet, bei 0 % Zinsen einfache Tilgung
+            def rate(ops, betrag, zins, monate):
+                r = zins / 100 / 12
+                annuitaet = ops.div(betrag * r, 1 - (1 + r) ** -monate)
+                return ops.round(ops.where(r == 0, ops.div(betrag, monate), annuitaet), 2)
+            
+            return batch_apply(rate, columns, invalid=lambda betrag, zins, monate: monate <= 0)
+        
+        elif command_name == "Ratenkredit (Ratenhoehe)":
+            # Anzahl der Raten in geschlossener Form, wie _laufzeit_aus_rate
+            def laufzeit(ops, betrag, zins, rate):
+                r = zins / 100 / 12
+                n = ops.where(
+                    r == 0,
+                    ops.div(betrag, rate),
+                    ops.div(-ops.log(1 - ops.div(betrag * r, rate)), ops.log(1 + r))
+                )
+                volle_raten = ops.floor(n)
+                q_k = (1 + r) ** volle_raten
+                restschuld = ops.where(r == 0, betrag - volle_raten * rate, ops.div(betrag * q_k * r - rate * (q_k - 1), r))
+                return ops.where((volle_raten > 0) & (restschuld <= self.RESTSCHULD_TOLERANZ), volle_raten, volle_raten + 1)
+            
+            return batch_apply(
+                laufzeit,
+                columns,
+                invalid=lambda betrag, zins, rate: (rate <= 0) | ((zins > 0) & (rate <= betrag * zins / 100 / 12))
+            )
+        
+        elif command_name == "Effektivzins":
+            # Newton-Verfahren fuer alle Kredite gleichzeitig, bis jeder Monatszins auf 1e-12 genau ist
+            return batch_apply(
+                lambda ops, betrag, rate, monate: effective_annual_rate(ops, solve_monthly_rate(ops, betrag, rate, monate)),
+                columns,
+                invalid=lambda betrag, rate, monate: (betrag <= 0) | (rate <= 0) | (monate < 1)
             )
         
-        raise ValueError(f"Unbekannter Befehl: {command_name}")
\ No newline at end of file
+        return super().exec_batch(command_name, columns)
@@ -0,0 +1,173 @@
+# plugins/credit/grid.py
+
+import csv
+import math
+from typing import Any, Iterator, List, Sequence, TextIO
+
+try:
+    import numpy as np
+except ImportError:  # NumPy ist optional, ohne NumPy wird jede Zelle einzeln berechnet
+    np = None
+
+from plugins.credit.schedule import annuity
+
+# Obergrenze fuer die Anzahl der Zellen einer Ratenmatrix
+MAX_GRID_CELLS = 1000000
+
+
+def value_range(von: float, bis: float, schritt: float) -> List[float]:
+    """
+    Erzeugt die Werte von, von + schritt, ... bis einschliesslich bis.
+
+    Die Werte werden aus dem Index berechnet (nicht aufsummiert) und auf
+    zehn Nachkommastellen gerundet, damit 0.1-Schritte ohne Rundungsreste
+    angezeigt werden.
+
+    Args:
+        von: Startwert
+        bis: Endwert (>= von)
+        schritt: Schrittweite (> 0)
+
+    Returns:
+        List[float]: Die Werte des Bereichs
+    """
+    if schritt <= 0:
+        raise ValueError("Die Schrittweite muss positiv sein.")
+    if bis < von:
+        raise ValueError("Das Ende des Bereichs darf nicht kleiner als der Anfang sein.")
+
+    anzahl = math.floor((bis - von) / schritt + 1e-9) + 1
+    if anzahl > MAX_GRID_CELLS:
+        raise ValueError(f"Der Bereich enthaelt zu viele Werte (hoechstens {MAX_GRID_CELLS}).")
+    return [round(von + i * schritt, 10) for i in range(anzahl)]
+
+
+def rate_matrix(kreditbetrag: float, zinssaetze: Sequence[float], laufzeiten: Sequence[int]) -> Any:
+    """
+    Berechnet die Monatsraten fuer alle Kombinationen aus Zinssatz und Laufzeit.
+
+    Mit NumPy wird die Annuitaetenformel in einem Durchlauf auf die ganze
+    Matrix angewendet (Zinssaetze als Spalten-, Laufzeiten als Zeilenvektor);
+    ohne NumPy wird annuity fuer jede Zelle aufgerufen. Beide Wege runden
+    wie der Tilgungsplan auf Cent.
+
+    Args:
+        kreditbetrag: Der Kreditbetrag
+        zinssaetze: Jahreszinssaetze in Prozent (Zeilen der Matrix)
+        laufzeiten: Laufzeiten in Monaten (Spalten der Matrix)
+
+    Returns:
+        Any: Matrix Zinssaetze x Laufzeiten (NumPy-Array oder Liste von Listen)
+    """
+    if np is None:
+        return [[annuity(kreditbetrag, zins, monate) for monate in laufzeiten] for zins in zinssaetze]
+
+    r = np.asarray(zinssaetze, dtype=float)[:, np.newaxis] / 100 / 12
+    monate = np.asarray(laufzeiten, dtype=float)[np.newaxis, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuitaet = np.where(r == 0, kreditbetrag / monate, kreditbetrag * r / (1 - (1 + r) ** -monate))
+    return np.rint(annuitaet * 100) / 100
+
+
+class RateGrid:
+    """
+    Ratenmatrix eines Kredits: eine Zeile pro Zinssatz, eine Spalte pro Laufzeit.
+
+    Die Matrix wird beim Erzeugen vollstaendig berechnet; Seiten, Export und
+    Batch-Ausgabe lesen nur noch daraus.
+    """
+
+    def __init__(self, kreditbetrag: float, zinssaetze: Sequence[float], laufzeiten: Sequence[int]):
+        """
+        Initialisiert eine neue Ratenmatrix.
+
+        Args:
+            kreditbetrag: Der Kreditbetrag
+            zinssaetze: Jahreszinssaetze in Prozent
+            laufzeiten: Laufzeiten in Monaten (> 0)
+        """
+        if len(zinssaetze) * len(laufzeiten) > MAX_GRID_CELLS:
+            raise ValueError(f"Die Ratenmatrix ist zu gross (hoechstens {MAX_GRID_CELLS} Zellen).")
+
+        self.kreditbetrag = kreditbetrag
+        self.zinssaetze = list(zinssaetze)
+        self.laufzeiten = list(laufzeiten)
+        self.matrix = rate_matrix(kreditbetrag, self.zinssaetze, self.laufzeiten)
+
+    @property
+    def columns(self) -> List[str]:
+        """Spaltenueberschriften fuer Tabelle und CSV-Export."""
+        return ["Zinssatz"] + [f"{monate} Monate" for monate in self.laufzeiten]
+
+    @property
+    def count(self) -> int:
+        """Anzahl der Zeilen (Zinssaetze)."""
+        return len(self.zinssaetze)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def row(self, index: int) -> List[float]:
+        """
+        Gibt eine Zeile der Matrix mit dem Zinssatz als erstem Wert zurueck.
+
+        Args:
+            index: Nummer der Zeile (ab 0)
+
+        Returns:
+            List[float]: Zinssatz, gefolgt von den Raten je Laufzeit
+        """
+        raten = self.matrix[index]
+        return [self.zinssaetze[index]] + (raten.tolist() if hasattr(raten, "tolist") else list(raten))
+
+    def __iter__(self) -> Iterator[List[float]]:
+        return (self.row(index) for index in range(self.count))
+
+    def iter_rows(self) -> Iterator[List[float]]:
+        """Zeilen fuer die Batch-Ausgabe (eine Ausgabezeile pro Zinssatz)."""
+        return iter(self)
+
+    def page(self, page_index: int, page_size: int = 100) -> List[List[float]]:
+        """
+        Gibt eine Seite der Matrix zurueck.
+
+        Args:
+            page_index: Nummer der Seite (ab 0)
+            page_size: Anzahl der Zinssaetze pro Seite
+
+        Returns:
+            List[List[float]]: Zeilen der Seite (leer hinter dem Ende)
+        """
+        start = page_index * page_size
+        return [self.row(index) for index in range(start, min(start + page_size, self.count))]
+
+    def write_csv(self, stream: TextIO, delimiter: str = ",") -> int:
+        """
+        Schreibt die Matrix als CSV mit Kopfzeile.
+
+        Args:
+            stream: Der Ausgabestrom
+            delimiter: Trennzeichen
+
+        Returns:
+            int: Anzahl der geschriebenen Zeilen
+        """
+        writer = csv.writer(stream, delimiter=delimiter, lineterminator="\n")
+        writer.writerow(self.columns)
+        writer.writerows(self)
+        return self.count
+
+    def summary(self) -> str:
+        """Kurzbeschreibung mit Groesse der Matrix und Spanne der Raten."""
+        if np is not None:
+            kleinste, groesste = float(self.matrix.min()), float(self.matrix.max())
+        else:
+            kleinste = min(min(zeile) for zeile in self.matrix)
+            groesste = max(max(zeile) for zeile in self.matrix)
+        return (
+            f"{self.count} Zinssaetze x {len(self.laufzeiten)} Laufzeiten, "
+            f"Raten {kleinste:.2f} € bis {groesste:.2f} €"
+        )
+
+    def __str__(self) -> str:
+        return self.summary()
@@ -0,0 +1,102 @@
+# plugins/credit/interest.py
+
+from typing import Any, Tuple
+
+# Genauigkeit des Monatszinses und Obergrenze der Iterationen
+RATE_TOLERANCE = 1e-12
+MAX_ITERATIONS = 100
+
+# Unterhalb von |n * r| wird die Ableitung des Rentenbarwertfaktors per Reihe berechnet
+_SERIES_LIMIT = 1e-5
+
+
+def annuity_factor(ops: Any, r: Any, laufzeit: Any) -> Tuple[Any, Any]:
+    """
+    Rentenbarwertfaktor a(r) = (1 - (1 + r)^-n) / r und seine Ableitung.
+
+    Mit log1p/expm1 bleibt a(r) auch fuer sehr kleine Zinssaetze genau;
+    bei r = 0 ist a = n und a' = -n (n + 1) / 2.
+
+    Args:
+        ops: Operations-Namensraum aus core.vectorize
+        r: Monatszins als Dezimalzahl (> -1)
+        laufzeit: Anzahl der Monatsraten n
+
+    Returns:
+        Tuple: (a(r), a'(r))
+    """
+    n = laufzeit
+    ln_q = ops.log1p(r)
+    diskont = ops.exp(-n * ln_q)
+    faktor = ops.where(r == 0, n, ops.div(-ops.expm1(-n * ln_q), r))
+
+    # a'(r) = (n (1 + r)^-(n+1) - a(r)) / r, nahe 0 als Taylorreihe
+    reihe = -n * (n + 1) / 2 + n * (n + 1) * (n + 2) / 3 * r
+    exakt = ops.div(n * diskont / (1 + r) - faktor, r)
+    ableitung = ops.where(ops.abs(n * r) < _SERIES_LIMIT, reihe, exakt)
+    return faktor, ableitung
+
+
+def solve_monthly_rate(ops: Any, kreditbetrag: Any, rate: Any, laufzeit: Any) -> Any:
+    """
+    Loest die Annuitaetengleichung K = R * a(r) nach dem Monatszins r auf.
+
+    Newton-Verfahren mit analytischer Ableitung fuer f(r) = R / K - 1 / a(r);
+    der Kehrwert 1 / a(r) (die Rate je Euro Kredit) ist in r nahezu linear,
+    so dass auch hohe Zinssaetze in wenigen Schritten konvergieren. Ein
+    Einschlussintervall sichert das Verfahren ab: Verlaesst ein
+    Newton-Schritt das Intervall, wird stattdessen halbiert. Die Formeln
+    arbeiten mit einzelnen Zahlen wie mit ganzen NumPy-Spalten.
+
+    Args:
+        ops: Operations-Namensraum aus core.vectorize
+        kreditbetrag: Auszahlungsbetrag K (> 0)
+        rate: Monatsrate R (> 0)
+        laufzeit: Anzahl der Monatsraten n (>= 1)
+
+    Returns:
+        Any: Monatszins r als Dezimalzahl (negativ, wenn n * R < K)
+    """
+    summe = rate * laufzeit
+    verhaeltnis = rate / kreditbetrag
+    positiv = summe > kreditbetrag
+
+    # Einschluss f(unten) >= 0 >= f(oben): fuer r < 0 ist a(r) >= n / (1 + r), fuer r > 0 ist a(r) < 1 / r
+    unten = ops.where(positiv, 0.0, summe / kreditbetrag - 1)
+    oben = ops.where(positiv, verhaeltnis, 0.0)
+
+    # 1 / a(r) ist konvex: von der oberen Grenze aus naehert sich Newton monoton von oben
+    r = ops.where(summe == kreditbetrag, 0.0, oben)
+    aktiv = summe != kreditbetrag
+
+    for _ in range(MAX_ITERATIONS):
+        faktor, ableitung = annuity_factor(ops, r, laufzeit)
+        f = verhaeltnis - 1 / faktor
+        unten = ops.where(f > 0, r, unten)
+        oben = ops.where(f < 0, r, oben)
+
+        # f'(r) = a'(r) / a(r)^2
+        newton = r - ops.div(f * faktor * faktor, ableitung)
+        neu = ops.where((newton >= unten) & (newton <= oben), newton, (unten + oben) / 2)
+        schritt = ops.abs(neu - r)
+        r = ops.where(aktiv, neu, r)
+
+        aktiv = aktiv & (schritt > RATE_TOLERANCE)
+        if not ops.any(aktiv):
+            break
+
+    return r
+
+
+def effective_annual_rate(ops: Any, r: Any) -> Any:
+    """
+    Effektiver Jahreszins in Prozent bei monatlicher Verzinsung: ((1 + r)^12 - 1) * 100.
+
+    Args:
+        ops: Operations-Namensraum aus core.vectorize
+        r: Monatszins als Dezimalzahl
+
+    Returns:
+        Any: Effektiver Jahreszins in Prozent
+    """
+    return ops.expm1(12 * ops.log1p(r)) * 100
@@ -0,0 +1,380 @@
+# plugins/credit/schedule.py
+
+import csv
+from decimal import Decimal
+from itertools import islice
+from typing import Any, Iterator, List, NamedTuple, Optional, Sequence, TextIO, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy ist optional, ohne NumPy wird jeder Plan einzeln erzeugt
+    np = None
+
+from core.money import MoneyContext
+
+
+class ScheduleRow(NamedTuple):
+    """Eine Zeile des Tilgungsplans (Betraege in Euro, auf Cent gerundet)."""
+
+    monat: int
+    rate: float
+    zinsen: float
+    tilgung: float
+    restschuld: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.monat:>4}: Rate {self.rate:.2f} €, Zinsen {self.zinsen:.2f} €, "
+            f"Tilgung {self.tilgung:.2f} €, Restschuld {self.restschuld:.2f} €"
+        )
+
+
+# Spaltennamen fuer den CSV-Export
+SCHEDULE_COLUMNS = list(ScheduleRow._fields)
+
+
+def _cent(value: float) -> float:
+    """Rundet auf Cent wie np.rint(value * 100) / 100, damit beide Pfade gleich rechnen."""
+    return round(value * 100) / 100
+
+
+def annuity(kreditbetrag: float, zinssatz: float, laufzeit: int,
+            money: Optional[MoneyContext] = None) -> Any:
+    """
+    Berechnet die auf Cent gerundete Monatsrate eines Annuitaetendarlehens.
+
+    Args:
+        kreditbetrag: Der Kreditbetrag
+        zinssatz: Jahreszinssatz in Prozent
+        laufzeit: Laufzeit in Monaten
+        money: Optionale exakte Rechenart fuer Geldbetraege
+
+    Returns:
+        Any: Die Monatsrate (float, in der Rechenart decimal Decimal)
+    """
+    if money is not None and money.exact:
+        return money.output(_exact_annuity(money.amount(kreditbetrag), zinssatz, laufzeit, money))
+
+    r = zinssatz / 100 / 12
+    if r == 0:
+        return _cent(kreditbetrag / laufzeit)
+    return _cent(kreditbetrag * r / (1 - (1 + r) ** -laufzeit))
+
+
+def _exact_annuity(betrag: Any, zinssatz: float, laufzeit: int, money: MoneyContext) -> Any:
+    """Monatsrate in der exakten Rechenart (Betrag und Ergebnis als Decimal bzw. Cent)."""
+    with money.local():
+        r = money.number(zinssatz) / 100 / 12
+        if r == 0:
+            return money.fraction(betrag, 1, laufzeit)
+        return money.fraction(betrag, r, 1 - (1 + r) ** -laufzeit)
+
+
+def iter_schedule(kreditbetrag: float, zinssatz: float, laufzeit: int,
+                  money: Optional[MoneyContext] = None) -> Iterator[ScheduleRow]:
+    """
+    Erzeugt den Tilgungsplan Monat fuer Monat.
+
+    Die Zinsen werden monatlich auf Cent gerundet; die letzte Rate gleicht
+    die verbleibende Restschuld aus. In einer exakten Rechenart wird mit
+    Decimal bzw. ganzen Cent und deren Rundungsregel gerechnet.
+
+    Args:
+        kreditbetrag: Der Kreditbetrag
+        zinssatz: Jahreszinssatz in Prozent
+        laufzeit: Laufzeit in Monaten
+        money: Optionale exakte Rechenart fuer Geldbetraege
+
+    Returns:
+        Iterator[ScheduleRow]: Eine Zeile pro Monat
+    """
+    if money is not None and money.exact:
+        return _iter_exact_schedule(kreditbetrag, zinssatz, laufzeit, money)
+    return _iter_float_schedule(kreditbetrag, zinssatz, laufzeit)
+
+
+def _iter_float_schedule(kreditbetrag: float, zinssatz: float, laufzeit: int) -> Iterator[ScheduleRow]:
+    """Tilgungsplan mit Gleitkommazahlen (gleiche Rundung wie schedule_arrays)."""
+    r = zinssatz / 100 / 12
+    rate = annuity(kreditbetrag, zinssatz, laufzeit)
+    restschuld = kreditbetrag
+
+    for monat in range(1, laufzeit + 1):
+        zinsen = _cent(restschuld * r)
+        tilgung = rate - zinsen
+        if monat == laufzeit or tilgung >= restschuld:
+            # Schlussrate: Restschuld vollstaendig tilgen
+            tilgung = restschuld
+        restschuld = _cent(restschuld - tilgung)
+        yield ScheduleRow(monat, _cent(tilgung + zinsen), zinsen, _cent(tilgung), restschuld)
+        if restschuld == 0:
+            return
+
+
+def _iter_exact_schedule(kreditbetrag: float, zinssatz: float, laufzeit: int,
+                         money: MoneyContext) -> Iterator[ScheduleRow]:
+    """Tilgungsplan in der exakten Rechenart; jede Zinszahlung wird mit deren Regel auf Cent gerundet."""
+    satz = money.percent(zinssatz)
+    restschuld = money.amount(kreditbetrag)
+    rate = _exact_annuity(restschuld, zinssatz, laufzeit, money)
+    output = money.output
+
+    for monat in range(1, laufzeit + 1):
+        zinsen = money.fraction(restschuld, satz, 1200)
+        tilgung = rate - zinsen
+        if monat == laufzeit or tilgung >= restschuld:
+            tilgung = restschuld
+        restschuld -= tilgung
+        yield ScheduleRow(monat, output(tilgung + zinsen), output(zinsen), output(tilgung), output(restschuld))
+        if restschuld == 0:
+            return
+
+
+def schedule_arrays(kreditbetrag: Sequence[float], zinssatz: Sequence[float],
+                    laufzeit: Sequence[int]) -> Any:
+    """
+    Berechnet die Tilgungsplaene vieler Kredite gleichzeitig mit NumPy.
+
+    Es wird Monat fuer Monat ueber alle Kredite gerechnet; die Rundung ist
+    dieselbe wie in iter_schedule.
+
+    Args:
+        kreditbetrag: Kreditbetraege
+        zinssatz: Jahreszinssaetze in Prozent
+        laufzeit: Laufzeiten in Monaten (> 0)
+
+    Returns:
+        Tuple: (Anzahl Monate je Kredit, Raten, Zinsen, Tilgung, Restschuld);
+            die Betraege als Matrizen Kredite x Monate
+    """
+    betrag = np.asarray(kreditbetrag, dtype=float)
+    r = np.asarray(zinssatz, dtype=float) / 100 / 12
+    monate = np.asarray(laufzeit, dtype=np.int64)
+    anzahl = len(betrag)
+    laenge = int(monate.max()) if anzahl else 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuitaet = np.where(r == 0, betrag / monate, betrag * r / (1 - (1 + r) ** -monate))
+    rate = np.rint(annuitaet * 100) / 100
+
+    raten = np.zeros((anzahl, laenge))
+    zinsen = np.zeros((anzahl, laenge))
+    tilgung = np.zeros((anzahl, laenge))
+    restschuld = np.zeros((anzahl, laenge))
+    dauer = np.zeros(anzahl, dtype=np.int64)
+
+    rest = betrag.copy()
+    aktiv = monate > 0
+    for m in range(laenge):
+        z = np.rint(rest * r * 100) / 100
+        t = rate - z
+        schluss = (m == monate - 1) | (t >= rest)
+        t = np.where(schluss, rest, t)
+        neu = np.rint((rest - t) * 100) / 100
+
+        raten[:, m] = np.rint((t + z) * 100) / 100
+        zinsen[:, m] = z
+        tilgung[:, m] = np.rint(t * 100) / 100
+        restschuld[:, m] = neu
+
+        dauer += aktiv
+        rest = np.where(aktiv, neu, rest)
+        aktiv &= ~schluss & (neu != 0)
+        if not aktiv.any():
+            break
+
+    return dauer, raten, zinsen, tilgung, restschuld
+
+
+class AmortizationSchedule:
+    """
+    Tilgungsplan eines Kredits, dessen Zeilen erst bei Bedarf erzeugt werden.
+
+    Gespeichert werden nur die Kreditdaten; Seiten, Export und Batch-Ausgabe
+    laufen ueber denselben Generator. Plaene aus einem ScheduleBlock holen
+    ihre Zeilen aus dessen vektorisiert berechneten Spalten.
+    """
+
+    def __init__(self, kreditbetrag: float, zinssatz: float, laufzeit: int,
+                 block: Optional["ScheduleBlock"] = None, index: int = 0,
+                 money: Optional[MoneyContext] = None):
+        self.kreditbetrag = kreditbetrag
+        self.zinssatz = zinssatz
+        self.laufzeit = laufzeit
+        self.money = money if money is not None and money.exact else None
+        self.rate = annuity(kreditbetrag, zinssatz, laufzeit, self.money)
+        self._block = block
+        self._index = index
+        self._count: Optional[int] = None
+        self._zinsen_gesamt: Optional[float] = None
+
+    def __iter__(self) -> Iterator[ScheduleRow]:
+        if self._block is not None:
+            return self._block.rows(self._index)
+        return iter_schedule(self.kreditbetrag, self.zinssatz, self.laufzeit, self.money)
+
+    def iter_rows(self) -> Iterator[ScheduleRow]:
+        """Zeilen fuer die Batch-Ausgabe (eine Ausgabezeile pro Monat)."""
+        return iter(self)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def count(self) -> int:
+        """Anzahl der Monatsraten."""
+        if self._count is None:
+            self._summarize()
+        return self._count
+
+    @property
+    def zinsen_gesamt(self) -> float:
+        """Summe aller Zinszahlungen."""
+        if self._zinsen_gesamt is None:
+            self._summarize()
+        return self._zinsen_gesamt
+
+    def _summarize(self) -> None:
+        """Ermittelt Anzahl der Raten und Gesamtzinsen in einem Durchlauf."""
+        count = 0
+        zinsen = 0
+        for row in self:
+            count += 1
+            zinsen += row.zinsen
+        self._count = count
+        # Decimal-Summen sind exakt, Gleitkommasummen werden auf Cent gerundet
+        self._zinsen_gesamt = zinsen if isinstance(zinsen, Decimal) else _cent(zinsen)
+
+    def page(self, page_index: int, page_size: int = 100) -> List[ScheduleRow]:
+        """
+        Gibt eine Seite des Tilgungsplans zurueck.
+
+        Args:
+            page_index: Nummer der Seite (ab 0)
+            page_size: Anzahl der Monate pro Seite
+
+        Returns:
+            List[ScheduleRow]: Zeilen der Seite (leer hinter dem Ende)
+        """
+        start = page_index * page_size
+        return list(islice(self, start, start + page_size))
+
+    def write_csv(self, stream: TextIO, delimiter: str = ",") -> int:
+        """
+        Schreibt den Tilgungsplan zeilenweise als CSV.
+
+        Args:
+            stream: Der Ausgabestrom
+            delimiter: Trennzeichen
+
+        Returns:
+            int: Anzahl der geschriebenen Monatszeilen
+        """
+        writer = csv.writer(stream, delimiter=delimiter, lineterminator="\n")
+        writer.writerow(SCHEDULE_COLUMNS)
+        count = 0
+        for row in self:
+            writer.writerow(row)
+            count += 1
+        return count
+
+    def summary(self) -> str:
+        """Kurzbeschreibung mit Rate, Anzahl der Raten, Schlussrate und Gesamtzinsen."""
+        letzte = self.page(self.count - 1, 1)[0] if self.count else None
+        schlussrate = f", Schlussrate {letzte.rate:.2f} €" if letzte and letzte.rate != self.rate else ""
+        return (
+            f"Rate {self.rate:.2f} €, {self.count} Raten{schlussrate}, "
+            f"Zinsen gesamt {self.zinsen_gesamt:.2f} €"
+        )
+
+    def __str__(self) -> str:
+        return self.summary()
+
+
+class ScheduleBlock:
+    """
+    Tilgungsplaene vieler Kredite fuer den Batch-Modus.
+
+    Mit NumPy werden jeweils BLOCK_SIZE Kredite gemeinsam berechnet, und zwar
+    erst, wenn ihre Zeilen gelesen werden. Da die Ausgabe die Kredite der
+    Reihe nach schreibt, liegt immer nur ein Block im Speicher.
+    """
+
+    # Kredite pro NumPy-Block (begrenzt die Matrizen auf wenige MB)
+    BLOCK_SIZE = 1024
+
+    def __init__(self, kreditbetrag: Sequence[Any], zinssatz: Sequence[Any], laufzeit: Sequence[Any],
+                 money: Optional[MoneyContext] = None):
+        """
+        Initialisiert einen neuen Block von Tilgungsplaenen.
+
+        Args:
+            kreditbetrag: Spalte der Kreditbetraege
+            zinssatz: Spalte der Jahreszinssaetze in Prozent
+            laufzeit: Spalte der Laufzeiten in Monaten
+            money: Optionale exakte Rechenart; die Plaene werden dann einzeln erzeugt
+        """
+        self.money = money if money is not None and money.exact else None
+        self.params: List[Optional[Tuple[float, float, int]]] = []
+        for values in zip(kreditbetrag, zinssatz, laufzeit):
+            try:
+                betrag, zins, monate = float(values[0]), float(values[1]), int(float(values[2]))
+            except (TypeError, ValueError):
+                self.params.append(None)
+                continue
+            self.params.append((betrag, zins, monate) if monate > 0 and betrag > 0 else None)
+
+        self._valid = [p for p in self.params if p is not None]
+        self._cache_index: Optional[int] = None
+        self._cache: Any = None
+
+    def schedules(self) -> List[Optional[AmortizationSchedule]]:
+        """
+        Gibt je Kredit einen Tilgungsplan zurueck, None fuer ungueltige Zeilen.
+
+        Returns:
+            List[Optional[AmortizationSchedule]]: Tilgungsplaene in Eingabereihenfolge
+        """
+        results: List[Optional[AmortizationSchedule]] = []
+        index = 0
+        for p in self.params:
+            if p is None:
+                results.append(None)
+                continue
+            block = self if np is not None and self.money is None else None
+            results.append(AmortizationSchedule(*p, block=block, index=index, money=self.money))
+            index += 1
+        return results
+
+    def rows(self, index: int) -> Iterator[ScheduleRow]:
+        """
+        Liefert die Zeilen des index-ten gueltigen Kredits aus dem NumPy-Block.
+
+        Args:
+            index: Position unter den gueltigen Krediten
+
+        Returns:
+            Iterator[ScheduleRow]: Eine Zeile pro Monat
+        """
+        block_index, position = divmod(index, self.BLOCK_SIZE)
+        dauer, raten, zinsen, tilgung, restschuld = self._block_arrays(block_index)
+        n = int(dauer[position])
+        columns = [raten[position, :n].tolist(), zinsen[position, :n].tolist(),
+                   tilgung[position, :n].tolist(), restschuld[position, :n].tolist()]
+        return map(ScheduleRow._make, zip(range(1, n + 1), *columns))
+
+    def _block_arrays(self, block_index: int) -> Any:
+        """Ergebnis von schedule_arrays fuer einen Block (der zuletzt berechnete bleibt gespeichert)."""
+        if self._cache_index != block_index:
+            start = block_index * self.BLOCK_SIZE
+            self._cache = schedule_arrays(*zip(*self._valid[start:start + self.BLOCK_SIZE]))
+            self._cache_index = block_index
+        return self._cache
+
+    def __getstate__(self):
+        # Nur die Kreditparameter uebertragen (z.B. aus einem Worker-Prozess): der
+        # Empfaenger berechnet die Bloecke beim Lesen neu, statt alle Plaene zu kopieren
+        state = self.__dict__.copy()
+        state["_cache_index"] = None
+        state["_cache"] = None
+        return state
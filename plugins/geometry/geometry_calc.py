@@ -1,7 +1,11 @@
 ﻿# plugins/geometry/geometry_calc.py
 
-from typing import List, Tuple, Any, Dict, Optional
-from core.plugin_interface import IPlugin, PluginInfo, Command
+from typing import List, Tuple, Any, Dict, Optional, Sequence
+from core.plugin_interface import IPlugin, PluginInfo, Command, CalculationResult
+from core.rounding import format_significant, round_significant
+from core.vectorize import SCALAR_OPS, batch_apply
+from plugins.geometry.polygon import iter_vertex_chunks, measure_polygon
+from plugins.geometry.triangles import solve_triangles, ssw_third_sides
 import math
 
 class GeometryCalculator(IPlugin):
@@ -12,10 +16,12 @@ class GeometryCalculator(IPlugin):
         self.name = "Geometrie"
         self.commands = [
             # Universeller Dreiecksrechner
-            Command("Dreieck", ["Berechnungsart", "Seite a", "Seite b", "Seite c", "Winkel A (Grad)", "Winkel B (Grad)", "Winkel C (Grad)", "Hoehe h"]),
+            Command("Dreieck", ["Berechnungsart", "Seite a", "Seite b", "Seite c", "Winkel A (Grad)", "Winkel B (Grad)", "Winkel C (Grad)", "Hoehe h"], cacheable=True),
             # Weitere Geometrie-Funktionen
-            Command("Kreis", ["Radius"]),
-            Command("Parallelogramm", ["Seite a", "Seite b", "Hoehe h"])
+            Command("Kreis", ["Radius"], cacheable=True),
+            Command("Parallelogramm", ["Seite a", "Seite b", "Hoehe h"], cacheable=True),
+            # Beliebige Polygone (eingetippt oder aus CSV-/Binaerdatei)
+            Command("Polygon", ["Eckpunkte (x,y; x,y; ... oder Dateipfad)"])
         ]
     
     def load(self) -> None:
@@ -31,7 +37,7 @@ class GeometryCalculator(IPlugin):
         """
         return PluginInfo(self.name, self.commands)
     
-    def exec(self, command_name: str, params: List[Any]) -> Tuple[str, Any]:
+    def exec(self, command_name: str, params: List[Any]) -> CalculationResult:
         """
         Fuehrt einen Befehl mit den gegebenen Parametern aus.
         
@@ -40,7 +46,7 @@ class GeometryCalculator(IPlugin):
             params: Liste der Parameter
 
         Returns:
-            Tuple[str, Any]: (Formatierter Text der Berechnung, Ergebniswert)
+            CalculationResult: Ergebniswert mit verzoegert erzeugtem Anzeigetext
         """
         if command_name == "Dreieck":
             # Dreiecksberechnung mit flexibler Eingabe
@@ -100,9 +106,9 @@ class GeometryCalculator(IPlugin):
                 return self._calculate_triangle_wsw(winkel_a, seite_c, winkel_b)
                 
             elif berechnungsart == "SSW (zwei Seiten, gegenueberliegender Winkel)":
-                if seite_a is None or seite_b is None or winkel_c is None:
-                    raise ValueError("Fuer die SSW-Methode werden zwei Seiten und der gegenueberliegende Winkel benoetigt.")
-                return self._calculate_triangle_ssw(seite_a, seite_b, winkel_c)
+                if seite_a is None or seite_b is None or winkel_a is None:
+                    raise ValueError("Fuer die SSW-Methode werden die Seiten a, b und der Winkel A (gegenueber von a) benoetigt.")
+                return self._calculate_triangle_ssw(seite_a, seite_b, winkel_a)
                 
             elif berechnungsart == "Grundseite und Hoehe":
                 # Annahme: Seite a ist die Grundseite und Hoehe h ist gegeben
@@ -128,13 +134,15 @@ class GeometryCalculator(IPlugin):
             flaeche = math.pi * radius ** 2
             
             # Runden auf 6 signifikante Stellen
-            umfang = self._round_significant(umfang, 6)
-            flaeche = self._round_significant(flaeche, 6)
+            umfang = round_significant(umfang, 6)
+            flaeche = round_significant(flaeche, 6)
             
-            return (
-                f"Geometrie Kreis: r={radius} → "
-                f"Umfang={umfang}, Flaeche={flaeche}",
-                (umfang, flaeche)
+            return CalculationResult(
+                (umfang, flaeche),
+                lambda: (
+                    f"Geometrie Kreis: r={radius} → "
+                    f"Umfang={umfang}, Flaeche={flaeche}"
+                )
             )
             
         elif command_name == "Parallelogramm":
@@ -156,18 +164,79 @@ class GeometryCalculator(IPlugin):
             flaeche = a * h
             
             # Runden auf 6 signifikante Stellen
-            umfang = self._round_significant(umfang, 6)
-            flaeche = self._round_significant(flaeche, 6)
+            umfang = round_significant(umfang, 6)
+            flaeche = round_significant(flaeche, 6)
+            
+            return CalculationResult(
+                (umfang, flaeche),
+                lambda: (
+                    f"Geometrie Parallelogramm: a={a}, b={b}, h={h} → "
+                    f"Umfang={umfang}, Flaeche={flaeche}"
+                )
+            )
+        
+        elif command_name == "Polygon":
+            # Eckpunkte werden blockweise gelesen, grosse Dateien ueber ein Memory-Mapping
+            ergebnis = measure_polygon(iter_vertex_chunks(str(params[0])))
             
-            return (
-                f"Geometrie Parallelogramm: a={a}, b={b}, h={h} → "
-                f"Umfang={umfang}, Flaeche={flaeche}",
-                (umfang, flaeche)
+            # Werte bleiben ungerundet, gerundet wird nur die Anzeige
+            # (Schwerpunkt mit mehr Stellen, damit Landeskoordinaten lesbar bleiben)
+            return CalculationResult(
+                ergebnis,
+                lambda: (
+                    f"Polygon mit {ergebnis['eckpunkte']} Eckpunkten:\n"
+                    f"Flaeche: {format_significant(ergebnis['flaeche'])}\n"
+                    f"Umfang: {format_significant(ergebnis['umfang'])}\n"
+                    f"Schwerpunkt: ({format_significant(ergebnis['schwerpunkt_x'], 10)}, "
+                    f"{format_significant(ergebnis['schwerpunkt_y'], 10)})\n"
+                    f"Konvex: {'ja' if ergebnis['konvex'] else 'nein'}\n"
+                    f"Orientierung: {ergebnis['orientierung']}"
+                )
             )
         
         raise ValueError(f"Unbekannter Befehl: {command_name}")
     
-    def _calculate_triangle_sss(self, a: float, b: float, c: float) -> Tuple[str, Dict[str, float]]:
+    def exec_batch(self, command_name: str, columns: List[Sequence[Any]]) -> Any:
+        """
+        Fuehrt einen Befehl vektorisiert fuer ganze Parameterspalten aus.
+        
+        Args:
+            command_name: Name des auszufuehrenden Befehls
+            columns: Je Parameter eine Spalte (Liste oder NumPy-Array)
+
+        Returns:
+            Any: Tupel von Ergebnisspalten (Umfang, Flaeche; beim Dreieck die Spalten
+                aus triangles.BATCH_KEYS); ungueltige Zeilen sind NaN
+        """
+        if command_name == "Dreieck":
+            # Zeilen werden nach Berechnungsart gruppiert und je Gruppe vektorisiert geloest
+            return solve_triangles(columns)
+
+        elif command_name == "Kreis":
+            return batch_apply(
+                lambda ops, r: (
+                    ops.round_significant(2 * ops.pi * r, 6),
+                    ops.round_significant(ops.pi * r ** 2, 6)
+                ),
+                columns,
+                invalid=lambda r: r <= 0,
+                outputs=2
+            )
+            
+        elif command_name == "Parallelogramm":
+            return batch_apply(
+                lambda ops, a, b, h: (
+                    ops.round_significant(2 * (a + b), 6),
+                    ops.round_significant(a * h, 6)
+                ),
+                columns,
+                invalid=lambda a, b, h: (a <= 0) | (b <= 0) | (h <= 0) | ((h > a) & (h > b)),
+                outputs=2
+            )
+        
+        return super().exec_batch(command_name, columns)
+    
+    def _calculate_triangle_sss(self, a: float, b: float, c: float) -> CalculationResult:
         """
         Berechnet alle Daten eines Dreiecks aus drei Seiten (SSS).
         
@@ -177,7 +246,7 @@ class GeometryCalculator(IPlugin):
             c: Seite c
             
         Returns:
-            Tuple[str, Dict[str, float]]: (Formatierter Text, Ergebniswerte)
+            CalculationResult: Ergebniswerte mit verzoegert erzeugtem Text
         """
         # Pruefen, ob ein Dreieck konstruierbar ist
         if a <= 0 or b <= 0 or c <= 0:
@@ -218,39 +287,40 @@ class GeometryCalculator(IPlugin):
         
         # Ergebnisse runden
         results = {
-            "a": self._round_significant(a, 6),
-            "b": self._round_significant(b, 6),
-            "c": self._round_significant(c, 6),
-            "umfang": self._round_significant(umfang, 6),
-            "flaeche": self._round_significant(flaeche, 6),
-            "alpha_grad": self._round_significant(alpha_deg, 6),
-            "beta_grad": self._round_significant(beta_deg, 6),
-            "gamma_grad": self._round_significant(gamma_deg, 6),
-            "hoehe_a": self._round_significant(ha, 6),
-            "hoehe_b": self._round_significant(hb, 6),
-            "hoehe_c": self._round_significant(hc, 6),
-            "inkreisradius": self._round_significant(inradius, 6),
-            "umkreisradius": self._round_significant(umkreisradius, 6)
+            "a": round_significant(a, 6),
+            "b": round_significant(b, 6),
+            "c": round_significant(c, 6),
+            "umfang": round_significant(umfang, 6),
+            "flaeche": round_significant(flaeche, 6),
+            "alpha_grad": round_significant(alpha_deg, 6),
+            "beta_grad": round_significant(beta_deg, 6),
+            "gamma_grad": round_significant(gamma_deg, 6),
+            "hoehe_a": round_significant(ha, 6),
+            "hoehe_b": round_significant(hb, 6),
+            "hoehe_c": round_significant(hc, 6),
+            "inkreisradius": round_significant(inradius, 6),
+            "umkreisradius": round_significant(umkreisradius, 6)
         }
         
-        # Formatierte Ausgabe
-        output = (
-            f"Dreieck mit Seiten a={a}, b={b}, c={c}:\n"
-            f"Umfang: {results['umfang']}\n"
-            f"Flaeche: {results['flaeche']}\n"
-            f"Winkel A: {results['alpha_grad']}Grad\n"
-            f"Winkel B: {results['beta_grad']}Grad\n"
-            f"Winkel C: {results['gamma_grad']}Grad\n"
-            f"Hoehe ha: {results['hoehe_a']}\n"
-            f"Hoehe hb: {results['hoehe_b']}\n"
-            f"Hoehe hc: {results['hoehe_c']}\n"
-            f"Inkreisradius: {results['inkreisradius']}\n"
-            f"Umkreisradius: {results['umkreisradius']}"
+        # Formatierte Ausgabe erst bei Bedarf erzeugen
+        return CalculationResult(
+            results,
+            lambda: (
+                f"Dreieck mit Seiten a={format_significant(a)}, b={format_significant(b)}, c={format_significant(c)}:\n"
+                f"Umfang: {results['umfang']}\n"
+                f"Flaeche: {results['flaeche']}\n"
+                f"Winkel A: {results['alpha_grad']}Grad\n"
+                f"Winkel B: {results['beta_grad']}Grad\n"
+                f"Winkel C: {results['gamma_grad']}Grad\n"
+                f"Hoehe ha: {results['hoehe_a']}\n"
+                f"Hoehe hb: {results['hoehe_b']}\n"
+                f"Hoehe hc: {results['hoehe_c']}\n"
+                f"Inkreisradius: {results['inkreisradius']}\n"
+                f"Umkreisradius: {results['umkreisradius']}"
+            )
         )
-        
-        return output, results
     
-    def _calculate_triangle_sws(self, a: float, gamma_deg: float, b: float) -> Tuple[str, Dict[str, float]]:
+    def _calculate_triangle_sws(self, a: float, gamma_deg: float, b: float) -> CalculationResult:
         """
         Berechnet alle Daten eines Dreiecks aus zwei Seiten und dem eingeschlossenen Winkel (SWS).
         
@@ -260,7 +330,7 @@ class GeometryCalculator(IPlugin):
             b: Seite b
             
         Returns:
-            Tuple[str, Dict[str, float]]: (Formatierter Text, Ergebniswerte)
+            CalculationResult: Ergebniswerte mit verzoegert erzeugtem Text
         """
         if a <= 0 or b <= 0:
             raise ValueError("Alle Seiten muessen positiv sein.")
@@ -277,7 +347,7 @@ class GeometryCalculator(IPlugin):
         # Rest der Berechnung mit SSS durchfuehren
         return self._calculate_triangle_sss(a, b, c)
     
-    def _calculate_triangle_wsw(self, alpha_deg: float, c: float, beta_deg: float) -> Tuple[str, Dict[str, float]]:
+    def _calculate_triangle_wsw(self, alpha_deg: float, c: float, beta_deg: float) -> CalculationResult:
         """
         Berechnet alle Daten eines Dreiecks aus zwei Winkeln und der eingeschlossenen Seite (WSW).
         
@@ -287,7 +357,7 @@ class GeometryCalculator(IPlugin):
             beta_deg: Winkel B in Grad
             
         Returns:
-            Tuple[str, Dict[str, float]]: (Formatierter Text, Ergebniswerte)
+            CalculationResult: Ergebniswerte mit verzoegert erzeugtem Text
         """
         if c <= 0:
             raise ValueError("Die Seite muss positiv sein.")
@@ -313,34 +383,52 @@ class GeometryCalculator(IPlugin):
         # Rest der Berechnung mit SSS durchfuehren
         return self._calculate_triangle_sss(a, b, c)
     
-    def _calculate_triangle_ssw(self, a: float, b: float, gamma_deg: float) -> Tuple[str, Dict[str, float]]:
+    def _calculate_triangle_ssw(self, a: float, b: float, alpha_deg: float) -> CalculationResult:
         """
-        Berechnet alle Daten eines Dreiecks aus zwei Seiten und dem gegenueberliegenden Winkel (SSW).
+        Berechnet alle Dreiecke aus zwei Seiten und dem Winkel gegenueber der ersten Seite (SSW).
+        
+        Der Fall ist mehrdeutig: je nach Laenge von a gibt es kein, ein
+        oder zwei Dreiecke; es werden alle gueltigen Dreiecke berechnet.
         
         Args:
             a: Seite a
             b: Seite b
-            gamma_deg: Winkel C in Grad (gegenueber von c)
+            alpha_deg: Winkel A in Grad (gegenueber von a)
             
         Returns:
-            Tuple[str, Dict[str, float]]: (Formatierter Text, Ergebniswerte)
+            CalculationResult: Liste der Ergebniswerte aller Loesungen mit verzoegert erzeugtem Text
         """
         if a <= 0 or b <= 0:
             raise ValueError("Alle Seiten muessen positiv sein.")
             
-        if gamma_deg <= 0 or gamma_deg >= 180:
+        if alpha_deg <= 0 or alpha_deg >= 180:
             raise ValueError("Der Winkel muss zwischen 0Grad und 180Grad liegen.")
         
-        # Umrechnung in Bogenmass
-        gamma_rad = math.radians(gamma_deg)
+        # Dritte Seite(n) nach dem Sinussatz, fehlende Loesungen sind NaN
+        anzahl, c1, c2 = ssw_third_sides(SCALAR_OPS, a, b, alpha_deg)
         
-        # Dritte Seite berechnen (Kosinussatz)
-        c = math.sqrt(a**2 + b**2 - 2 * a * b * math.cos(gamma_rad))
+        if anzahl == 0:
+            raise ValueError(
+                f"Mit a={a}, b={b} und A={alpha_deg}Grad ist kein Dreieck moeglich "
+                "(die Seite a ist zu kurz)."
+            )
         
-        # Rest der Berechnung mit SSS durchfuehren
-        return self._calculate_triangle_sss(a, b, c)
+        # Rest der Berechnung je Loesung mit SSS durchfuehren
+        loesungen = [self._calculate_triangle_sss(a, b, c) for c in (c1, c2)[:anzahl]]
+        
+        if len(loesungen) == 1:
+            return CalculationResult([loesungen[0].value], lambda: loesungen[0].text)
+        
+        return CalculationResult(
+            [loesung.value for loesung in loesungen],
+            lambda: (
+                f"SSW ist mehrdeutig: zwei Dreiecke mit a={a}, b={b}, A={alpha_deg}Grad\n\n"
+                f"Loesung 1:\n{loesungen[0].text}\n\n"
+                f"Loesung 2:\n{loesungen[1].text}"
+            )
+        )
     
-    def _calculate_triangle_base_height(self, base: float, height: float) -> Tuple[str, Dict[str, float]]:
+    def _calculate_triangle_base_height(self, base: float, height: float) -> CalculationResult:
         """
         Berechnet grundlegende Daten eines Dreiecks aus Grundseite und Hoehe.
         
@@ -349,7 +437,7 @@ class GeometryCalculator(IPlugin):
             height: Hoehe
             
         Returns:
-            Tuple[str, Dict[str, float]]: (Formatierter Text, Ergebniswerte)
+            CalculationResult: Ergebniswerte mit verzoegert erzeugtem Text
         """
         if base <= 0 or height <= 0:
             raise ValueError("Grundseite und Hoehe muessen positiv sein.")
@@ -359,39 +447,17 @@ class GeometryCalculator(IPlugin):
         
         # Begrenztes Ergebnis, da nicht alle Werte berechenbar sind
         results = {
-            "grundseite": self._round_significant(base, 6),
-            "hoehe": self._round_significant(height, 6),
-            "flaeche": self._round_significant(flaeche, 6)
+            "grundseite": round_significant(base, 6),
+            "hoehe": round_significant(height, 6),
+            "flaeche": round_significant(flaeche, 6)
         }
         
-        # Formatierte Ausgabe
-        output = (
-            f"Dreieck mit Grundseite={base}, Hoehe={height}:\n"
-            f"Flaeche: {results['flaeche']}\n"
-            f"Hinweis: Weitere Werte koennen nicht eindeutig bestimmt werden."
+        # Formatierte Ausgabe erst bei Bedarf erzeugen
+        return CalculationResult(
+            results,
+            lambda: (
+                f"Dreieck mit Grundseite={base}, Hoehe={height}:\n"
+                f"Flaeche: {results['flaeche']}\n"
+                f"Hinweis: Weitere Werte koennen nicht eindeutig bestimmt werden."
+            )
         )
-        
-        return output, results
-    
-    def _round_significant(self, value: float, digits: int) -> float:
-        """
-        Rundet einen Wert auf die angegebene Anzahl signifikanter Stellen.
-        
-        Args:
-            value: Der zu rundende Wert
-            digits: Anzahl der signifikanten Stellen
-
-        Returns:
-            float: Der gerundete Wert
-        """
-        if value == 0:
-            return 0
-        
-        from math import log10, floor
-        
-        # Feststellen der Zehnerpotenz
-        magnitude = floor(log10(abs(value)))
-        
-        # Runden auf die gewuenschte Anzahl signifikanter Stellen
-        factor = 10 ** (digits - 1 - magnitude)
-        return round(value * factor) / factor
\ No newline at end of file
@@ -0,0 +1,393 @@
+# plugins/geometry/polygon.py
+
+import csv
+import math
+import mmap
+import os
+import re
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy ist optional, ohne NumPy wird Eckpunkt fuer Eckpunkt gerechnet
+    np = None
+
+# Anzahl der Eckpunkte, die pro Block gelesen und verarbeitet werden
+CHUNK_VERTICES = 1 << 16
+
+# Dateiendungen, die als Text (CSV) gelesen werden
+TEXT_EXTENSIONS = (".csv", ".txt", ".tsv", ".xy", ".xyz")
+
+# Dateiendungen von Binaerdateien mit x, y als aufeinanderfolgenden float64-Werten (little endian)
+BINARY_EXTENSIONS = (".bin", ".f64")
+
+# Relative Toleranz, unterhalb der zwei Kanten als kollinear gelten; dazu kommt die
+# Rundung der Koordinaten selbst (einige ulp der Groessenordnung des ersten Eckpunkts)
+COLLINEAR_TOLERANCE = 1e-12
+COORDINATE_ULPS = 4
+
+# Zulaessige Abweichung der Gesamtdrehung von 360 Grad bei konvexen Polygonen (Bogenmass)
+TURNING_TOLERANCE = 1e-6
+
+_POINT_SEPARATOR = re.compile(r"[;\n]+")
+_COORD_SEPARATOR = re.compile(r"[,\s]+")
+
+
+def parse_vertices(text: str) -> array:
+    """
+    Liest eingetippte Eckpunkte im Format "x,y; x,y; ...".
+
+    Punkte werden durch Semikolon oder Zeilenumbruch getrennt, die beiden
+    Koordinaten eines Punktes durch Komma oder Leerzeichen.
+
+    Args:
+        text: Die Eckpunkte als Text
+
+    Returns:
+        array: Koordinaten abwechselnd x, y (Typ 'd')
+
+    Raises:
+        ValueError: Wenn ein Punkt nicht aus genau zwei Zahlen besteht
+    """
+    koordinaten = array('d')
+    for punkt in _POINT_SEPARATOR.split(text.strip()):
+        if not punkt.strip():
+            continue
+        werte = _COORD_SEPARATOR.split(punkt.strip())
+        if len(werte) != 2:
+            raise ValueError(f"Ungueltiger Eckpunkt: {punkt.strip()} (erwartet x,y)")
+        try:
+            koordinaten.extend((float(werte[0]), float(werte[1])))
+        except ValueError:
+            raise ValueError(f"Ungueltiger Eckpunkt: {punkt.strip()} (erwartet x,y)")
+    return koordinaten
+
+
+def iter_csv_vertices(path: str, chunk_vertices: int = CHUNK_VERTICES) -> Iterator[array]:
+    """
+    Liest Eckpunkte blockweise aus einer CSV-Datei (Spalten x und y).
+
+    Das Trennzeichen (Semikolon, Tabulator, Komma oder sonst Leerzeichen wie
+    in .xyz-Dateien) wird aus der ersten Zeile erkannt; eine Kopfzeile ohne
+    Zahlen wird uebersprungen, weitere Spalten (z.B. z) werden ignoriert.
+
+    Args:
+        path: Pfad der CSV-Datei
+        chunk_vertices: Eckpunkte pro Block
+
+    Returns:
+        Iterator[array]: Bloecke mit Koordinaten abwechselnd x, y
+    """
+    with open(path, newline="", encoding="utf-8") as stream:
+        erste_zeile = stream.readline()
+        delimiter = next((d for d in (";", "\t", ",") if d in erste_zeile), None)
+        stream.seek(0)
+        zeilen = csv.reader(stream, delimiter=delimiter) if delimiter else (zeile.split() for zeile in stream)
+
+        block = array('d')
+        for nummer, zeile in enumerate(zeilen, 1):
+            if not zeile or not "".join(zeile).strip():
+                continue
+            try:
+                block.extend((float(zeile[0]), float(zeile[1])))
+            except (ValueError, IndexError):
+                if nummer == 1:
+                    continue  # Kopfzeile
+                raise ValueError(f"Ungueltiger Eckpunkt in Zeile {nummer}: {(delimiter or ' ').join(zeile)}")
+            if len(block) >= 2 * chunk_vertices:
+                yield block
+                block = array('d')
+        if block:
+            yield block
+
+
+def iter_binary_vertices(path: str, chunk_vertices: int = CHUNK_VERTICES) -> Iterator[Any]:
+    """
+    Liest Eckpunkte blockweise aus einer Binaerdatei ueber ein Memory-Mapping.
+
+    Die Datei enthaelt x, y abwechselnd als float64 (little endian). Es wird
+    nichts kopiert: die Bloecke sind Sichten auf die eingeblendete Datei, so
+    dass auch Umrisse mit Millionen Eckpunkten mit konstantem Speicher
+    gelesen werden.
+
+    Args:
+        path: Pfad der Binaerdatei
+        chunk_vertices: Eckpunkte pro Block
+
+    Returns:
+        Iterator[Any]: Bloecke (NumPy-Arrays bzw. memoryview vom Typ 'd')
+    """
+    groesse = os.path.getsize(path)
+    if groesse % 16:
+        raise ValueError("Die Binaerdatei muss aus Paaren von float64-Werten (x, y) bestehen.")
+    if groesse == 0:
+        return
+
+    if np is not None:
+        daten = np.memmap(path, dtype="<f8", mode="r")
+        for start in range(0, len(daten), 2 * chunk_vertices):
+            yield daten[start:start + 2 * chunk_vertices]
+        return
+
+    if sys.byteorder != "little":
+        raise ValueError("Binaerdateien werden ohne NumPy nur auf little-endian-Systemen unterstuetzt.")
+
+    with open(path, "rb") as stream, mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as eingeblendet:
+        with memoryview(eingeblendet) as puffer, puffer.cast("d") as werte:
+            for start in range(0, len(werte), 2 * chunk_vertices):
+                with werte[start:start + 2 * chunk_vertices] as block:
+                    yield block
+
+
+def iter_vertex_chunks(source: str, chunk_vertices: int = CHUNK_VERTICES) -> Iterator[Any]:
+    """
+    Liefert die Eckpunkte einer Eingabe blockweise.
+
+    Das Format einer Datei ergibt sich aus ihrer Endung (TEXT_EXTENSIONS
+    bzw. BINARY_EXTENSIONS); andere Endungen werden abgelehnt, statt den
+    Inhalt zu raten.
+
+    Args:
+        source: Dateipfad (CSV/Text oder Binaerdatei) oder eingetippte Eckpunkte
+        chunk_vertices: Eckpunkte pro Block
+
+    Returns:
+        Iterator[Any]: Bloecke mit Koordinaten abwechselnd x, y
+
+    Raises:
+        ValueError: Bei einer Datei mit unbekannter Endung
+    """
+    pfad = source.strip().strip('"')
+    if os.path.isfile(pfad):
+        endung = os.path.splitext(pfad)[1].lower()
+        if endung in TEXT_EXTENSIONS:
+            return iter_csv_vertices(pfad, chunk_vertices)
+        if endung in BINARY_EXTENSIONS:
+            return iter_binary_vertices(pfad, chunk_vertices)
+        raise ValueError(
+            f"Unbekanntes Dateiformat: {endung or os.path.basename(pfad)} "
+            f"(Text: {', '.join(TEXT_EXTENSIONS)}; float64-Binaerdatei: {', '.join(BINARY_EXTENSIONS)})"
+        )
+    return iter([parse_vertices(source)])
+
+
+def _turn(ex0: float, ey0: float, ex1: float, ey1: float, rauschen: float) -> Tuple[float, float, float]:
+    """Kreuzprodukt, Toleranz und Drehwinkel zwischen zwei aufeinanderfolgenden Kanten."""
+    kreuz = ex0 * ey1 - ey0 * ex1
+    l0, l1 = math.hypot(ex0, ey0), math.hypot(ex1, ey1)
+    toleranz = COLLINEAR_TOLERANCE * l0 * l1 + 2 * rauschen * (l0 + l1)
+    return kreuz, toleranz, math.atan2(kreuz, ex0 * ex1 + ey0 * ey1)
+
+
+class PolygonAccumulator:
+    """
+    Berechnet Flaeche, Umfang, Schwerpunkt und Konvexitaet eines Polygons
+    aus einem Strom von Eckpunkten.
+
+    Jeder Block wird einmal durchlaufen; gespeichert werden nur Summen, der
+    erste und der letzte Eckpunkt sowie die erste und die letzte Kante. Die
+    Koordinaten werden auf den ersten Eckpunkt bezogen, damit die
+    Gauss'sche Trapezformel (Shoelace) auch bei grossen
+    Landeskoordinaten genau bleibt. Die Kante vom letzten zum ersten
+    Eckpunkt wird erst in result() ergaenzt. Direkt wiederholte Eckpunkte
+    werden ignoriert: sie bilden keine Kante und zaehlen nicht als Eckpunkt.
+    """
+
+    def __init__(self):
+        """Initialisiert ein leeres Polygon."""
+        self.count = 0
+        self._edges = 0
+        self._origin: Optional[Tuple[float, float]] = None
+        self._noise = 0.0
+        self._last: Tuple[float, float] = (0.0, 0.0)
+        self._first_edge: Optional[Tuple[float, float]] = None
+        self._last_edge: Optional[Tuple[float, float]] = None
+        self._area2 = 0.0
+        self._moment_x = 0.0
+        self._moment_y = 0.0
+        self._perimeter = 0.0
+        self._turning = 0.0
+        self._left = False
+        self._right = False
+
+    def add(self, coords: Any) -> None:
+        """
+        Fuegt einen Block von Eckpunkten hinzu.
+
+        Args:
+            coords: Koordinaten abwechselnd x, y (array('d'), memoryview, Liste oder NumPy-Array)
+        """
+        if len(coords) % 2:
+            raise ValueError("Jeder Eckpunkt braucht eine x- und eine y-Koordinate.")
+        if not len(coords):
+            return
+        if self._origin is None:
+            self._origin = (float(coords[0]), float(coords[1]))
+            self._noise = COORDINATE_ULPS * math.ulp(max(abs(self._origin[0]), abs(self._origin[1])))
+
+        if np is not None:
+            self._add_numpy(np.asarray(coords, dtype=float))
+        else:
+            self._add_python(coords)
+        self.count += len(coords) // 2
+
+    def _add_python(self, coords: Any) -> None:
+        ox, oy = self._origin
+        x0, y0 = self._last
+        kante = self._last_edge
+        erster = self.count == 0
+        hypot, atan2 = math.hypot, math.atan2
+        rauschen = 2 * self._noise
+
+        # Summen lokal fuehren, damit die Schleife keine Attribute nachschlagen muss
+        flaeche, moment_x, moment_y = self._area2, self._moment_x, self._moment_y
+        umfang, drehung, links, rechts = self._perimeter, self._turning, self._left, self._right
+        anzahl_kanten = self._edges
+        ex0, ey0 = kante if kante is not None else (0.0, 0.0)
+        l0 = hypot(ex0, ey0)
+
+        for i in range(0, len(coords), 2):
+            x1, y1 = coords[i] - ox, coords[i + 1] - oy
+            if erster:
+                erster = False
+                x0, y0 = x1, y1
+                continue
+
+            kreuz = x0 * y1 - x1 * y0
+            flaeche += kreuz
+            moment_x += (x0 + x1) * kreuz
+            moment_y += (y0 + y1) * kreuz
+
+            ex, ey = x1 - x0, y1 - y0
+            x0, y0 = x1, y1
+            if ex == 0 and ey == 0:
+                continue  # doppelter Eckpunkt
+            laenge = hypot(ex, ey)
+            umfang += laenge
+            anzahl_kanten += 1
+
+            if kante is None:
+                self._first_edge = kante = (ex, ey)
+            else:
+                # Drehung an der Ecke zwischen vorheriger und aktueller Kante
+                kreuz = ex0 * ey - ey0 * ex
+                toleranz = COLLINEAR_TOLERANCE * l0 * laenge + rauschen * (l0 + laenge)
+                links = links or kreuz > toleranz
+                rechts = rechts or kreuz < -toleranz
+                drehung += atan2(kreuz, ex0 * ex + ey0 * ey)
+            ex0, ey0, l0 = ex, ey, laenge
+
+        self._area2, self._moment_x, self._moment_y = flaeche, moment_x, moment_y
+        self._perimeter, self._turning, self._left, self._right = umfang, drehung, links, rechts
+        self._edges = anzahl_kanten
+        self._last = (x0, y0)
+        if kante is not None:
+            self._last_edge = (ex0, ey0)
+
+    def _add_numpy(self, coords: Any) -> None:
+        xy = coords.reshape(-1, 2)
+        x = xy[:, 0] - self._origin[0]
+        y = xy[:, 1] - self._origin[1]
+        if self.count:
+            x = np.concatenate(([self._last[0]], x))
+            y = np.concatenate(([self._last[1]], y))
+        self._last = (float(x[-1]), float(y[-1]))
+        if len(x) < 2:
+            return
+
+        x0, x1, y0, y1 = x[:-1], x[1:], y[:-1], y[1:]
+        kreuz = x0 * y1 - x1 * y0
+        self._area2 += float(kreuz.sum())
+        self._moment_x += float(((x0 + x1) * kreuz).sum())
+        self._moment_y += float(((y0 + y1) * kreuz).sum())
+
+        # Kanten ohne doppelte Eckpunkte, mit der letzten Kante des vorigen Blocks davor
+        ex, ey = x1 - x0, y1 - y0
+        echt = (ex != 0) | (ey != 0)
+        ex, ey = ex[echt], ey[echt]
+        if not len(ex):
+            return
+        laenge = np.hypot(ex, ey)
+        self._perimeter += float(laenge.sum())
+        self._edges += len(ex)
+
+        if self._last_edge is None:
+            self._first_edge = (float(ex[0]), float(ey[0]))
+        else:
+            ex = np.concatenate(([self._last_edge[0]], ex))
+            ey = np.concatenate(([self._last_edge[1]], ey))
+            laenge = np.concatenate(([math.hypot(*self._last_edge)], laenge))
+        self._last_edge = (float(ex[-1]), float(ey[-1]))
+
+        kreuz = ex[:-1] * ey[1:] - ey[:-1] * ex[1:]
+        toleranz = COLLINEAR_TOLERANCE * laenge[:-1] * laenge[1:] + 2 * self._noise * (laenge[:-1] + laenge[1:])
+        self._left = self._left or bool((kreuz > toleranz).any())
+        self._right = self._right or bool((kreuz < -toleranz).any())
+        self._turning += float(np.arctan2(kreuz, ex[:-1] * ex[1:] + ey[:-1] * ey[1:]).sum())
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Schliesst das Polygon und gibt die Kennzahlen zurueck.
+
+        Returns:
+            Dict[str, Any]: eckpunkte (ohne wiederholte Eckpunkte), flaeche,
+                umfang, schwerpunkt_x, schwerpunkt_y, konvex und orientierung
+
+        Raises:
+            ValueError: Bei weniger als drei Eckpunkten oder Flaeche 0
+        """
+        if self.count < 3:
+            raise ValueError("Ein Polygon braucht mindestens drei Eckpunkte.")
+        if self._area2 == 0:
+            raise ValueError("Die Flaeche des Polygons ist 0 (alle Eckpunkte liegen auf einer Geraden).")
+
+        # Schliessende Kante zum ersten Eckpunkt (im Bezugssystem der Ursprung)
+        x0, y0 = self._last
+        umfang, drehung = self._perimeter, self._turning
+        links, rechts = self._left, self._right
+        # Verschiedene aufeinanderfolgende Eckpunkte: einer mehr als echte Kanten
+        eckpunkte = self._edges + 1
+
+        if x0 == 0 and y0 == 0:
+            eckpunkte -= 1  # Der letzte Eckpunkt wiederholt den ersten
+            kanten = [self._last_edge, self._first_edge]
+        else:
+            umfang += math.hypot(x0, y0)
+            kanten = [self._last_edge, (-x0, -y0), self._first_edge]
+
+        for kante, naechste in zip(kanten, kanten[1:]):
+            kreuz, toleranz, winkel = _turn(*kante, *naechste, self._noise)
+            links = links or kreuz > toleranz
+            rechts = rechts or kreuz < -toleranz
+            drehung += winkel
+
+        # Ein konvexes Polygon dreht nur in eine Richtung und genau einmal (Sterne drehen mehrfach)
+        konvex = not (links and rechts) and abs(abs(drehung) - 2 * math.pi) < TURNING_TOLERANCE
+
+        return {
+            "eckpunkte": eckpunkte,
+            "flaeche": abs(self._area2) / 2,
+            "umfang": umfang,
+            "schwerpunkt_x": self._origin[0] + self._moment_x / (3 * self._area2),
+            "schwerpunkt_y": self._origin[1] + self._moment_y / (3 * self._area2),
+            "konvex": konvex,
+            "orientierung": "gegen den Uhrzeigersinn" if self._area2 > 0 else "im Uhrzeigersinn",
+        }
+
+
+def measure_polygon(chunks: Iterable[Any]) -> Dict[str, Any]:
+    """
+    Berechnet die Kennzahlen eines Polygons aus Bloecken von Eckpunkten.
+
+    Args:
+        chunks: Bloecke mit Koordinaten abwechselnd x, y (z.B. aus iter_vertex_chunks)
+
+    Returns:
+        Dict[str, Any]: Die Kennzahlen aus PolygonAccumulator.result()
+    """
+    polygon = PolygonAccumulator()
+    for chunk in chunks:
+        polygon.add(chunk)
+    return polygon.result()
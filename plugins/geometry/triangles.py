@@ -0,0 +1,218 @@
+# plugins/geometry/triangles.py
+
+import math
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from core.rounding import SIGNIFICANT_DIGITS
+from core.vectorize import batch_apply
+
+# Ergebniswerte eines Dreiecks (Reihenfolge wie in exec)
+TRIANGLE_KEYS = [
+    "a", "b", "c", "umfang", "flaeche", "alpha_grad", "beta_grad", "gamma_grad",
+    "hoehe_a", "hoehe_b", "hoehe_c", "inkreisradius", "umkreisradius",
+]
+
+# Ergebnisspalten im Batch: erstes Dreieck, Anzahl der Loesungen, zweites Dreieck (nur SSW)
+BATCH_KEYS = TRIANGLE_KEYS + ["loesungen"] + [f"{key}_2" for key in TRIANGLE_KEYS]
+
+# Relative Toleranz, ab der a als gleich der Hoehe b * sin(A) gilt (rechtwinkliger Grenzfall bei SSW)
+SSW_TOLERANCE = 1e-12
+
+
+def triangle_sss(ops: Any, a: Any, b: Any, c: Any) -> Tuple[Any, ...]:
+    """
+    Berechnet alle Dreiecksdaten aus drei Seiten mit denselben Formeln wie exec.
+
+    Arbeitet mit einzelnen Zahlen wie mit ganzen NumPy-Spalten.
+
+    Args:
+        ops: Operations-Namensraum aus core.vectorize
+        a: Seite a
+        b: Seite b
+        c: Seite c
+
+    Returns:
+        Tuple: Werte in der Reihenfolge von TRIANGLE_KEYS, auf 6 signifikante Stellen gerundet
+    """
+    umfang = a + b + c
+    s = umfang / 2
+    flaeche = ops.sqrt(s * (s - a) * (s - b) * (s - c))
+
+    # Winkel (Kosinussatz)
+    alpha = ops.degrees(ops.acos((b**2 + c**2 - a**2) / (2 * b * c)))
+    beta = ops.degrees(ops.acos((a**2 + c**2 - b**2) / (2 * a * c)))
+    gamma = ops.degrees(ops.acos((a**2 + b**2 - c**2) / (2 * a * b)))
+
+    werte = (
+        a, b, c, umfang, flaeche, alpha, beta, gamma,
+        2 * flaeche / a, 2 * flaeche / b, 2 * flaeche / c,
+        flaeche / s, ops.div(a * b * c, 4 * flaeche),
+    )
+    return tuple(ops.round_significant(wert, SIGNIFICANT_DIGITS) for wert in werte)
+
+
+def _third_side(ops: Any, a: Any, b: Any, gamma_deg: Any) -> Any:
+    """Dritte Seite aus zwei Seiten und eingeschlossenem Winkel (Kosinussatz)."""
+    return ops.sqrt(a**2 + b**2 - 2 * a * b * ops.cos(ops.radians(gamma_deg)))
+
+
+def _triangle_sws(ops: Any, a: Any, b: Any, gamma_deg: Any) -> Tuple[Any, ...]:
+    return triangle_sss(ops, a, b, _third_side(ops, a, b, gamma_deg))
+
+
+def _triangle_wsw(ops: Any, alpha_deg: Any, c: Any, beta_deg: Any) -> Tuple[Any, ...]:
+    sin_gamma = ops.sin(ops.radians(180 - alpha_deg - beta_deg))
+    a = c * ops.sin(ops.radians(alpha_deg)) / sin_gamma
+    b = c * ops.sin(ops.radians(beta_deg)) / sin_gamma
+    return triangle_sss(ops, a, b, c)
+
+
+def ssw_solution_count(ops: Any, a: Any, b: Any, alpha_deg: Any) -> Any:
+    """
+    Anzahl der Dreiecke aus zwei Seiten und dem Winkel gegenueber von a (SSW).
+
+    - Stumpfer oder rechter Winkel A: ein Dreieck, wenn a > b, sonst keines
+    - Spitzer Winkel A mit Hoehe h = b * sin(A): keines fuer a < h, eines
+      fuer a = h (rechter Winkel B) oder a >= b, sonst zwei
+
+    Args:
+        ops: Operations-Namensraum aus core.vectorize
+        a: Seite a
+        b: Seite b
+        alpha_deg: Winkel A in Grad (gegenueber von a)
+
+    Returns:
+        Any: 0, 1 oder 2 (als Zahl bzw. Spalte)
+    """
+    hoehe = b * ops.sin(ops.radians(alpha_deg))
+    beruehrt = ops.abs(a - hoehe) <= SSW_TOLERANCE * a
+    spitz = ops.where(beruehrt, 1, ops.where(a < hoehe, 0, ops.where(a >= b, 1, 2)))
+    return ops.where(alpha_deg >= 90, ops.where(a > b, 1, 0), spitz)
+
+
+def ssw_third_sides(ops: Any, a: Any, b: Any, alpha_deg: Any) -> Tuple[Any, Any, Any]:
+    """
+    Loest den Fall SSW (mehrdeutiger Fall) nach der dritten Seite auf.
+
+    Nach dem Sinussatz ist sin(B) = b * sin(A) / a; die beiden moeglichen
+    Winkel B und 180 - B ergeben ueber C = 180 - A - B die Seite c.
+
+    Args:
+        ops: Operations-Namensraum aus core.vectorize
+        a: Seite a
+        b: Seite b
+        alpha_deg: Winkel A in Grad (gegenueber von a)
+
+    Returns:
+        Tuple: (Anzahl der Loesungen, c des ersten Dreiecks, c des zweiten
+            Dreiecks); fehlende Loesungen sind NaN
+    """
+    anzahl = ssw_solution_count(ops, a, b, alpha_deg)
+    sin_alpha = ops.sin(ops.radians(alpha_deg))
+
+    # Bei a = h kann sin(B) durch Rundung knapp ueber 1 liegen
+    sin_beta = b * sin_alpha / a
+    beta = ops.degrees(ops.asin(ops.where(sin_beta > 1, 1.0, sin_beta)))
+
+    c1 = a * ops.sin(ops.radians(180 - alpha_deg - beta)) / sin_alpha
+    c2 = a * ops.sin(ops.radians(beta - alpha_deg)) / sin_alpha
+    return anzahl, ops.where(anzahl >= 1, c1, ops.nan), ops.where(anzahl == 2, c2, ops.nan)
+
+
+def _triangle_ssw(ops: Any, a: Any, b: Any, alpha_deg: Any) -> Tuple[Any, ...]:
+    anzahl, c1, c2 = ssw_third_sides(ops, a, b, alpha_deg)
+    erste = triangle_sss(ops, ops.where(anzahl >= 1, a, ops.nan), ops.where(anzahl >= 1, b, ops.nan), c1)
+    zweite = triangle_sss(ops, ops.where(anzahl == 2, a, ops.nan), ops.where(anzahl == 2, b, ops.nan), c2)
+    return erste + (anzahl * 1.0,) + zweite
+
+
+def _single(ops: Any, werte: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Ergaenzt ein eindeutig bestimmtes Dreieck um die Loesungsanzahl und eine leere zweite Loesung."""
+    nan = werte[0] * ops.nan
+    return werte + (ops.where(werte[4] == werte[4], 1.0, ops.nan),) + (nan,) * len(TRIANGLE_KEYS)
+
+
+def _triangle_base_height(ops: Any, base: Any, height: Any) -> Tuple[Any, ...]:
+    # Nur Grundseite (als a), Hoehe ha und Flaeche sind eindeutig bestimmt
+    nan = base * ops.nan
+    werte = [nan] * len(TRIANGLE_KEYS)
+    werte[0] = base
+    werte[4] = 0.5 * base * height
+    werte[8] = height
+    return tuple(ops.round_significant(wert, SIGNIFICANT_DIGITS) for wert in werte)
+
+
+def _invalid_sss(a: Any, b: Any, c: Any) -> Any:
+    return (a <= 0) | (b <= 0) | (c <= 0) | (a + b <= c) | (a + c <= b) | (b + c <= a)
+
+
+def _invalid_angle(winkel: Any) -> Any:
+    return (winkel <= 0) | (winkel >= 180)
+
+
+# Berechnungsart -> (Parameterpositionen in "Dreieck", Formel, ungueltige Zeilen)
+TRIANGLE_METHODS: Dict[str, Tuple[Tuple[int, ...], Callable[..., Any], Callable[..., Any]]] = {
+    "SSS (drei Seiten)": (
+        (1, 2, 3),
+        lambda ops, a, b, c: _single(ops, triangle_sss(ops, a, b, c)),
+        _invalid_sss
+    ),
+    "SWS (zwei Seiten, ein Winkel)": (
+        (1, 2, 6),
+        lambda ops, a, b, gamma: _single(ops, _triangle_sws(ops, a, b, gamma)),
+        lambda a, b, gamma: (a <= 0) | (b <= 0) | _invalid_angle(gamma)
+    ),
+    "WSW (zwei Winkel, eine Seite)": (
+        (4, 3, 5),
+        lambda ops, alpha, c, beta: _single(ops, _triangle_wsw(ops, alpha, c, beta)),
+        lambda alpha, c, beta: (c <= 0) | _invalid_angle(alpha) | _invalid_angle(beta) | (alpha + beta >= 180)
+    ),
+    "SSW (zwei Seiten, gegenueberliegender Winkel)": (
+        (1, 2, 4),
+        _triangle_ssw,
+        lambda a, b, alpha: (a <= 0) | (b <= 0) | _invalid_angle(alpha)
+    ),
+    "Grundseite und Hoehe": (
+        (1, 7),
+        lambda ops, base, height: _single(ops, _triangle_base_height(ops, base, height)),
+        lambda base, height: (base <= 0) | (height <= 0)
+    ),
+}
+
+
+def solve_triangles(columns: Sequence[Sequence[Any]]) -> Tuple[List[float], ...]:
+    """
+    Loest viele Dreiecke mit gemischten Berechnungsarten.
+
+    Die Zeilen werden nach Berechnungsart gruppiert; jede Gruppe wird in
+    einem vektorisierten Durchlauf berechnet. Statt Ausnahmen liefert jede
+    ungueltige Zeile (fehlende Werte, verletzte Dreiecksungleichung,
+    unbekannte Berechnungsart) NaN in allen Ergebnisspalten. Die Spalte
+    "loesungen" klassifiziert die Zeilen: SSW-Zeilen ohne Dreieck haben 0,
+    mehrdeutige SSW-Zeilen 2 und die zweite Loesung in den Spalten "..._2".
+
+    Args:
+        columns: Die Parameterspalten des Befehls "Dreieck"
+
+    Returns:
+        Tuple: Je Eintrag von BATCH_KEYS eine Ergebnisspalte
+    """
+    arten = columns[0]
+    results = tuple([math.nan] * len(arten) for _ in BATCH_KEYS)
+
+    groups: Dict[str, List[int]] = {}
+    for i, art in enumerate(arten):
+        groups.setdefault(str(art), []).append(i)
+
+    for art, indices in groups.items():
+        if art not in TRIANGLE_METHODS:
+            continue
+        positions, formula, invalid = TRIANGLE_METHODS[art]
+        group_columns = [[columns[p][i] for i in indices] for p in positions]
+        teil = batch_apply(formula, group_columns, invalid=invalid, outputs=len(BATCH_KEYS))
+
+        for ergebnis, spalte in zip(results, teil):
+            for i, wert in zip(indices, spalte.tolist() if hasattr(spalte, "tolist") else spalte):
+                ergebnis[i] = wert
+
+    return results
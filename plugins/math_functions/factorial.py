@@ -0,0 +1,262 @@
+# plugins/math_functions/factorial.py
+
+from collections import OrderedDict
+from decimal import Decimal, localcontext
+from math import isqrt, log10
+from typing import List, Sequence, Tuple
+
+from plugins.math_functions.primes import base_primes
+
+# Bis zu diesem n wird direkt multipliziert
+_SMALL_FACTORIAL_LIMIT = 20
+
+# Zuletzt berechnete Fakultaeten als Stuetzstellen (n -> n!)
+_checkpoints: "OrderedDict[int, int]" = OrderedDict()
+CHECKPOINT_COUNT = 4
+CHECKPOINT_MIN_N = 1000
+
+# Pi mit ausreichend Stellen fuer die Stirling-Reihe
+_PI = Decimal("3.14159265358979323846264338327950288419716939937510582097494459")
+
+
+def product(values: Sequence[int]) -> int:
+    """
+    Multipliziert Zahlen paarweise im Binaerbaum (binary splitting).
+
+    Dadurch werden etwa gleich grosse Zahlen miteinander multipliziert, was
+    fuer grosse Ganzzahlen deutlich schneller ist als ein fortlaufendes Produkt.
+
+    Args:
+        values: Die zu multiplizierenden Zahlen
+
+    Returns:
+        int: Das Produkt (1 fuer eine leere Folge)
+    """
+    values = list(values)
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) & 1:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def _swing(n: int) -> int:
+    """
+    Berechnet den Prime-Swing n! / ((n // 2)!)^2 aus seiner Primfaktorzerlegung.
+
+    Der Exponent einer Primzahl p ist die Anzahl der ungeraden Werte n // p^k.
+
+    Args:
+        n: Nicht-negative ganze Zahl
+
+    Returns:
+        int: n! / ((n // 2)!)^2
+    """
+    factors: List[int] = []
+    root = isqrt(n)
+
+    for p in [2] + base_primes(n):
+        if p > n // 2:
+            # Primzahlen in (n/2, n] kommen genau einmal vor
+            factors.append(p)
+        elif p > root:
+            if (n // p) & 1:
+                factors.append(p)
+        else:
+            q = n
+            power = 1
+            while q >= p:
+                q //= p
+                if q & 1:
+                    power *= p
+            if power > 1:
+                factors.append(power)
+
+    return product(factors)
+
+
+def _factorial(n: int) -> int:
+    """Rekursion n! = ((n // 2)!)^2 * swing(n)."""
+    if n <= _SMALL_FACTORIAL_LIMIT:
+        return product(range(2, n + 1))
+    half = _factorial(n // 2)
+    return half * half * _swing(n)
+
+
+def factorial(n: int) -> int:
+    """
+    Berechnet n! exakt nach dem Prime-Swing-Verfahren.
+
+    Liegt eine zuvor berechnete Fakultaet m! mit m <= n nahe genug, wird
+    nur noch das Produkt (m+1)...n im Binaerbaum angehaengt.
+
+    Args:
+        n: Nicht-negative ganze Zahl
+
+    Returns:
+        int: n!
+    """
+    if n < 0:
+        raise ValueError("Die Fakultaet ist nur fuer nicht-negative Zahlen definiert.")
+
+    if n < CHECKPOINT_MIN_N:
+        return _factorial(n)
+
+    nearest = max((m for m in _checkpoints if m <= n), default=None)
+    if nearest is not None and n - nearest <= n // 8:
+        result = _checkpoints[nearest] * product(range(nearest + 1, n + 1))
+    else:
+        result = _factorial(n)
+
+    _checkpoints[n] = result
+    _checkpoints.move_to_end(n)
+    while len(_checkpoints) > CHECKPOINT_COUNT:
+        _checkpoints.popitem(last=False)
+
+    return result
+
+
+def log10_factorial(n: int, precision: int = 40) -> Decimal:
+    """
+    Berechnet log10(n!) mit der Stirling-Reihe, ohne n! zu bilden.
+
+    Fuer n >= 1000 ist der Restfehler der Reihe kleiner als 10^-30, so dass
+    auch fuer sehr grosse n Exponent und fuehrende Ziffern stimmen.
+
+    Args:
+        n: Nicht-negative ganze Zahl
+        precision: Zusaetzliche Dezimalstellen ueber die Stellenzahl von n hinaus
+
+    Returns:
+        Decimal: log10(n!)
+    """
+    if n < CHECKPOINT_MIN_N:
+        return LargeInteger(factorial(n)).log10(precision)
+
+    with localcontext() as ctx:
+        ctx.prec = precision + len(str(n))
+        x = Decimal(n)
+        # ln n! = n ln n - n + ln(2 pi n) / 2 + 1/(12n) - 1/(360n^3) + 1/(1260n^5) - 1/(1680n^7) + 1/(1188n^9)
+        ln_fact = x * x.ln() - x + (2 * _PI * x).ln() / 2
+        for coefficient, power in ((12, 1), (-360, 3), (1260, 5), (-1680, 7), (1188, 9)):
+            ln_fact += 1 / (coefficient * x ** power)
+        return ln_fact / Decimal(10).ln()
+
+
+def split_log10(log_value: Decimal, digits: int) -> Tuple[Decimal, int]:
+    """
+    Zerlegt einen Zehnerlogarithmus in Mantisse und Exponent.
+
+    Args:
+        log_value: log10 einer positiven Zahl
+        digits: Signifikante Stellen der Mantisse
+
+    Returns:
+        Tuple[Decimal, int]: (Mantisse in [1, 10), Exponent)
+    """
+    exponent = int(log_value)
+    with localcontext() as ctx:
+        ctx.prec = digits + 10
+        mantisse = Decimal(10) ** (log_value - exponent)
+    if mantisse >= 10:
+        mantisse, exponent = mantisse / 10, exponent + 1
+    return round(mantisse, digits - 1), exponent
+
+
+class LargeInteger(int):
+    """
+    Ganzzahl, deren Textdarstellung bei vielen Stellen gekuerzt wird.
+
+    Verhaelt sich in Rechnungen wie int. str() zeigt nur die fuehrenden und
+    letzten Ziffern sowie die Stellenzahl und umgeht damit die Grenze fuer
+    die Umwandlung grosser Ganzzahlen in Text (sys.get_int_max_str_digits).
+    """
+
+    # Ab dieser Stellenzahl wird gekuerzt
+    FULL_DIGITS = 60
+    # Angezeigte Ziffern am Anfang und am Ende
+    EDGE_DIGITS = 20
+
+    def log10(self, precision: int = 40) -> Decimal:
+        """
+        Zehnerlogarithmus aus den fuehrenden Bits, ohne Umwandlung in Text.
+
+        Args:
+            precision: Gueltige Dezimalstellen nach dem Komma
+
+        Returns:
+            Decimal: log10(|Wert|)
+        """
+        value = abs(int(self))
+        shift = max(0, value.bit_length() - 4 * precision)
+        with localcontext() as ctx:
+            ctx.prec = precision + len(str(shift)) + 5
+            return Decimal(value >> shift).log10() + shift * Decimal(2).log10()
+
+    @property
+    def digits(self) -> int:
+        """Anzahl der Dezimalstellen (ohne Vorzeichen)."""
+        value = abs(int(self))
+        if value.bit_length() <= 4 * self.FULL_DIGITS:
+            return len(str(value))
+
+        log_value = self.log10()
+        digits = int(log_value) + 1
+        fraction = log_value - int(log_value)
+        if fraction < Decimal("1e-30") or fraction > 1 - Decimal("1e-30"):
+            # Sehr nah an einer Zehnerpotenz: exakt vergleichen
+            digits = int(log_value + Decimal("0.5"))
+            if value >= 10 ** digits:
+                digits += 1
+        return digits
+
+    def leading_digits(self, count: int) -> str:
+        """
+        Gibt die ersten Dezimalziffern zurueck.
+
+        Args:
+            count: Anzahl der Ziffern
+
+        Returns:
+            str: Die fuehrenden Ziffern
+        """
+        digits = self.digits
+        if digits <= count:
+            return str(abs(int(self)))
+        with localcontext() as ctx:
+            ctx.prec = count + 20
+            fraction = self.log10(count + 20) - (digits - 1)
+            leading = int(Decimal(10) ** (fraction + count - 1))
+        return str(leading)[:count]
+
+    def trailing_digits(self, count: int) -> str:
+        """
+        Gibt die letzten Dezimalziffern zurueck.
+
+        Args:
+            count: Anzahl der Ziffern
+
+        Returns:
+            str: Die letzten Ziffern (mit fuehrenden Nullen)
+        """
+        return str(abs(int(self)) % 10 ** count).zfill(count)
+
+    def __str__(self) -> str:
+        value = int(self)
+        if abs(value).bit_length() <= 4 * self.FULL_DIGITS:
+            return int.__repr__(value)
+        sign = "-" if value < 0 else ""
+        return (
+            f"{sign}{self.leading_digits(self.EDGE_DIGITS)}..."
+            f"{self.trailing_digits(self.EDGE_DIGITS)} ({self.digits} Stellen)"
+        )
+
+    __repr__ = __str__
+
+    def __format__(self, format_spec: str) -> str:
+        if not format_spec:
+            return str(self)
+        return int.__format__(int(self), format_spec)
@@ -1,21 +1,44 @@
 ﻿# plugins/math_functions/math_func.py
 
-from typing import List, Tuple, Any
-from core.plugin_interface import IPlugin, PluginInfo, Command
+from decimal import MAX_EMAX, MIN_EMIN, Decimal, InvalidOperation, localcontext
+from fractions import Fraction
+from typing import List, Tuple, Any, Iterator, Optional, Sequence, Union
+from core.plugin_interface import IPlugin, PluginInfo, Command, CalculationResult
+from core.rounding import round_significant
+from core.vectorize import batch_apply
+from plugins.math_functions.factorial import LargeInteger, factorial, log10_factorial, split_log10
+from plugins.math_functions.rational import best_rational, continued_fraction, convergents, parse_decimal
+from plugins.math_functions.primes import PrimeRange, count_primes, factorize, is_prime, iter_primes
 import math
 
 class MathFunctions(IPlugin):
     """Implementiert mathematische Funktionen."""
     
+    # Groesste exakt berechnete Potenzen (in Bit), darueber wird in Gleitkomma gerechnet
+    EXACT_INT_BITS = 1 << 25
+    EXACT_FRACTION_BITS = 1 << 13
+    
+    # Groesster Zehnerexponent von Eingaben wie "1e5000" fuer die exakte Umwandlung
+    MAX_DECIMAL_EXPONENT = 100000
+    
+    # Hoechste Stellenzahl fuer Quadratwurzel (Stellen)
+    MAX_SQRT_DIGITS = 100000
+    
     def __init__(self):
         """Initialisiert neue mathematische Funktionen."""
         self.name = "Mathematische Funktionen"
         self.commands = [
-            Command("Fakultaet", ["n"]),
-            Command("Quadratwurzel", ["x"]),
-            Command("Potenz", ["Basis", "Exponent"]),
-            Command("Primzahlen", ["Untergrenze", "Obergrenze"]),
-            Command("Dezimalbruch zu gemeinem Bruch", ["Dezimalbruch"])
+            Command("Fakultaet", ["n"], cacheable=True),
+            Command("Fakultaet (Groessenordnung)", ["n"], cacheable=True),
+            Command("Quadratwurzel", ["x"], cacheable=True),
+            Command("Quadratwurzel (Stellen)", ["x", "Stellen"], cacheable=True),
+            Command("Potenz", ["Basis", "Exponent"], cacheable=True),
+            Command("Modulare Potenz", ["Basis", "Exponent", "Modul"], cacheable=True),
+            Command("Primzahlen", ["Untergrenze", "Obergrenze"], cacheable=True),
+            Command("Primzahlanzahl", ["Untergrenze", "Obergrenze"], cacheable=True),
+            Command("Primfaktorzerlegung", ["n"], cacheable=True),
+            Command("Dezimalbruch zu gemeinem Bruch", ["Dezimalbruch", "Max. Nenner"], cacheable=True),
+            Command("Naeherungsbrueche", ["Dezimalbruch", "Max. Nenner"], cacheable=True)
         ]
     
     def load(self) -> None:
@@ -31,7 +54,7 @@ class MathFunctions(IPlugin):
         """
         return PluginInfo(self.name, self.commands)
     
-    def exec(self, command_name: str, params: List[Any]) -> Tuple[str, Any]:
+    def exec(self, command_name: str, params: List[Any]) -> CalculationResult:
         """
         Fuehrt einen Befehl mit den gegebenen Parametern aus.
         
@@ -40,7 +63,7 @@ class MathFunctions(IPlugin):
             params: Liste der Parameter
 
         Returns:
-            Tuple[str, Any]: (Formatierter Text der Berechnung, Ergebniswert)
+            CalculationResult: Ergebniswert mit verzoegert erzeugtem Anzeigetext
         """
         if command_name == "Fakultaet":
             # Fakultaet berechnen
@@ -49,12 +72,24 @@ class MathFunctions(IPlugin):
             if n < 0:
                 raise ValueError("Die Fakultaet ist nur fuer nicht-negative Zahlen definiert.")
             
-            if n > 170:
-                raise ValueError("Die Berechnung fuer n > 170 wuerde zu Speicherueberlauf fuehren.")
+            # Grosse Ergebnisse werden gekuerzt mit Stellenzahl angezeigt
+            ergebnis = LargeInteger(self._fakultaet(n))
+            
+            return CalculationResult(ergebnis, lambda: f"Fakultaet: {n}! = {ergebnis}")
+            
+        elif command_name == "Fakultaet (Groessenordnung)":
+            # Nur Groessenordnung und fuehrende Ziffern ueber die Stirling-Reihe
+            n = int(params[0])
+            
+            if n < 0:
+                raise ValueError("Die Fakultaet ist nur fuer nicht-negative Zahlen definiert.")
             
-            ergebnis = self._fakultaet(n)
+            mantisse, exponent = split_log10(log10_factorial(n), 15)
             
-            return f"Fakultaet: {n}! = {ergebnis}", ergebnis
+            return CalculationResult(
+                (float(mantisse), exponent),
+                lambda: f"Fakultaet (Groessenordnung): {n}! ≈ {mantisse} · 10^{exponent} ({exponent + 1} Stellen)"
+            )
             
         elif command_name == "Quadratwurzel":
             # Quadratwurzel berechnen
@@ -66,24 +101,82 @@ class MathFunctions(IPlugin):
             ergebnis = self._sqrt(x)
             
             # Runden auf 6 signifikante Stellen
-            ergebnis = self._round_significant(ergebnis, 6)
+            ergebnis = round_significant(ergebnis, 6)
+            
+            return CalculationResult(ergebnis, lambda: f"Quadratwurzel: √{x} = {ergebnis}")
+            
+        elif command_name == "Quadratwurzel (Stellen)":
+            # Quadratwurzel mit waehlbarer Anzahl signifikanter Stellen
+            try:
+                x = Decimal(str(params[0]).strip().replace(',', '.'))
+            except InvalidOperation:
+                raise ValueError(f"Ungueltige Zahl: {params[0]}")
+            stellen = int(params[1])
+            
+            if not x.is_finite() or x < 0:
+                raise ValueError("Die Quadratwurzel ist nur fuer nicht-negative Zahlen definiert.")
+            
+            if not 1 <= stellen <= self.MAX_SQRT_DIGITS:
+                raise ValueError(f"Die Stellenzahl muss zwischen 1 und {self.MAX_SQRT_DIGITS} liegen.")
+            
+            # Exakte Wurzel nur pruefen, wenn sie nicht mehr Stellen als angefordert hat
+            # (mindestens 15): int(x) waere z.B. fuer 1e1000000000 nicht berechenbar
+            if (x == x.to_integral_value() and x.adjusted() < 2 * max(stellen, 15)
+                    and math.isqrt(int(x)) ** 2 == int(x)):
+                # Ganzzahlige Wurzel exakt
+                ergebnis = LargeInteger(math.isqrt(int(x)))
+                genauigkeit = "exakt"
+            else:
+                ergebnis = self._sqrt_digits(x, stellen)
+                genauigkeit = f"{stellen} Stellen"
             
-            return f"Quadratwurzel: √{x} = {ergebnis}", ergebnis
+            return CalculationResult(
+                ergebnis,
+                lambda: f"Quadratwurzel ({genauigkeit}): √{params[0]} = {ergebnis}"
+            )
             
         elif command_name == "Potenz":
-            # Potenz berechnen
-            basis = float(params[0])
-            exponent = float(params[1])
+            # Potenz berechnen (exakt fuer ganze und rationale Eingaben)
+            basis = self._to_rational(params[0])
+            exponent = self._to_rational(params[1])
             
             if basis == 0 and exponent <= 0:
                 raise ValueError("0 hoch 0 oder negative Exponenten sind nicht definiert.")
             
             ergebnis = self._power(basis, exponent)
             
-            # Runden auf 6 signifikante Stellen
-            ergebnis = self._round_significant(ergebnis, 6)
+            if isinstance(ergebnis, float):
+                if math.isinf(ergebnis):
+                    raise ValueError("Das Ergebnis ist zu gross fuer eine Gleitkommazahl.")
+                # Nicht exakt darstellbare Ergebnisse auf 6 signifikante Stellen runden
+                ergebnis = round_significant(ergebnis, 6)
+            elif isinstance(ergebnis, int):
+                ergebnis = LargeInteger(ergebnis)
+            
+            return CalculationResult(
+                ergebnis,
+                lambda: f"Potenz: {self._format_operand(params[0])}^{self._format_operand(params[1])} = {ergebnis}"
+            )
+            
+        elif command_name == "Modulare Potenz":
+            # basis^exponent mod modul durch Quadrieren und Multiplizieren
+            basis = int(params[0])
+            exponent = int(params[1])
+            modul = int(params[2])
+            
+            if modul <= 0:
+                raise ValueError("Der Modul muss positiv sein.")
+            
+            try:
+                # Negative Exponenten verwenden das modulare Inverse
+                ergebnis = pow(basis, exponent, modul)
+            except ValueError:
+                raise ValueError(f"{basis} ist modulo {modul} nicht invertierbar.")
             
-            return f"Potenz: {basis}^{exponent} = {ergebnis}", ergebnis
+            return CalculationResult(
+                ergebnis,
+                lambda: f"Modulare Potenz: {basis}^{exponent} mod {modul} = {ergebnis}"
+            )
             
         elif command_name == "Primzahlen":
             # Primzahlen in einem Bereich finden
@@ -96,31 +189,112 @@ class MathFunctions(IPlugin):
             if untergrenze > obergrenze:
                 raise ValueError("Die Untergrenze muss kleiner oder gleich der Obergrenze sein.")
             
-            primzahlen = self._primzahlen(untergrenze, obergrenze)
+            # Primzahlen werden erst bei Bedarf (seitenweise) erzeugt
+            primzahlen = PrimeRange(untergrenze, obergrenze)
+            
+            return CalculationResult(
+                primzahlen,
+                lambda: f"Primzahlen zwischen {untergrenze} und {obergrenze}: {primzahlen.summary()}"
+            )
+            
+        elif command_name == "Primzahlanzahl":
+            # Primzahlen in einem Bereich zaehlen, ohne sie zu erzeugen
+            untergrenze = int(params[0])
+            obergrenze = int(params[1])
+            
+            if untergrenze < 0 or obergrenze < 0:
+                raise ValueError("Die Grenzen muessen nicht-negativ sein.")
+            
+            if untergrenze > obergrenze:
+                raise ValueError("Die Untergrenze muss kleiner oder gleich der Obergrenze sein.")
+            
+            anzahl = count_primes(untergrenze, obergrenze)
+            
+            return CalculationResult(
+                anzahl,
+                lambda: f"Anzahl der Primzahlen zwischen {untergrenze} und {obergrenze}: {anzahl}"
+            )
+            
+        elif command_name == "Primfaktorzerlegung":
+            # Primfaktoren mit Probedivision, Pollard-Rho und Miller-Rabin bestimmen
+            n = int(params[0])
+            
+            if n < 1:
+                raise ValueError("Die Primfaktorzerlegung ist nur fuer positive ganze Zahlen definiert.")
             
-            return (
-                f"Primzahlen zwischen {untergrenze} und {obergrenze}: "
-                f"{', '.join(map(str, primzahlen))}",
-                primzahlen
+            faktoren = factorize(n)
+            
+            return CalculationResult(
+                faktoren,
+                lambda: f"Primfaktorzerlegung: {n} = {self._format_faktoren(faktoren)}"
             )
             
         elif command_name == "Dezimalbruch zu gemeinem Bruch":
-            dezimalbruch_str = str(params[0])
+            # Exakt aus dem eingegebenen Text, z.B. "0.125" oder periodisch "0.(3)"
+            dezimalbruch_str = str(params[0]).strip()
+            max_nenner = self._optional_int(params[1] if len(params) > 1 else "")
             
-            dezimalbruch_str = dezimalbruch_str.replace(',', '.')
+            zaehler, nenner = self._decimal_to_fraction(dezimalbruch_str, max_nenner)
             
-            try:
-                dezimalbruch = float(dezimalbruch_str)
-                
-                zaehler, nenner = self._decimal_to_fraction(dezimalbruch)
-                
-                return f"Gemeiner Bruch: {dezimalbruch} = {zaehler}/{nenner}", (zaehler, nenner)
-            except ValueError:
-                raise ValueError(f"Ungueltiger Dezimalbruch: {dezimalbruch_str}")
+            return CalculationResult(
+                (zaehler, nenner),
+                lambda: f"Gemeiner Bruch: {dezimalbruch_str} = {zaehler}/{nenner}"
+            )
+            
+        elif command_name == "Naeherungsbrueche":
+            # Alle Naeherungsbrueche der Kettenbruchentwicklung
+            dezimalbruch_str = str(params[0]).strip()
+            max_nenner = self._optional_int(params[1] if len(params) > 1 else "")
+            
+            if max_nenner is not None and max_nenner < 1:
+                raise ValueError("Der maximale Nenner muss mindestens 1 sein.")
+            
+            wert = parse_decimal(dezimalbruch_str)
+            naeherungen = [bruch for bruch in convergents(wert)
+                           if max_nenner is None or bruch.denominator <= max_nenner]
+            teilnenner = continued_fraction(wert)[:len(naeherungen)]
+            
+            kettenbruch = f"[{teilnenner[0]}; {', '.join(map(str, teilnenner[1:]))}]" if len(teilnenner) > 1 else f"[{teilnenner[0]}]"
+            
+            return CalculationResult(
+                [(bruch.numerator, bruch.denominator) for bruch in naeherungen],
+                lambda: (
+                    f"Naeherungsbrueche: {dezimalbruch_str} = {kettenbruch} → "
+                    f"{', '.join(str(bruch) for bruch in naeherungen)}"
+                )
+            )
+    
+    def exec_batch(self, command_name: str, columns: List[Sequence[Any]]) -> Any:
+        """
+        Fuehrt einen Befehl vektorisiert fuer ganze Parameterspalten aus.
+        
+        Args:
+            command_name: Name des auszufuehrenden Befehls
+            columns: Je Parameter eine Spalte (Liste oder NumPy-Array)
+
+        Returns:
+            Any: Ergebnisspalte; ungueltige Zeilen sind NaN bzw. None
+        """
+        if command_name == "Quadratwurzel":
+            return batch_apply(
+                lambda ops, x: ops.round_significant(ops.sqrt(x), 6),
+                columns,
+                invalid=lambda x: x < 0
+            )
+            
+        elif command_name == "Potenz":
+            return batch_apply(
+                lambda ops, basis, exponent: ops.round_significant(ops.power(basis, exponent), 6),
+                columns,
+                invalid=lambda basis, exponent: (basis == 0) & (exponent <= 0)
+            )
+        
+        # Fakultaet, Primzahlen und Brueche liefern keine Gleitkommawerte
+        return super().exec_batch(command_name, columns)
     
     def _fakultaet(self, n: int) -> int:
         """
-        Berechnet die Fakultaet einer Zahl.
+        Berechnet die Fakultaet einer Zahl exakt.
         
         Args:
             n: Die Zahl, deren Fakultaet berechnet werden soll
@@ -128,18 +302,12 @@ class MathFunctions(IPlugin):
         Returns:
             int: Die Fakultaet von n
         """
-        if n <= 1:
-            return 1
-        
-        result = 1
-        for i in range(2, n + 1):
-            result *= i
-        
-        return result
+        # Prime-Swing-Verfahren mit Binaerbaum-Multiplikation
+        return factorial(n)
     
     def _sqrt(self, x: float) -> float:
         """
-        Berechnet die Quadratwurzel einer Zahl.
+        Berechnet die Quadratwurzel einer Zahl in Gleitkomma-Genauigkeit.
         
         Args:
             x: Die Zahl, deren Quadratwurzel berechnet werden soll
@@ -147,215 +315,304 @@ class MathFunctions(IPlugin):
         Returns:
             float: Die Quadratwurzel von x
         """
-        # Newton-Raphson-Verfahren zur Berechnung der Quadratwurzel
-        if x == 0:
-            return 0
-        
-        # Startwert
-        y = x
+        # Korrekt gerundete Hardware-Wurzel statt Newton-Iteration ab y = x
+        return math.sqrt(x)
+    
+    def _sqrt_digits(self, x: Decimal, stellen: int) -> Decimal:
+        """
+        Berechnet die Quadratwurzel auf eine Anzahl signifikanter Stellen.
         
-        # Epsilon fuer Abbruchbedingung
-        epsilon = 1e-10
+        Newton-Verfahren in Decimal-Arithmetik. Der Startwert kommt aus der
+        Gleitkomma-Wurzel der Mantisse und dem halbierten Zehnerexponenten,
+        daher genuegen wenige Schritte, deren Genauigkeit jeweils verdoppelt wird.
         
-        while True:
-            # Neuer Naeherungswert
-            y_new = 0.5 * (y + x / y)
+        Args:
+            x: Nicht-negative Zahl
+            stellen: Anzahl signifikanter Stellen des Ergebnisses
+
+        Returns:
+            Decimal: Die auf stellen Stellen gerundete Wurzel
+        """
+        if x == 0:
+            return Decimal(0)
+        
+        # Genauigkeitsstufen von der Zielgenauigkeit aus halbieren
+        ziel = stellen + 10
+        stufen = []
+        genauigkeit = ziel
+        while genauigkeit > 15:
+            stufen.append(genauigkeit)
+            genauigkeit = genauigkeit // 2 + 1
+        
+        with localcontext() as ctx:
+            # Auch Zehnerexponenten ausserhalb des Standardkontexts (z.B. 1e1000000000)
+            ctx.Emax, ctx.Emin = MAX_EMAX, MIN_EMIN
             
-            # Abbruchbedingung
-            if abs(y - y_new) < epsilon:
-                return y_new
+            # x = m * 10^(2e) mit 1 <= m < 100, damit float(m) nie ueberlaeuft
+            exponent = x.adjusted() // 2
+            mantisse = x.scaleb(-2 * exponent)
+            y = Decimal(math.sqrt(float(mantisse))).scaleb(exponent)
             
-            y = y_new
+            for genauigkeit in reversed(stufen):
+                ctx.prec = genauigkeit
+                y = (y + x / y) / 2
+            # Ein abschliessender Schritt auf voller Genauigkeit
+            ctx.prec = ziel
+            y = (y + x / y) / 2
+            
+            ctx.prec = stellen
+            return (+y).normalize() if stellen > 1 else +y
     
-    def _power(self, basis: float, exponent: float) -> float:
+    def _to_rational(self, value: Any) -> Fraction:
         """
-        Berechnet eine Potenz.
+        Wandelt eine Eingabe exakt in einen Bruch um.
+        
+        Gleitkommazahlen werden ueber ihre Dezimaldarstellung umgewandelt,
+        damit 0.1 als 1/10 und nicht als binaere Naeherung gilt. Texte
+        duerfen auch Brueche wie "3/4" enthalten. Zehnerexponenten ueber
+        MAX_DECIMAL_EXPONENT werden abgelehnt, weil schon der exakte Bruch
+        zu gross wuerde.
         
         Args:
-            basis: Die Basis
-            exponent: Der Exponent
+            value: Ganzzahl, Gleitkommazahl oder Text
 
         Returns:
-            float: basis^exponent
+            Fraction: Der exakte Wert
         """
-        # Fuer ganzzahlige Exponenten
-        if exponent == int(exponent):
-            exponent = int(exponent)
-            
-            if exponent >= 0:
-                result = 1
-                for _ in range(exponent):
-                    result *= basis
-                return result
-            else:
-                result = 1
-                for _ in range(-exponent):
-                    result *= basis
-                return 1 / result
-        
-        # Fuer nicht-ganzzahlige Exponenten
-        return math.exp(exponent * math.log(basis))
+        try:
+            if isinstance(value, int):
+                return Fraction(value)
+            if isinstance(value, float):
+                return Fraction(repr(value))
+            text = str(value).strip().replace(',', '.')
+            zahl = Decimal(text) if "e" in text.lower() and "/" not in text else None
+            if zahl is None or not zahl.is_finite() or not zahl or abs(zahl.adjusted()) <= self.MAX_DECIMAL_EXPONENT:
+                return Fraction(text)
+        except (ValueError, InvalidOperation, ZeroDivisionError):
+            raise ValueError(f"Ungueltige Zahl: {value}")
+        raise ValueError(f"Zahl ausserhalb des Wertebereichs: {value}")
     
-    def _ist_primzahl(self, n: int) -> bool:
+    def _format_operand(self, value: Any) -> str:
         """
-        Prueft, ob eine Zahl eine Primzahl ist.
+        Formatiert eine Eingabe fuer die Anzeige, Brueche und negative Zahlen in Klammern.
         
         Args:
-            n: Die zu pruefende Zahl
+            value: Die Eingabe wie vom Benutzer angegeben
 
         Returns:
-            bool: True, wenn n eine Primzahl ist, sonst False
+            str: Der Anzeigetext
         """
-        if n <= 1:
-            return False
-        
-        if n <= 3:
-            return True
+        text = str(value).strip()
+        if "/" in text or text.startswith("-"):
+            return f"({text})"
+        return text
+    
+    def _power(self, basis: Fraction, exponent: Fraction) -> Union[int, Fraction, float]:
+        """
+        Berechnet eine Potenz, wenn moeglich exakt.
         
-        if n % 2 == 0 or n % 3 == 0:
-            return False
+        Ganzzahlige Exponenten werden durch wiederholtes Quadrieren in
+        O(log n) Multiplikationen berechnet. Bei gebrochenen Exponenten p/q
+        wird zuerst die exakte q-te Wurzel versucht. Waere ein exaktes
+        Ergebnis zu gross oder irrational, wird in Gleitkomma gerechnet;
+        laeuft dabei der Wertebereich ueber, ist das Ergebnis math.inf.
         
-        i = 5
-        while i * i <= n:
-            if n % i == 0 or n % (i + 2) == 0:
-                return False
-            i += 6
+        Args:
+            basis: Die Basis
+            exponent: Der Exponent
+
+        Returns:
+            Union[int, Fraction, float]: basis^exponent
+        """
+        p, q = exponent.numerator, exponent.denominator
+        
+        if q > 1:
+            # Exakte q-te Wurzel, z.B. 8^(2/3) = 2^2 oder (9/4)^(1/2) = 3/2
+            root = self._exact_root(basis, q)
+            if root is None:
+                if basis < 0 and q % 2 == 0:
+                    raise ValueError("Gerade Wurzeln negativer Zahlen sind nicht reell definiert.")
+                try:
+                    betrag = math.pow(abs(float(basis)), float(exponent))
+                except OverflowError:
+                    # Ausserhalb des float-Bereichs (z.B. Basis 1e400) ueber Logarithmen rechnen
+                    try:
+                        log_basis = math.log(abs(basis.numerator)) - math.log(basis.denominator)
+                        betrag = math.exp(float(exponent) * log_basis)
+                    except OverflowError:
+                        betrag = math.inf if (abs(basis) > 1) == (exponent > 0) else 0.0
+                return -betrag if basis < 0 and p % 2 else betrag
+            basis = root
+        
+        groesse = abs(p) * max(basis.numerator.bit_length(), basis.denominator.bit_length())
+        limit = self.EXACT_INT_BITS if basis.denominator == 1 and p >= 0 else self.EXACT_FRACTION_BITS
+        
+        if groesse > limit:
+            # Exaktes Ergebnis waere zu gross: in Gleitkomma quadrieren
+            try:
+                ergebnis = self._power_by_squaring(float(basis), abs(p))
+            except OverflowError:
+                ergebnis = math.inf
+            if p < 0:
+                return 1 / ergebnis if ergebnis else math.inf
+            return ergebnis
+        
+        ergebnis = self._power_by_squaring(basis, abs(p))
+        if p < 0:
+            ergebnis = 1 / ergebnis
+        return ergebnis.numerator if ergebnis.denominator == 1 else ergebnis
+    
+    def _power_by_squaring(self, basis: Any, exponent: int) -> Any:
+        """
+        Berechnet basis^exponent fuer einen nicht-negativen ganzen Exponenten.
         
-        return True
+        Args:
+            basis: Die Basis (int, Fraction oder float)
+            exponent: Der Exponent (>= 0)
+
+        Returns:
+            Any: basis^exponent im Typ der Basis
+        """
+        result = basis ** 0
+        while exponent:
+            if exponent & 1:
+                result *= basis
+            exponent >>= 1
+            if exponent:
+                basis *= basis
+        return result
     
-    def _primzahlen(self, untergrenze: int, obergrenze: int) -> List[int]:
+    def _exact_root(self, basis: Fraction, k: int) -> Optional[Fraction]:
         """
-        Findet alle Primzahlen in einem Bereich.
+        Gibt die exakte k-te Wurzel eines Bruchs zurueck, falls sie rational ist.
+        
+        Ist k mindestens so gross wie die Bitlaenge eines Teils n >= 2, liegt
+        dessen Wurzel zwischen 1 und 2 und kann nicht ganzzahlig sein; das
+        wird ohne Newton-Verfahren erkannt (z.B. Exponent 0.333333333333333
+        mit dem Nenner 10^15).
         
         Args:
-            untergrenze: Die untere Grenze des Bereichs
-            obergrenze: Die obere Grenze des Bereichs
+            basis: Der Radikand
+            k: Der Wurzelexponent (>= 2)
 
         Returns:
-            List[int]: Liste der Primzahlen im Bereich
+            Optional[Fraction]: Die Wurzel oder None, wenn sie irrational ist
         """
-        primzahlen = []
+        if basis < 0 and k % 2 == 0:
+            return None
+        
+        wurzeln = []
+        for teil in (abs(basis.numerator), basis.denominator):
+            if teil >= 2 and k >= teil.bit_length():
+                return None
+            wurzel = self._integer_root(teil, k)
+            if wurzel ** k != teil:
+                return None
+            wurzeln.append(wurzel)
+        
+        wurzel = Fraction(wurzeln[0], wurzeln[1])
+        return -wurzel if basis < 0 else wurzel
+    
+    def _integer_root(self, n: int, k: int) -> int:
+        """
+        Berechnet die ganzzahlige k-te Wurzel floor(n^(1/k)) mit dem Newton-Verfahren.
         
-        for n in range(max(2, untergrenze), obergrenze + 1):
-            if self._ist_primzahl(n):
-                primzahlen.append(n)
+        Args:
+            n: Nicht-negative ganze Zahl
+            k: Der Wurzelexponent (>= 2)
+
+        Returns:
+            int: Die groesste Zahl r mit r^k <= n
+        """
+        if n < 2:
+            return n
+        if k == 2:
+            return math.isqrt(n)
         
-        return primzahlen
+        # Startwert oberhalb der Wurzel aus der Bitlaenge
+        x = 1 << (n.bit_length() + k - 1) // k
+        while True:
+            y = ((k - 1) * x + n // x ** (k - 1)) // k
+            if y >= x:
+                return x
+            x = y
     
-    def _gcd(self, a: int, b: int) -> int:
+    def _ist_primzahl(self, n: int) -> bool:
         """
-        Berechnet den groessten gemeinsamen Teiler.
+        Prueft, ob eine Zahl eine Primzahl ist.
+        
+        Verwendet den Miller-Rabin-Test (deterministisch fuer 64-Bit-Zahlen).
         
         Args:
-            a: Erste Zahl
-            b: Zweite Zahl
+            n: Die zu pruefende Zahl
 
         Returns:
-            int: Der groesste gemeinsame Teiler von a und b
+            bool: True, wenn n eine Primzahl ist, sonst False
         """
-        while b:
-            a, b = b, a % b
-        return a
+        return is_prime(n)
     
-    def _decimal_to_fraction(self, dezimalbruch: float) -> Tuple[int, int]:
+    def _format_faktoren(self, faktoren: List[int]) -> str:
         """
-        Wandelt einen Dezimalbruch in einen gemeinen Bruch um.
+        Formatiert Primfaktoren mit Exponenten, z.B. "2^3 · 3^2 · 5".
         
         Args:
-            dezimalbruch: Der umzuwandelnde Dezimalbruch
+            faktoren: Aufsteigende Primfaktoren mit Vielfachheit
 
         Returns:
-            Tuple[int, int]: (Zaehler, Nenner)
+            str: Die formatierte Zerlegung
         """
-        # Vorzeichenbehandlung
-        sign = 1 if dezimalbruch >= 0 else -1
-        dezimalbruch = abs(dezimalbruch)
+        if not faktoren:
+            return "1"
+        
+        teile = []
+        for faktor in sorted(set(faktoren)):
+            exponent = faktoren.count(faktor)
+            teile.append(f"{faktor}^{exponent}" if exponent > 1 else str(faktor))
+        return " · ".join(teile)
+    
+    def iter_primzahlen(self, untergrenze: int, obergrenze: int) -> Iterator[int]:
+        """
+        Liefert alle Primzahlen in einem Bereich als Generator.
         
-        # Ganzzahligen Teil extrahieren
-        ganzzahl = int(dezimalbruch)
-        nachkomma = dezimalbruch - ganzzahl
+        Verwendet ein segmentiertes Sieb des Eratosthenes, dessen
+        Speicherbedarf durch die Segmentgroesse begrenzt ist.
         
-        # Abbruch, wenn es keine Nachkommastellen gibt
-        if nachkomma == 0:
-            return sign * ganzzahl, 1
-
-        common_fractions = {
-            0.25: (1, 4),
-            0.33: (1, 3),
-            0.333: (1, 3),
-            0.5: (1, 2),
-            0.75: (3, 4),
-            0.2: (1, 5),
-            0.4: (2, 5),
-            0.6: (3, 5),
-            0.8: (4, 5),
-            0.125: (1, 8),
-            0.375: (3, 8),
-            0.625: (5, 8),
-            0.875: (7, 8),
-            0.33333333: (1, 3),
-            0.66666667: (2, 3),
-            0.16666667: (1, 6),
-            0.83333333: (5, 6),
-            0.11111111: (1, 9),
-            0.22222222: (2, 9),
-            0.44444444: (4, 9),
-            0.55555556: (5, 9),
-            0.77777778: (7, 9),
-            0.88888889: (8, 9)
-        }
-        
-        # Rundungsfehler tolerieren
-        for value, fraction in common_fractions.items():
-            if abs(nachkomma - value) < 1e-6:
-                z, n = fraction
-                return sign * (ganzzahl * n + z), n
-        
-        # Umwandlung in Bruch mit Kettenbruch-Approximation
-        max_nenner = 1000000  # Maximaler Nenner
-        
-        # Kontinuierliche Bruch-Approximation
-        h1, h2 = 1, 0
-        k1, k2 = 0, 1
-        b = dezimalbruch
-        
-        while k1 < max_nenner:
-            a = int(b)
-            aux = h1
-            h1 = a * h1 + h2
-            h2 = aux
-            aux = k1
-            k1 = a * k1 + k2
-            k2 = aux
-            b = 1 / (b - a) if b - a != 0 else 0
-            
-            if abs(dezimalbruch - h1 / k1) < 1e-10:
-                break
-        
-        zaehler = ganzzahl * k1 + h1
-        nenner = k1
+        Args:
+            untergrenze: Die untere Grenze des Bereichs
+            obergrenze: Die obere Grenze des Bereichs
 
-        return sign * h1, k1
+        Returns:
+            Iterator[int]: Die Primzahlen im Bereich in aufsteigender Reihenfolge
+        """
+        return iter_primes(untergrenze, obergrenze)
     
-    def _round_significant(self, value: float, digits: int) -> float:
+    def _optional_int(self, value: Any) -> Optional[int]:
         """
-        Rundet einen Wert auf die angegebene Anzahl signifikanter Stellen.
+        Wandelt einen optionalen Parameter in eine Ganzzahl um.
         
         Args:
-            value: Der zu rundende Wert
-            digits: Anzahl der signifikanten Stellen
+            value: Der Parameter (leer fuer keinen Wert)
 
         Returns:
-            float: Der gerundete Wert
+            Optional[int]: Die Zahl oder None bei leerer Eingabe
         """
-        if value == 0:
-            return 0
-        
-        from math import log10, floor
+        text = str(value).strip()
+        return int(text) if text else None
+    
+    def _decimal_to_fraction(self, dezimalbruch: str, max_nenner: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Wandelt einen Dezimalbruch in einen gemeinen Bruch um.
         
-        # Feststellen der Zehnerpotenz
-        magnitude = floor(log10(abs(value)))
+        Gerechnet wird exakt mit dem eingegebenen Text statt mit einer
+        Gleitkommazahl. Mit max_nenner wird die beste Naeherung ueber die
+        Kettenbruchentwicklung in O(log Nenner) Schritten bestimmt.
         
-        # Runden auf die gewuenschte Anzahl signifikanter Stellen
-        factor = 10 ** (digits - 1 - magnitude)
-        return round(value * factor) / factor
\ No newline at end of file
+        Args:
+            dezimalbruch: Der umzuwandelnde Dezimalbruch, z.B. "0.375" oder "0.(3)"
+            max_nenner: Groesster erlaubter Nenner (None = exakt)
+
+        Returns:
+            Tuple[int, int]: (Zaehler, Nenner)
+        """
+        bruch = best_rational(parse_decimal(dezimalbruch), max_nenner)
+        return bruch.numerator, bruch.denominator
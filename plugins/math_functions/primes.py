@@ -0,0 +1,446 @@
+# plugins/math_functions/primes.py
+
+import random
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import compress, islice
+from math import gcd, isqrt
+from typing import Iterator, List, Optional, Tuple
+
+# Anzahl ungerader Zahlen pro Segment (ein Byte je Zahl)
+SEGMENT_SIZE = 1 << 18
+
+# Zwischengespeicherte Basisprimzahlen (ungerade) bis _base_limit
+_base_primes: List[int] = []
+_base_limit = 1
+
+# Bis zu dieser Wurzel der Obergrenze werden Basisprimzahlen fuer das Sieb erzeugt;
+# darueber wird nur mit kleinen Primzahlen vorgesiebt und mit Miller-Rabin geprueft
+BASE_PRIME_LIMIT = 10**7
+PRESIEVE_LIMIT = 1 << 16
+
+# Kleine Primzahlen fuer Probedivision vor Miller-Rabin und Pollard-Rho
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+# Die ersten 13 Primzahlen als Basen sind deterministisch fuer n < 3.3 * 10^24
+# (damit fuer alle 64-Bit-Zahlen); darueber kommen Zufallsbasen hinzu
+_MR_BASES = _SMALL_PRIMES[:13]
+_MR_DETERMINISTIC_LIMIT = 3317044064679887385961981
+_MR_EXTRA_ROUNDS = 20
+
+
+def base_primes(limit: int) -> List[int]:
+    """
+    Gibt alle ungeraden Primzahlen bis limit zurueck.
+
+    Die Tabelle wird zwischengespeichert und nur bei Bedarf vergroessert.
+
+    Args:
+        limit: Obergrenze (einschliesslich)
+
+    Returns:
+        List[int]: Ungerade Primzahlen <= limit
+    """
+    global _base_primes, _base_limit
+
+    if limit > _base_limit:
+        # Einfaches Sieb nur ueber ungerade Zahlen: Index i steht fuer 2i + 1
+        sieve_limit = max(limit, 2 * _base_limit)
+        sieve = bytearray([1]) * ((sieve_limit + 1) // 2)
+        sieve[0] = 0
+        for i in range(1, isqrt(sieve_limit) // 2 + 1):
+            if sieve[i]:
+                p = 2 * i + 1
+                start = p * p // 2
+                sieve[start::p] = bytes(len(range(start, len(sieve), p)))
+        _base_primes = list(compress(range(1, 2 * len(sieve), 2), sieve))
+        _base_limit = sieve_limit
+
+    if _base_primes and _base_primes[-1] > limit:
+        return _base_primes[:bisect_right(_base_primes, limit)]
+    return _base_primes
+
+
+def is_prime(n: int) -> bool:
+    """
+    Prueft mit Miller-Rabin, ob eine Zahl eine Primzahl ist.
+
+    Fuer n < 3.3 * 10^24 (insbesondere alle 64-Bit-Zahlen) ist das Ergebnis
+    mit festen Basen exakt, darueber probabilistisch mit einer
+    Fehlerwahrscheinlichkeit unter 4^-33.
+
+    Args:
+        n: Die zu pruefende Zahl
+
+    Returns:
+        bool: True, wenn n eine Primzahl ist, sonst False
+    """
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+
+    # n - 1 = d * 2^s mit ungeradem d
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+
+    bases = list(_MR_BASES)
+    if n >= _MR_DETERMINISTIC_LIMIT:
+        bases += [random.randrange(2, n - 1) for _ in range(_MR_EXTRA_ROUNDS)]
+
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def _pollard_brent(n: int) -> int:
+    """
+    Findet einen nichttrivialen Teiler einer zusammengesetzten Zahl (Pollard-Rho nach Brent).
+
+    Args:
+        n: Ungerade zusammengesetzte Zahl ohne kleine Primfaktoren
+
+    Returns:
+        int: Ein Teiler d mit 1 < d < n
+    """
+    # Quadratzahlen zuerst, dort findet Rho oft nur n selbst
+    root = isqrt(n)
+    if root * root == n:
+        return root
+
+    while True:
+        y = random.randrange(1, n)
+        c = random.randrange(1, n)
+        m = 128
+        g = r = q = 1
+
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                # Produkte mehrerer Differenzen sammeln, gcd nur einmal pro Block
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += m
+            r *= 2
+
+        if g == n:
+            # Block zu grob: schrittweise wiederholen
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = gcd(abs(x - ys), n)
+
+        if g != n:
+            return g
+
+
+def factorize(n: int) -> List[int]:
+    """
+    Zerlegt eine Zahl in ihre Primfaktoren.
+
+    Kleine Primfaktoren werden per Probedivision abgespalten, der Rest mit
+    Pollard-Rho (Brent) zerlegt und die Faktoren mit Miller-Rabin bestaetigt.
+
+    Args:
+        n: Die zu zerlegende Zahl (n >= 1)
+
+    Returns:
+        List[int]: Primfaktoren aufsteigend, mit Vielfachheit (leer fuer n = 1)
+    """
+    factors: List[int] = []
+    for p in _SMALL_PRIMES:
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+
+    pending = [n] if n > 1 else []
+    while pending:
+        m = pending.pop()
+        if is_prime(m):
+            factors.append(m)
+        else:
+            d = _pollard_brent(m)
+            pending.extend((d, m // d))
+
+    factors.sort()
+    return factors
+
+
+def iter_segments(untergrenze: int, obergrenze: int,
+                  segment_size: int = SEGMENT_SIZE) -> Iterator[Tuple[int, bytearray]]:
+    """
+    Segmentiertes Sieb des Eratosthenes ueber die ungeraden Zahlen eines Bereichs.
+
+    Jedes Segment ist ein bytearray, in dem Index i fuer die Zahl start + 2i
+    steht (1 = Primzahl). Der Speicherbedarf ist durch die Segmentgroesse
+    begrenzt, unabhaengig von der Obergrenze.
+
+    Duenne Bereiche weit oben (Wurzel der Obergrenze ueber BASE_PRIME_LIMIT
+    oder Bereich schmaler als die Wurzel) werden nur mit kleinen Primzahlen
+    vorgesiebt; die verbleibenden Kandidaten prueft Miller-Rabin.
+
+    Args:
+        untergrenze: Untere Grenze (einschliesslich)
+        obergrenze: Obere Grenze (einschliesslich)
+        segment_size: Anzahl ungerader Zahlen pro Segment
+
+    Returns:
+        Iterator[Tuple[int, bytearray]]: (erste ungerade Zahl des Segments, Markierungen)
+    """
+    start = max(3, untergrenze) | 1
+    if start > obergrenze:
+        return
+
+    root = isqrt(obergrenze)
+    sieve_limit = root
+    if root > _base_limit and (root > BASE_PRIME_LIMIT or obergrenze - start < root):
+        sieve_limit = min(root, PRESIEVE_LIMIT)
+    primes = base_primes(sieve_limit)
+
+    while start <= obergrenze:
+        size = min(segment_size, (obergrenze - start) // 2 + 1)
+        end = start + 2 * (size - 1)
+        segment = bytearray([1]) * size
+
+        for p in primes:
+            square = p * p
+            if square > end:
+                break
+            # Erstes ungerades Vielfaches von p im Segment, mindestens p^2
+            first = max(square, (start + p - 1) // p * p)
+            if not first & 1:
+                first += p
+            index = (first - start) // 2
+            if index < size:
+                segment[index::p] = bytes((size - 1 - index) // p + 1)
+
+        if sieve_limit < root:
+            for index in compress(range(size), segment):
+                if not is_prime(start + 2 * index):
+                    segment[index] = 0
+
+        yield start, segment
+        start = end + 2
+
+
+def iter_primes(untergrenze: int, obergrenze: int) -> Iterator[int]:
+    """
+    Liefert alle Primzahlen eines Bereichs aufsteigend.
+
+    Args:
+        untergrenze: Untere Grenze (einschliesslich)
+        obergrenze: Obere Grenze (einschliesslich)
+
+    Returns:
+        Iterator[int]: Primzahlen im Bereich
+    """
+    if untergrenze <= 2 <= obergrenze:
+        yield 2
+
+    for start, segment in iter_segments(untergrenze, obergrenze):
+        yield from compress(range(start, start + 2 * len(segment), 2), segment)
+
+
+class PrimeRange:
+    """
+    Primzahlen eines Bereichs, die erst bei Bedarf erzeugt werden.
+
+    Gespeichert werden nur die Grenzen; Anzahl, erste und letzte Primzahl
+    werden beim ersten Zugriff ermittelt, die Primzahlen selbst werden
+    seitenweise oder als Iterator geliefert. Der Speicherbedarf ist daher
+    unabhaengig von der Anzahl der Primzahlen im Bereich.
+    """
+
+    # Bis zu dieser Anzahl werden alle Primzahlen direkt angezeigt
+    INLINE_LIMIT = 20
+
+    def __init__(self, untergrenze: int, obergrenze: int):
+        self.untergrenze = untergrenze
+        self.obergrenze = obergrenze
+        self._count: Optional[int] = None
+        self._last: Optional[int] = None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter_primes(self.untergrenze, self.obergrenze)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def count(self) -> int:
+        """Anzahl der Primzahlen im Bereich (ueber count_primes, ohne Liste)."""
+        if self._count is None:
+            self._count = count_primes(self.untergrenze, self.obergrenze)
+        return self._count
+
+    @property
+    def first(self) -> Optional[int]:
+        """Kleinste Primzahl im Bereich oder None."""
+        return next(iter(self), None)
+
+    @property
+    def last(self) -> Optional[int]:
+        """Groesste Primzahl im Bereich oder None."""
+        if self._last is None:
+            width = 1024
+            while True:
+                start = max(self.untergrenze, self.obergrenze - width + 1)
+                window = list(iter_primes(start, self.obergrenze))
+                if window or start == self.untergrenze:
+                    self._last = window[-1] if window else None
+                    break
+                width *= 2
+        return self._last
+
+    def page(self, page_index: int, page_size: int = 100) -> List[int]:
+        """
+        Gibt eine Seite von Primzahlen zurueck.
+
+        Segmente vor der gewuenschten Seite werden nur gezaehlt, nicht in
+        Listen umgewandelt.
+
+        Args:
+            page_index: Nummer der Seite (ab 0)
+            page_size: Anzahl der Primzahlen pro Seite
+
+        Returns:
+            List[int]: Primzahlen der Seite (leer hinter dem Ende)
+        """
+        skip = page_index * page_size
+        result: List[int] = []
+
+        if self.untergrenze <= 2 <= self.obergrenze:
+            if skip == 0:
+                result.append(2)
+            else:
+                skip -= 1
+
+        for start, segment in iter_segments(self.untergrenze, self.obergrenze):
+            if len(result) >= page_size:
+                break
+            found = segment.count(1)
+            if skip >= found:
+                skip -= found
+                continue
+            numbers = compress(range(start, start + 2 * len(segment), 2), segment)
+            result.extend(islice(numbers, skip, skip + page_size - len(result)))
+            skip = 0
+
+        return result[:page_size]
+
+    def summary(self) -> str:
+        """Kurzbeschreibung: alle Primzahlen bei kleinen Bereichen, sonst Anzahl und Grenzen."""
+        if self.count == 0:
+            return "keine"
+        if self.count <= self.INLINE_LIMIT:
+            return ", ".join(map(str, self))
+        return f"{self.count} Primzahlen ({self.first} ... {self.last})"
+
+    def __str__(self) -> str:
+        return self.summary()
+
+
+# Bekannte Werte von pi(10^k) als Stuetzstellen
+_PI_CHECKPOINTS = {
+    10: 4, 10**2: 25, 10**3: 168, 10**4: 1229, 10**5: 9592, 10**6: 78498,
+    10**7: 664579, 10**8: 5761455, 10**9: 50847534, 10**10: 455052511,
+    10**11: 4118054813, 10**12: 37607912018,
+}
+
+# Bis zu dieser Bereichsbreite wird im Sieb gezaehlt statt pi(x) zu berechnen
+SIEVE_COUNT_LIMIT = 2 * 10**7
+
+
+def count_primes(untergrenze: int, obergrenze: int) -> int:
+    """
+    Zaehlt die Primzahlen eines Bereichs, ohne sie zu erzeugen.
+
+    Schmale Bereiche werden im segmentierten Sieb gezaehlt (bytearray.count),
+    breite Bereiche ueber pi(obergrenze) - pi(untergrenze - 1).
+
+    Args:
+        untergrenze: Untere Grenze (einschliesslich)
+        obergrenze: Obere Grenze (einschliesslich)
+
+    Returns:
+        int: Anzahl der Primzahlen im Bereich
+    """
+    if obergrenze < 2 or untergrenze > obergrenze:
+        return 0
+
+    if obergrenze - untergrenze <= SIEVE_COUNT_LIMIT:
+        return _sieve_count(untergrenze, obergrenze)
+
+    return prime_pi(obergrenze) - prime_pi(untergrenze - 1)
+
+
+def _sieve_count(untergrenze: int, obergrenze: int) -> int:
+    """Zaehlt die Primzahlen eines Bereichs im segmentierten Sieb (ohne Liste)."""
+    count = 1 if untergrenze <= 2 <= obergrenze else 0
+    for _, segment in iter_segments(untergrenze, obergrenze):
+        count += segment.count(1)
+    return count
+
+
+@lru_cache(maxsize=64)
+def prime_pi(n: int) -> int:
+    """
+    Primzahlzaehlfunktion pi(n).
+
+    Verwendet Stuetzstellen, fuer kleine n das Sieb und sonst den
+    kombinatorischen Algorithmus nach Lucy/Legendre mit O(n^(3/4))
+    Schritten und O(sqrt(n)) Speicher.
+
+    Args:
+        n: Obergrenze (einschliesslich)
+
+    Returns:
+        int: Anzahl der Primzahlen <= n
+    """
+    if n < 2:
+        return 0
+    if n in _PI_CHECKPOINTS:
+        return _PI_CHECKPOINTS[n]
+    if n <= SIEVE_COUNT_LIMIT:
+        return _sieve_count(2, n)
+
+    r = isqrt(n)
+    # small[v] = Anzahl der Zahlen 2..v, die noch nicht gestrichen sind (v <= r)
+    # large[i] = dasselbe fuer v = n // i
+    small = [v - 1 for v in range(r + 1)]
+    small[0] = 0
+    large = [0] + [n // i - 1 for i in range(1, r + 1)]
+
+    for p in range(2, r + 1):
+        if small[p] == small[p - 1]:
+            continue  # p ist keine Primzahl
+
+        sp = small[p - 1]
+        square = p * p
+        limit = min(r, n // square)
+        bound = min(limit, r // p)
+
+        # Alle rechten Seiten verwenden die Werte vor diesem Schritt
+        large[1:bound + 1] = [large[i] - large[i * p] + sp for i in range(1, bound + 1)]
+        large[bound + 1:limit + 1] = [large[i] - small[n // (i * p)] + sp for i in range(bound + 1, limit + 1)]
+        if square <= r:
+            small[square:] = [small[v] - small[v // p] + sp for v in range(square, r + 1)]
+
+    return large[1]
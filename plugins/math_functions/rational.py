@@ -0,0 +1,125 @@
+# plugins/math_functions/rational.py
+
+import re
+from fractions import Fraction
+from typing import Iterator, List, Optional
+
+# Dezimalzahl mit optionaler Periode in Klammern, z.B. "0.(3)" oder "-1,2(34)"
+_REPEATING_PATTERN = re.compile(r"^([+-]?)(\d*)[.,](\d*)\((\d+)\)$")
+
+
+def parse_decimal(text: str) -> Fraction:
+    """
+    Wandelt eine Dezimalzahl exakt in einen Bruch um.
+
+    Neben gewoehnlichen Dezimalzahlen ("0.125", "1e-3") und Bruechen ("3/4")
+    werden periodische Dezimalzahlen in Klammerschreibweise unterstuetzt:
+    "0.(3)" = 1/3, "1.2(34)" = 1.2343434...
+
+    Args:
+        text: Die Dezimalzahl als Text (Komma oder Punkt als Trennzeichen)
+
+    Returns:
+        Fraction: Der exakte Wert
+
+    Raises:
+        ValueError: Wenn der Text keine gueltige Zahl ist
+    """
+    text = str(text).strip().replace(" ", "")
+
+    match = _REPEATING_PATTERN.match(text)
+    if match:
+        sign, ganzzahl, vorperiode, periode = match.groups()
+        # x = ganzzahl.vorperiode + periode / (10^len(vorperiode) * (10^len(periode) - 1))
+        wert = Fraction(int(ganzzahl or "0"))
+        if vorperiode:
+            wert += Fraction(int(vorperiode), 10 ** len(vorperiode))
+        wert += Fraction(int(periode), 10 ** len(vorperiode) * (10 ** len(periode) - 1))
+        return -wert if sign == "-" else wert
+
+    try:
+        return Fraction(text.replace(",", "."))
+    except (ValueError, ZeroDivisionError):
+        raise ValueError(f"Ungueltiger Dezimalbruch: {text}")
+
+
+def continued_fraction(x: Fraction) -> List[int]:
+    """
+    Berechnet die Kettenbruchentwicklung [a0; a1, a2, ...] eines Bruchs.
+
+    Der euklidische Algorithmus benoetigt O(log Nenner) Schritte.
+
+    Args:
+        x: Der Bruch
+
+    Returns:
+        List[int]: Die Teilnenner
+    """
+    terms = []
+    p, q = x.numerator, x.denominator
+    while q:
+        a = p // q
+        terms.append(a)
+        p, q = q, p - a * q
+    return terms
+
+
+def convergents(x: Fraction) -> Iterator[Fraction]:
+    """
+    Liefert alle Naeherungsbrueche der Kettenbruchentwicklung.
+
+    Der letzte Naeherungsbruch ist x selbst.
+
+    Args:
+        x: Der Bruch
+
+    Returns:
+        Iterator[Fraction]: Naeherungsbrueche mit wachsendem Nenner
+    """
+    h0, h1 = 0, 1
+    k0, k1 = 1, 0
+    for a in continued_fraction(x):
+        h0, h1 = h1, a * h1 + h0
+        k0, k1 = k1, a * k1 + k0
+        yield Fraction(h1, k1)
+
+
+def best_rational(x: Fraction, max_denominator: Optional[int] = None) -> Fraction:
+    """
+    Beste rationale Naeherung mit begrenztem Nenner.
+
+    Laeuft die Kettenbruchentwicklung bis zum letzten Naeherungsbruch, dessen
+    Nenner die Grenze einhaelt, und vergleicht ihn mit dem groesstmoeglichen
+    Zwischenbruch (Stern-Brocot-Schritt) zwischen den beiden letzten
+    Naeherungsbruechen.
+
+    Args:
+        x: Der anzunaehernde Bruch
+        max_denominator: Groesster erlaubter Nenner (None = exakt)
+
+    Returns:
+        Fraction: Der naechstgelegene Bruch mit Nenner <= max_denominator
+    """
+    if max_denominator is None or x.denominator <= max_denominator:
+        return x
+    if max_denominator < 1:
+        raise ValueError("Der maximale Nenner muss mindestens 1 sein.")
+
+    h0, h1 = 0, 1
+    k0, k1 = 1, 0
+    p, q = x.numerator, x.denominator
+    while True:
+        a = p // q
+        k2 = k0 + a * k1
+        if k2 > max_denominator:
+            break
+        h0, h1 = h1, h0 + a * h1
+        k0, k1 = k1, k2
+        p, q = q, p - a * q
+
+    t = (max_denominator - k0) // k1
+    zwischenbruch = Fraction(h0 + t * h1, k0 + t * k1)
+    naeherungsbruch = Fraction(h1, k1)
+    if abs(naeherungsbruch - x) <= abs(zwischenbruch - x):
+        return naeherungsbruch
+    return zwischenbruch
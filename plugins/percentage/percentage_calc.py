@@ -1,7 +1,10 @@
 # plugins/percentage/percentage_calc.py
 
-from typing import List, Tuple, Any
-from core.plugin_interface import IPlugin, PluginInfo, Command
+import math
+from typing import List, Tuple, Any, Sequence
+from core.plugin_interface import IPlugin, PluginInfo, Command, CalculationResult
+from core.money import get_money_context
+from core.vectorize import batch_apply
 
 class PercentageCalculator(IPlugin):
     """Implementiert den Prozentrechner."""
@@ -10,12 +13,13 @@ class PercentageCalculator(IPlugin):
         """Initialisiert einen neuen Prozentrechner."""
         self.name = "Prozentrechnung"
         self.commands = [
-            Command("%dazu", ["Grundwert", "Prozentsatz"]),
-            Command("%weg", ["Grundwert", "Prozentsatz"]),
-            Command("%davon", ["Grundwert", "Prozentsatz"]),
-            Command("%Satz", ["Grundwert", "Prozentwert"]),
-            Command("Bruttopreis", ["Nettopreis", "Steuersatz"]),
-            Command("Nettopreis", ["Bruttopreis", "Steuersatz"])
+            Command("%dazu", ["Grundwert", "Prozentsatz"], cacheable=True),
+            Command("%weg", ["Grundwert", "Prozentsatz"], cacheable=True),
+            Command("%davon", ["Grundwert", "Prozentsatz"], cacheable=True),
+            Command("%Satz", ["Grundwert", "Prozentwert"], cacheable=True),
+            Command("Bruttopreis", ["Nettopreis", "Steuersatz"], cacheable=True),
+            Command("Nettopreis", ["Bruttopreis", "Steuersatz"], cacheable=True),
+            Command("Rechnungszeile", ["Nettobetrag", "Bruttobetrag", "Steuersatz"], cacheable=True)
         ]
     
     def load(self) -> None:
@@ -31,7 +35,7 @@ class PercentageCalculator(IPlugin):
         """
         return PluginInfo(self.name, self.commands)
     
-    def exec(self, command_name: str, params: List[Any]) -> Tuple[str, Any]:
+    def exec(self, command_name: str, params: List[Any]) -> CalculationResult:
         """
         Fuehrt einen Befehl mit den gegebenen Parametern aus.
         
@@ -40,39 +44,45 @@ class PercentageCalculator(IPlugin):
             params: Liste der Parameter
 
         Returns:
-            Tuple[str, Any]: (Formatierter Text der Berechnung, Ergebniswert)
+            CalculationResult: Ergebniswert mit verzoegert erzeugtem Anzeigetext
         """
+        # Geldbetraege je nach Rechenart als float, Decimal oder ganze Cent
+        money = get_money_context()
+        
         if command_name == "%dazu":
             # Prozent dazu
-            grundwert = float(params[0])
-            prozentsatz = float(params[1])
+            grundwert = money.amount(params[0])
+            prozentsatz = money.percent(params[1])
             
-            prozentwert = grundwert * prozentsatz / 100
-            ergebnis = grundwert + prozentwert
+            prozentwert = money.fraction(grundwert, prozentsatz, 100)
+            ergebnis = money.output(grundwert + prozentwert)
+            grundwert, prozentsatz = money.output(grundwert), money.number(params[1])
             
-            return f"Prozentrechnung: {grundwert} + {prozentsatz}% = {ergebnis}", ergebnis
+            return CalculationResult(ergebnis, lambda: f"Prozentrechnung: {grundwert} + {prozentsatz}% = {ergebnis}")
             
         elif command_name == "%weg":
             # Prozent weg
-            grundwert = float(params[0])
-            prozentsatz = float(params[1])
+            grundwert = money.amount(params[0])
+            prozentsatz = money.percent(params[1])
             
-            prozentwert = grundwert * prozentsatz / 100
-            ergebnis = grundwert - prozentwert
+            prozentwert = money.fraction(grundwert, prozentsatz, 100)
+            ergebnis = money.output(grundwert - prozentwert)
+            grundwert, prozentsatz = money.output(grundwert), money.number(params[1])
             
-            return f"Prozentrechnung: {grundwert} - {prozentsatz}% = {ergebnis}", ergebnis
+            return CalculationResult(ergebnis, lambda: f"Prozentrechnung: {grundwert} - {prozentsatz}% = {ergebnis}")
             
         elif command_name == "%davon":
             # Prozent davon
-            grundwert = float(params[0])
-            prozentsatz = float(params[1])
+            grundwert = money.amount(params[0])
+            prozentsatz = money.percent(params[1])
             
-            ergebnis = grundwert * prozentsatz / 100
+            ergebnis = money.output(money.fraction(grundwert, prozentsatz, 100))
+            grundwert, prozentsatz = money.output(grundwert), money.number(params[1])
             
-            return f"Prozentrechnung: {prozentsatz}% von {grundwert} = {ergebnis}", ergebnis
+            return CalculationResult(ergebnis, lambda: f"Prozentrechnung: {prozentsatz}% von {grundwert} = {ergebnis}")
             
         elif command_name == "%Satz":
-            # Prozentsatz
+            # Prozentsatz (kein Geldbetrag, daher immer Gleitkomma)
             grundwert = float(params[0])
             prozentwert = float(params[1])
             
@@ -81,28 +91,200 @@ class PercentageCalculator(IPlugin):
             
             prozentsatz = (prozentwert / grundwert) * 100
             
-            return f"Prozentrechnung: {prozentwert} ist {prozentsatz}% von {grundwert}", prozentsatz
+            return CalculationResult(prozentsatz, lambda: f"Prozentrechnung: {prozentwert} ist {prozentsatz}% von {grundwert}")
             
         elif command_name == "Bruttopreis":
             # Bruttopreis aus Nettopreis
-            nettopreis = float(params[0])
-            steuersatz = float(params[1])
+            nettopreis = money.amount(params[0])
+            steuersatz = money.percent(params[1])
             
-            steuer = nettopreis * steuersatz / 100
-            bruttopreis = nettopreis + steuer
+            steuer = money.fraction(nettopreis, steuersatz, 100)
+            bruttopreis = money.output(nettopreis + steuer)
+            nettopreis, steuersatz = money.output(nettopreis), money.number(params[1])
             
-            return f"Prozentrechnung: Nettopreis {nettopreis} + {steuersatz}% MwSt = Bruttopreis {bruttopreis}", bruttopreis
+            return CalculationResult(bruttopreis, lambda: f"Prozentrechnung: Nettopreis {nettopreis} + {steuersatz}% MwSt = Bruttopreis {bruttopreis}")
             
         elif command_name == "Nettopreis":
             # Nettopreis aus Bruttopreis
-            bruttopreis = float(params[0])
-            steuersatz = float(params[1])
+            bruttopreis = money.amount(params[0])
+            steuersatz = money.percent(params[1])
             
             if steuersatz == -100:
                 raise ValueError("Der Steuersatz darf nicht -100% sein.")
             
-            nettopreis = bruttopreis * 100 / (100 + steuersatz)
+            nettopreis = money.output(money.fraction(bruttopreis, 100, 100 + steuersatz))
+            bruttopreis, steuersatz = money.output(bruttopreis), money.number(params[1])
+            
+            return CalculationResult(nettopreis, lambda: f"Prozentrechnung: Bruttopreis {bruttopreis} / (100 + {steuersatz}%) = Nettopreis {nettopreis}")
+        
+        elif command_name == "Rechnungszeile":
+            # Fehlende Betraege einer Rechnungszeile aus Netto oder Brutto ergaenzen
+            steuersatz = money.percent(params[2])
+            
+            if not _is_blank(params[0]):
+                # Netto gegeben: Steuer auf Cent runden, Brutto = Netto + Steuer
+                nettobetrag = money.amount(params[0])
+                steuer = money.round(money.fraction(nettobetrag, steuersatz, 100))
+                bruttobetrag = money.round(nettobetrag + steuer)
+            elif not _is_blank(params[1]):
+                # Nur Brutto gegeben: Netto auf Cent runden, Steuer = Brutto - Netto
+                bruttobetrag = money.amount(params[1])
+                if steuersatz == -100:
+                    raise ValueError("Der Steuersatz darf nicht -100% sein.")
+                nettobetrag = money.round(money.fraction(bruttobetrag, 100, 100 + steuersatz))
+                steuer = money.round(bruttobetrag - nettobetrag)
+            else:
+                raise ValueError("Es muss ein Netto- oder ein Bruttobetrag angegeben werden.")
+            
+            nettobetrag, steuer, bruttobetrag = (money.output(x) for x in (nettobetrag, steuer, bruttobetrag))
+            steuersatz = money.number(params[2])
+            
+            return CalculationResult(
+                (nettobetrag, steuer, bruttobetrag),
+                lambda: f"Rechnungszeile: Netto {nettobetrag} + {steuersatz}% MwSt {steuer} = Brutto {bruttobetrag}"
+            )
+        
+        raise ValueError(f"Unbekannter Befehl: {command_name}")
+    
+    # Formeln fuer den Batch in ganzen Cent mit dem Prozentsatz z/n:
+    # (formel(div, cents, z, n), ungueltig(cents, z, n))
+    CENTS_FORMULAS = {
+        "%dazu": (lambda div, c, z, n: c + div(c * z, 100 * n), None),
+        "%weg": (lambda div, c, z, n: c - div(c * z, 100 * n), None),
+        "%davon": (lambda div, c, z, n: div(c * z, 100 * n), None),
+        "Bruttopreis": (lambda div, c, z, n: c + div(c * z, 100 * n), None),
+        "Nettopreis": (
+            lambda div, c, z, n: div(c * 100 * n, 100 * n + z),
+            lambda c, z, n: z == -100 * n
+        ),
+    }
+    
+    def exec_batch(self, command_name: str, columns: List[Sequence[Any]]) -> Any:
+        """
+        Fuehrt einen Befehl vektorisiert fuer ganze Parameterspalten aus.
+        
+        Args:
+            command_name: Name des auszufuehrenden Befehls
+            columns: Je Parameter eine Spalte (Liste oder NumPy-Array)
+
+        Returns:
+            Any: Ergebnisspalte; ungueltige Zeilen sind NaN
+        """
+        money = get_money_context()
+        
+        if money.mode == "cents" and command_name in self.CENTS_FORMULAS:
+            # Ganze Cent und exakte Prozentsaetze als Bruch (vektorisiert mit NumPy)
+            formula, invalid = self.CENTS_FORMULAS[command_name]
+            return money.cents_apply(formula, columns[0], columns[1], invalid)
+        
+        if money.mode == "decimal":
+            # Decimal-Werte zeilenweise ueber exec
+            return super().exec_batch(command_name, columns)
+        
+        if command_name == "Rechnungszeile":
+            return self._invoice_batch(money, *columns)
+        
+        if command_name == "%dazu":
+            return batch_apply(lambda ops, g, p: g + g * p / 100, columns)
+            
+        elif command_name == "%weg":
+            return batch_apply(lambda ops, g, p: g - g * p / 100, columns)
+            
+        elif command_name == "%davon":
+            return batch_apply(lambda ops, g, p: g * p / 100, columns)
+            
+        elif command_name == "%Satz":
+            return batch_apply(
+                lambda ops, g, w: ops.div(w, g) * 100,
+                columns,
+                invalid=lambda g, w: g == 0
+            )
+            
+        elif command_name == "Bruttopreis":
+            return batch_apply(lambda ops, n, s: n + n * s / 100, columns)
+            
+        elif command_name == "Nettopreis":
+            return batch_apply(
+                lambda ops, b, s: ops.div(b * 100, 100 + s),
+                columns,
+                invalid=lambda b, s: s == -100
+            )
+        
+        return super().exec_batch(command_name, columns)
+    
+    def _invoice_batch(self, money: Any, netto: Sequence[Any], brutto: Sequence[Any],
+                       steuersatz: Sequence[Any]) -> Tuple[List[float], List[float], List[float]]:
+        """
+        Ergaenzt Netto, Steuer und Brutto fuer viele Rechnungszeilen.
+        
+        Zeilen mit Nettobetrag und Zeilen mit nur einem Bruttobetrag werden
+        getrennt jeweils in einem vektorisierten Durchlauf gerechnet (als
+        Gleitkommazahl oder in ganzen Cent) und danach wieder in die
+        Eingabereihenfolge gebracht. Ist beides angegeben, gilt der Nettobetrag;
+        Zeilen ohne beide Betraege werden gar nicht erst gerechnet.
+        
+        Args:
+            money: Die Rechenart fuer Geldbetraege (float oder cents)
+            netto: Spalte der Nettobetraege (leer, wenn unbekannt)
+            brutto: Spalte der Bruttobetraege (leer, wenn unbekannt)
+            steuersatz: Spalte der Steuersaetze in Prozent
+
+        Returns:
+            Tuple: Spalten (Netto, Steuer, Brutto); ungueltige Zeilen sind NaN
+        """
+        # Zeilen ohne Netto- und Bruttobetrag bleiben NaN und gehen in keinen Durchlauf
+        aus_netto = [i for i, betrag in enumerate(netto) if not _is_blank(betrag)]
+        aus_brutto = [i for i, betrag in enumerate(netto) if _is_blank(betrag) and not _is_blank(brutto[i])]
+        results = tuple([math.nan] * len(netto) for _ in range(3))
+        
+        for indices, betraege, (float_formula, cents_formula, invalid) in (
+            (aus_netto, netto, self.INVOICE_FROM_NET),
+            (aus_brutto, brutto, self.INVOICE_FROM_GROSS),
+        ):
+            if not indices:
+                continue
+            
+            betraege = [betraege[i] for i in indices]
+            saetze = [steuersatz[i] for i in indices]
+            if money.mode == "cents":
+                cents_invalid = (lambda c, z, n: invalid(c, z / n)) if invalid else None
+                teil = money.cents_apply(cents_formula, betraege, saetze, cents_invalid, outputs=3)
+            else:
+                teil = batch_apply(float_formula, [betraege, saetze], invalid=invalid, outputs=3)
             
-            return f"Prozentrechnung: Bruttopreis {bruttopreis} / (100 + {steuersatz}%) = Nettopreis {nettopreis}", nettopreis
+            for ergebnis, spalte in zip(results, teil):
+                for i, wert in zip(indices, spalte.tolist() if hasattr(spalte, "tolist") else spalte):
+                    ergebnis[i] = wert
         
-        raise ValueError(f"Unbekannter Befehl: {command_name}")
\ No newline at end of file
+        return results
+    
+    # Rechnungszeilen: (Gleitkommaformel, Centformel, ungueltig(betrag, steuersatz in Prozent))
+    INVOICE_FROM_NET = (
+        lambda ops, n, s: _invoice_from_net(n, ops.round(n * s / 100, 2), lambda x: ops.round(x, 2)),
+        lambda div, c, z, n: _invoice_from_net(c, div(c * z, 100 * n), lambda x: x),
+        None,
+    )
+    INVOICE_FROM_GROSS = (
+        lambda ops, b, s: _invoice_from_gross(ops.round(ops.div(b * 100, 100 + s), 2), b, lambda x: ops.round(x, 2)),
+        lambda div, c, z, n: _invoice_from_gross(div(c * 100 * n, 100 * n + z), c, lambda x: x),
+        lambda b, s: s == -100,
+    )
+
+
+def _is_blank(value: Any) -> bool:
+    """True fuer fehlende Betraege (leerer Text, None oder NaN)."""
+    if value is None:
+        return True
+    if isinstance(value, float):
+        return math.isnan(value)
+    return str(value).strip() == ""
+
+
+def _invoice_from_net(netto: Any, steuer: Any, cent: Any) -> Tuple[Any, Any, Any]:
+    """(Netto, Steuer, Brutto) aus Nettobetrag und bereits gerundeter Steuer."""
+    return netto, steuer, cent(netto + steuer)
+
+
+def _invoice_from_gross(netto: Any, brutto: Any, cent: Any) -> Tuple[Any, Any, Any]:
+    """(Netto, Steuer, Brutto) aus Bruttobetrag und bereits gerundetem Nettobetrag."""
+    return netto, cent(brutto - netto), brutto
@@ -0,0 +1,25 @@
+import os
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(TESTS_DIR)
+
+
+@pytest.fixture(params=["scalar", "numpy"])
+def backend(request, monkeypatch):
+    """
+    Fuehrt einen Test einmal zeilenweise (ohne NumPy) und einmal mit NumPy aus.
+
+    Fuer "scalar" wird NumPy in allen geladenen Modulen des Rechners
+    ausgeblendet (np = None), auch in den ueber den PluginManager geladenen
+    Plugins. "numpy" wird uebersprungen, wenn NumPy nicht installiert ist.
+    """
+    numpy = pytest.importorskip("numpy") if request.param == "numpy" else None
+    if numpy is None:
+        for module in list(sys.modules.values()):
+            pfad = getattr(module, "__file__", None) or ""
+            if pfad.startswith(REPO_DIR) and not pfad.startswith(TESTS_DIR) and getattr(module, "np", None) is not None:
+                monkeypatch.setattr(module, "np", None)
+    return request.param
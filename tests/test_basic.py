@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from core.expression_engine import evaluate_expression
+from core.plugin_interface import CalculationResult
+from core.rounding import round_significant
+from plugins.basic.basic_calc import BasicCalculator
+
+
+@pytest.mark.parametrize("ausdruck, erwartet", [
+    ("1+2*3", 7),
+    ("(1+2)*3", 9),
+    ("2x3:4", 1.5),
+    ("1,5 + 2,5", 4.0),
+    ("-3*-2", 6),
+    ("-(2+3)", -5),
+    ("10-4-3", 3),
+    ("2/4/2", 0.25),
+    ("1e3+.5", 1000.5),
+    ("((((((((((1))))))))))", 1),
+    ("", 0),
+])
+def test_expression_known_values(ausdruck, erwartet):
+    assert evaluate_expression(ausdruck) == erwartet
+
+
+def _random_expression(rng, tiefe=0):
+    if tiefe > 3 or rng.random() < 0.3:
+        return str(rng.randint(1, 99)) if rng.random() < 0.7 else f"{rng.uniform(0.5, 99):.3f}"
+    links, rechts = _random_expression(rng, tiefe + 1), _random_expression(rng, tiefe + 1)
+    ausdruck = f"{links}{rng.choice('+-*/')}{rechts}"
+    return f"({ausdruck})" if rng.random() < 0.5 else ausdruck
+
+
+def test_expression_matches_python_on_random_input():
+    rng = random.Random(4)
+    for _ in range(500):
+        ausdruck = _random_expression(rng)
+        try:
+            erwartet = eval(ausdruck)
+        except ZeroDivisionError:
+            with pytest.raises(ValueError):
+                evaluate_expression(ausdruck)
+            continue
+        assert evaluate_expression(ausdruck) == pytest.approx(erwartet, rel=1e-12), ausdruck
+
+
+def test_expression_deep_nesting_is_not_recursive():
+    assert evaluate_expression("(" * 5000 + "2" + ")" * 5000) == 2
+
+
+@pytest.mark.parametrize("ausdruck", ["1+", "2**3", "(1+2", "1+2)", "abc", "1/0", "import os"])
+def test_expression_rejects_invalid_input(ausdruck):
+    with pytest.raises(ValueError):
+        evaluate_expression(ausdruck)
+
+
+def test_calculation_result_renders_lazily():
+    aufrufe = []
+
+    def render():
+        aufrufe.append(1)
+        return "Text"
+
+    ergebnis = CalculationResult(42, render)
+    assert ergebnis.value == 42
+    assert aufrufe == []
+    assert ergebnis.text == "Text" and str(ergebnis) == "Text"
+    assert tuple(ergebnis) == ("Text", 42)
+    assert ergebnis[0] == "Text" and ergebnis[1] == 42 and len(ergebnis) == 2
+    assert aufrufe == [1]
+
+
+@pytest.mark.usefixtures("backend")
+def test_basic_exec_and_batch_match():
+    calculator = BasicCalculator()
+    ergebnis = calculator.exec("Berechnung", ["10:3"])
+    assert ergebnis.value == round_significant(10 / 3, 6) == 3.33333
+    assert ergebnis.text == "NR: 10:3 = 3.33333"
+
+    ausdruecke = ["1+1", "2x(3+4)", "1/0", "", "7:2", "abc"]
+    batch = calculator.exec_batch("Berechnung", [ausdruecke])
+    erwartet = []
+    for ausdruck in ausdruecke:
+        try:
+            erwartet.append(calculator.exec("Berechnung", [ausdruck]).value)
+        except ValueError:
+            erwartet.append(None)
+    assert batch == erwartet == [2, 14, None, 0, 3.5, None]
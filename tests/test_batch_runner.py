@@ -0,0 +1,121 @@
+import io
+import json
+import math
+import os
+import random
+from decimal import Decimal
+
+import pytest
+
+from core.batch_runner import BatchRunner
+from core.money import MoneyContext, get_money_context, set_money_context
+from plugins.credit.credit_calc import CreditCalculator
+from plugins.percentage.percentage_calc import PercentageCalculator
+
+PLUGIN_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "plugins")
+
+
+def _run(plugin, command_name, text, output_format="csv", chunk_size=10000):
+    runner = BatchRunner(plugin, command_name, chunk_size)
+    output = io.StringIO()
+    stats = runner.run(runner.read_rows(io.StringIO(text)), output, output_format)
+    return stats, output.getvalue().splitlines()
+
+
+@pytest.mark.usefixtures("backend")
+def test_malformed_rows_are_reported_per_row():
+    calculator = CreditCalculator()
+    text = "10000,3,12\nabc,3,12\n10000,3\n\n5000,0,10\n10000,3,x\n"
+
+    stats, lines = _run(calculator, "Ratenkredit (Laufzeit)", text)
+
+    assert stats.rows == 5
+    assert stats.invalid_rows == 3
+    rate = calculator.exec("Ratenkredit (Laufzeit)", [10000, 3, 12]).value
+    assert lines == [
+        f"10000,3,12,{rate}",
+        "abc,3,12",
+        "10000,3",
+        "5000,0,10,500.0",
+        "10000,3,x",
+    ]
+
+
+@pytest.mark.usefixtures("backend")
+def test_malformed_row_does_not_affect_other_chunks():
+    calculator = PercentageCalculator()
+    rows = [f"{100 + i},{i % 20}" for i in range(50)]
+    rows[17] = ",5"
+    rows[33] = "1e400x,5"
+
+    stats, lines = _run(calculator, "%davon", "\n".join(rows) + "\n", "jsonl", chunk_size=8)
+
+    assert stats.rows == 50
+    assert stats.invalid_rows == 2
+    records = [json.loads(line) for line in lines]
+    for i, record in enumerate(records):
+        if i in (17, 33):
+            assert record["result"] == []
+        else:
+            erwartet = calculator.exec("%davon", [100 + i, i % 20]).value
+            assert math.isclose(record["result"][0], erwartet, rel_tol=1e-12)
+
+
+class _StrictPlugin(PercentageCalculator):
+    """Plugin, dessen exec_batch bei einem ungueltigen Wert den ganzen Block ablehnt."""
+
+    def exec_batch(self, command_name, columns):
+        return [float(g) * float(p) / 100 for g, p in zip(*columns)]
+
+
+def test_failing_chunk_falls_back_to_single_rows():
+    stats, lines = _run(_StrictPlugin(), "%davon", "200,10\n,10\n300,abc\n50,50\n")
+
+    assert stats.invalid_rows == 2
+    assert lines == ["200,10,20.0", ",10", "300,abc", "50,50,25.0"]
+
+
+@pytest.mark.usefixtures("backend")
+def test_decimal_results_are_written_as_jsonl():
+    vorher = get_money_context()
+    set_money_context(MoneyContext("decimal"))
+    try:
+        calculator = CreditCalculator()
+        stats, lines = _run(calculator, "Ratenkredit (Laufzeit)", "10000,3,12\nabc,3,12\n", "jsonl")
+        rate = calculator.exec("Ratenkredit (Laufzeit)", [10000, 3, 12]).value
+    finally:
+        set_money_context(vorher)
+
+    assert isinstance(rate, Decimal)
+    assert stats.invalid_rows == 1
+    assert [json.loads(line)["result"] for line in lines] == [[str(rate)], []]
+
+
+@pytest.mark.parametrize("command_name, ordered", [
+    ("Ratenkredit (Laufzeit)", True),
+    ("Ratenkredit (Laufzeit)", False),
+    ("Tilgungsplan", True),
+])
+def test_parallel_executor_matches_serial_run(command_name, ordered):
+    from core.parallel_executor import ParallelBatchExecutor
+
+    rng = random.Random(6)
+    zeilen = [f"{rng.randint(1000, 90000)},{rng.uniform(0, 9):.2f},{rng.randint(1, 48)}" for _ in range(300)]
+    zeilen[10] = "abc,3,12"
+    zeilen[200] = "5000,3"
+    text = "\n".join(zeilen) + "\n"
+    calculator = CreditCalculator()
+
+    seriell_stats, seriell = _run(calculator, command_name, text, chunk_size=16)
+
+    runner = BatchRunner(calculator, command_name, 16)
+    executor = ParallelBatchExecutor(PLUGIN_DIR, "credit", command_name, workers=2, ordered=ordered)
+    output = io.StringIO()
+    stats = runner.run(runner.read_rows(io.StringIO(text)), output, executor=executor)
+    parallel = output.getvalue().splitlines()
+
+    assert (stats.rows, stats.invalid_rows) == (seriell_stats.rows, seriell_stats.invalid_rows) == (300, 2)
+    if ordered:
+        assert parallel == seriell
+    else:
+        assert sorted(parallel) == sorted(seriell)
@@ -0,0 +1,147 @@
+import math
+import random
+
+import pytest
+
+from plugins.credit.credit_calc import CreditCalculator
+
+
+def simulate_term(kreditbetrag, zinssatz, rate):
+    """Brute-Force-Referenz: Restschuld Monat fuer Monat verzinsen und tilgen."""
+    r = zinssatz / 100 / 12
+    restschuld = kreditbetrag
+    monate = 0
+    while True:
+        monate += 1
+        faellig = restschuld * (1 + r)
+        if faellig <= rate:
+            return monate, faellig
+        restschuld = faellig - rate
+        if restschuld <= CreditCalculator.RESTSCHULD_TOLERANZ:
+            return monate, rate + restschuld
+
+
+def _cases():
+    rng = random.Random(42)
+    cases = [
+        (10000, 0, 500),
+        (10000, 0, 300),
+        (10000, 6, 10100),
+        (100000, 3, 421.60),
+        (100000, 3, 421.6046),
+        (250000, 4.5, 1266.71),
+        (5000, 12, 50.01),
+    ]
+    for _ in range(300):
+        kreditbetrag = round(rng.uniform(500, 500000), 2)
+        zinssatz = round(rng.uniform(0, 15), 2)
+        min_rate = kreditbetrag * zinssatz / 100 / 12
+        rate = round(min_rate + rng.uniform(1, kreditbetrag / 6), 2)
+        cases.append((kreditbetrag, zinssatz, rate))
+    return cases
+
+
+@pytest.mark.parametrize("kreditbetrag, zinssatz, rate", _cases())
+def test_ratenhoehe_matches_simulation(kreditbetrag, zinssatz, rate):
+    calculator = CreditCalculator()
+    result = calculator.exec("Ratenkredit (Ratenhoehe)", [kreditbetrag, zinssatz, rate])
+
+    laufzeit, schlussrate = simulate_term(kreditbetrag, zinssatz, rate)
+    assert result.value == laufzeit
+    assert "Schlussrate {} €".format(round(schlussrate, 2)) in result.text
+
+
+@pytest.mark.usefixtures("backend")
+def test_ratenhoehe_batch_matches_exec():
+    calculator = CreditCalculator()
+    cases = _cases()
+    columns = [list(column) for column in zip(*cases)]
+
+    batch = calculator.exec_batch("Ratenkredit (Ratenhoehe)", columns)
+
+    expected = [calculator.exec("Ratenkredit (Ratenhoehe)", list(case)).value for case in cases]
+    assert [int(value) for value in batch] == expected
+
+
+def test_ratenhoehe_rejects_rate_below_interest():
+    calculator = CreditCalculator()
+    with pytest.raises(ValueError):
+        calculator.exec("Ratenkredit (Ratenhoehe)", [100000, 6, 500])
+    assert math.isnan(calculator.exec_batch("Ratenkredit (Ratenhoehe)", [[100000], [6], [500]])[0])
+
+
+def _annuity(kreditbetrag, zinssatz, laufzeit):
+    r = zinssatz / 100 / 12
+    if r == 0:
+        return kreditbetrag / laufzeit
+    return kreditbetrag * r / -math.expm1(-laufzeit * math.log1p(r))
+
+
+@pytest.mark.parametrize("kreditbetrag, zinssatz, laufzeit", [
+    (100000, 3, 360),
+    (12000, 0, 12),
+    (5000, 0.0001, 48),
+    (250000, 4.5, 1),
+    (10000, 250, 600),
+    (10000, -5, 24),
+])
+def test_effektivzins_recovers_nominal_rate(kreditbetrag, zinssatz, laufzeit):
+    calculator = CreditCalculator()
+    rate = _annuity(kreditbetrag, zinssatz, laufzeit)
+    result = calculator.exec("Effektivzins", [kreditbetrag, rate, laufzeit])
+
+    effektivzins = math.expm1(12 * math.log1p(zinssatz / 1200)) * 100
+    assert result.value == pytest.approx(effektivzins, rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.usefixtures("backend")
+def test_effektivzins_batch_matches_exec():
+    calculator = CreditCalculator()
+    rng = random.Random(7)
+    cases = [(round(rng.uniform(1000, 500000), 2), round(rng.uniform(50, 5000), 2), rng.randint(1, 480))
+             for _ in range(200)]
+    columns = [list(column) for column in zip(*cases)]
+
+    batch = calculator.exec_batch("Effektivzins", columns)
+
+    expected = [calculator.exec("Effektivzins", list(case)).value for case in cases]
+    assert batch == pytest.approx(expected, rel=1e-12)
+    assert math.isnan(calculator.exec_batch("Effektivzins", [[1000], [0], [12]])[0])
+
+
+@pytest.mark.usefixtures("backend")
+def test_laufzeit_batch_flags_only_malformed_rows():
+    calculator = CreditCalculator()
+    cases = [("abc", 3, 12), (10000, 3, 12), ("", 3, 12), (5000, "1,5", 24), (5000, 1.5, None), ("2500", "0", "10")]
+    columns = [list(column) for column in zip(*cases)]
+
+    batch = calculator.exec_batch("Ratenkredit (Laufzeit)", columns)
+
+    assert [math.isnan(value) for value in batch] == [True, False, True, True, True, False]
+    assert batch[1] == calculator.exec("Ratenkredit (Laufzeit)", [10000, 3, 12]).value
+    assert batch[5] == calculator.exec("Ratenkredit (Laufzeit)", [2500, 0, 10]).value
+
+
+@pytest.mark.usefixtures("backend")
+def test_schedule_block_pickles_only_parameters(monkeypatch):
+    import pickle
+
+    from plugins.credit import schedule
+
+    rng = random.Random(3)
+    cases = [(round(rng.uniform(1000, 50000), 2), round(rng.uniform(0, 9), 2), rng.randint(300, 360)) for _ in range(40)]
+    cases[5] = ("abc", 3, 12)
+    columns = [list(column) for column in zip(*cases)]
+    monkeypatch.setattr(schedule.ScheduleBlock, "BLOCK_SIZE", 16)
+
+    plaene = schedule.ScheduleBlock(*columns).schedules()
+    erwartet = [list(plan.iter_rows()) if plan is not None else None for plan in plaene]
+    daten = pickle.dumps(plaene)
+    uebertragen = pickle.loads(daten)
+
+    # Uebertragen werden nur die Parameter, nicht die rund 13000 berechneten Monate
+    assert len(daten) < 200 * len(cases)
+    assert [list(plan.iter_rows()) if plan is not None else None for plan in uebertragen] == erwartet
+    assert uebertragen[5] is None
+    einzeln = schedule.AmortizationSchedule(*cases[7])
+    assert erwartet[7] == list(einzeln.iter_rows())
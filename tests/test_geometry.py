@@ -0,0 +1,259 @@
+import math
+import random
+import struct
+
+import pytest
+
+from plugins.geometry.geometry_calc import GeometryCalculator
+from plugins.geometry.polygon import PolygonAccumulator, iter_vertex_chunks, measure_polygon
+
+
+def _polygon(punkte):
+    return measure_polygon(iter_vertex_chunks("; ".join(f"{x},{y}" for x, y in punkte)))
+
+
+def _reference(punkte):
+    """Shoelace-Formel direkt auf der ganzen Punktliste (relativ zum ersten Punkt, ohne Bloecke)."""
+    ox, oy = punkte[0]
+    punkte = [(x - ox, y - oy) for x, y in punkte]
+    n = len(punkte)
+    a = cx = cy = umfang = 0.0
+    for (x0, y0), (x1, y1) in zip(punkte, punkte[1:] + punkte[:1]):
+        kreuz = x0 * y1 - x1 * y0
+        a += kreuz
+        cx += (x0 + x1) * kreuz
+        cy += (y0 + y1) * kreuz
+        umfang += math.hypot(x1 - x0, y1 - y0)
+    return n, abs(a) / 2, umfang, ox + cx / (3 * a), oy + cy / (3 * a)
+
+
+def _circle(n, radius=1.0, cx=0.0, cy=0.0):
+    return [(cx + radius * math.cos(2 * math.pi * i / n), cy + radius * math.sin(2 * math.pi * i / n)) for i in range(n)]
+
+
+def test_polygon_unit_square():
+    ergebnis = _polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+    assert ergebnis == {
+        "eckpunkte": 4, "flaeche": 1.0, "umfang": 4.0, "schwerpunkt_x": 0.5, "schwerpunkt_y": 0.5,
+        "konvex": True, "orientierung": "gegen den Uhrzeigersinn",
+    }
+
+
+def test_polygon_ignores_repeated_vertices():
+    quadrat = [(0, 0), (1, 0), (1, 1), (0, 1)]
+    mit_wiederholungen = [(0, 0), (0, 0), (1, 0), (1, 1), (1, 1), (1, 1), (0, 1), (0, 0)]
+    assert _polygon(mit_wiederholungen) == _polygon(quadrat)
+
+
+def test_polygon_clockwise_and_concave():
+    ergebnis = _polygon([(0, 0), (0, 2), (1, 1), (2, 2), (2, 0)])
+    assert ergebnis["orientierung"] == "im Uhrzeigersinn"
+    assert ergebnis["konvex"] is False
+    assert ergebnis["flaeche"] == pytest.approx(3.0)
+
+
+def test_polygon_star_is_not_convex():
+    # Pentagramm: dreht nur in eine Richtung, aber zweimal herum
+    stern = [_circle(5)[(2 * i) % 5] for i in range(5)]
+    assert _polygon(stern)["konvex"] is False
+
+
+@pytest.mark.parametrize("punkte", [[(0, 0), (1, 1)], [(0, 0), (1, 1), (2, 2)], [(3, 3), (3, 3), (3, 3)]])
+def test_polygon_rejects_degenerate_input(punkte):
+    with pytest.raises(ValueError):
+        _polygon(punkte)
+
+
+@pytest.mark.usefixtures("backend")
+def test_polygon_matches_reference_in_small_chunks():
+    rng = random.Random(5)
+    punkte = [(x + rng.uniform(-0.01, 0.01), y) for x, y in _circle(997, 250.0, 500000.0, 5400000.0)]
+    polygon = PolygonAccumulator()
+    koordinaten = [wert for punkt in punkte for wert in punkt]
+    for start in range(0, len(koordinaten), 2 * 37):
+        polygon.add(koordinaten[start:start + 2 * 37])
+    ergebnis = polygon.result()
+
+    n, flaeche, umfang, cx, cy = _reference(punkte)
+    assert ergebnis["eckpunkte"] == n
+    assert ergebnis["flaeche"] == pytest.approx(flaeche, rel=1e-6)
+    assert ergebnis["umfang"] == pytest.approx(umfang, rel=1e-12)
+    assert ergebnis["schwerpunkt_x"] == pytest.approx(cx, abs=1e-6)
+    assert ergebnis["schwerpunkt_y"] == pytest.approx(cy, abs=1e-6)
+
+
+@pytest.mark.usefixtures("backend")
+def test_polygon_large_offset_circle_is_convex():
+    ergebnis = _polygon(_circle(2000, 10.0, 691000.0, 5335000.0))
+    assert ergebnis["konvex"] is True
+    assert ergebnis["flaeche"] == pytest.approx(math.pi * 100, rel=1e-4)
+
+
+@pytest.mark.usefixtures("backend")
+def test_polygon_files(tmp_path):
+    punkte = _circle(500, 3.0, 10.0, -4.0)
+    erwartet = _polygon(punkte)
+
+    csv_datei = tmp_path / "umriss.csv"
+    csv_datei.write_text("x;y\n" + "".join(f"{x};{y}\n" for x, y in punkte))
+    xyz_datei = tmp_path / "umriss.xyz"
+    xyz_datei.write_text("".join(f"  {x!r}   {y!r} 12.5\n" for x, y in punkte))
+    bin_datei = tmp_path / "umriss.bin"
+    bin_datei.write_bytes(b"".join(struct.pack("<dd", x, y) for x, y in punkte))
+
+    for datei in (csv_datei, xyz_datei, bin_datei):
+        ergebnis = measure_polygon(iter_vertex_chunks(str(datei), chunk_vertices=64))
+        assert ergebnis["eckpunkte"] == 500
+        for key in ("flaeche", "umfang", "schwerpunkt_x", "schwerpunkt_y"):
+            assert ergebnis[key] == pytest.approx(erwartet[key], rel=1e-12), (datei, key)
+
+
+@pytest.mark.parametrize("name", ["umriss.dat", "umriss", "umriss.json"])
+def test_polygon_rejects_unknown_file_types(tmp_path, name):
+    datei = tmp_path / name
+    datei.write_text("0 0\n1 0\n1 1\n0 1\n")
+    with pytest.raises(ValueError, match="Unbekanntes Dateiformat"):
+        iter_vertex_chunks(str(datei))
+
+
+def test_polygon_command_text():
+    ergebnis = GeometryCalculator().exec("Polygon", ["0,0; 4,0; 4,3; 4,3"])
+    assert ergebnis.value["eckpunkte"] == 3
+    assert ergebnis.value["flaeche"] == 6.0
+    assert "Polygon mit 3 Eckpunkten" in ergebnis.text
+    assert "Umfang: 12.0" in ergebnis.text
+
+
+SSS = "SSS (drei Seiten)"
+SWS = "SWS (zwei Seiten, ein Winkel)"
+WSW = "WSW (zwei Winkel, eine Seite)"
+SSW = "SSW (zwei Seiten, gegenueberliegender Winkel)"
+GRUNDSEITE = "Grundseite und Hoehe"
+
+
+def _dreieck(art, a="", b="", c="", winkel_a="", winkel_b="", winkel_c="", hoehe=""):
+    return [art, a, b, c, winkel_a, winkel_b, winkel_c, hoehe]
+
+
+def _triangle_cases():
+    rng = random.Random(21)
+    cases = [
+        _dreieck(SSS, 3, 4, 5),
+        _dreieck(SSW, 6, 10, winkel_a=30),
+        _dreieck(SSW, 10, 10, winkel_a=90),
+        _dreieck(SSW, 5, 10, winkel_a=30),
+        _dreieck(SSW, 12, 10, winkel_a=30),
+        _dreieck(SSW, 12, 10, winkel_a=120),
+        _dreieck(SSS, 1, 2, 3),
+        _dreieck(SSS, "abc", 2, 3),
+        _dreieck(SWS, 4, "", winkel_c=60),
+        _dreieck(WSW, c=5, winkel_a=100, winkel_b=80),
+        _dreieck("Unbekannt", 3, 4, 5),
+    ]
+    for _ in range(60):
+        a, b = rng.uniform(0.1, 100), rng.uniform(0.1, 100)
+        cases.append(_dreieck(SSS, a, b, rng.uniform(abs(a - b) + 0.01, a + b - 0.01)))
+        cases.append(_dreieck(SWS, a, b, winkel_c=rng.uniform(1, 179)))
+        alpha = rng.uniform(1, 170)
+        cases.append(_dreieck(WSW, c=a, winkel_a=alpha, winkel_b=rng.uniform(1, 179 - alpha)))
+        cases.append(_dreieck(SSW, a, b, winkel_a=rng.uniform(1, 179)))
+        cases.append(_dreieck(GRUNDSEITE, a, hoehe=b))
+    return cases
+
+
+def _exec_triangles(calculator, case):
+    """Erwartete Dreiecke laut exec (Liste, leer wenn kein Dreieck moeglich ist)."""
+    try:
+        wert = calculator.exec("Dreieck", case).value
+    except ValueError:
+        return []
+    if case[0] == GRUNDSEITE:
+        return [{"a": wert["grundseite"], "hoehe_a": wert["hoehe"], "flaeche": wert["flaeche"]}]
+    return wert if isinstance(wert, list) else [wert]
+
+
+@pytest.mark.usefixtures("backend")
+def test_triangle_batch_matches_exec():
+    from plugins.geometry.triangles import BATCH_KEYS, TRIANGLE_KEYS
+
+    calculator = GeometryCalculator()
+    cases = _triangle_cases()
+    batch = calculator.exec_batch("Dreieck", [list(column) for column in zip(*cases)])
+    zeilen = [dict(zip(BATCH_KEYS, werte)) for werte in zip(*batch)]
+
+    for case, zeile in zip(cases, zeilen):
+        erwartet = _exec_triangles(calculator, case)
+        if case[0] == SSW and case[1] != "abc":
+            assert zeile["loesungen"] == len(erwartet), case
+        elif not erwartet:
+            assert all(math.isnan(wert) for wert in zeile.values()), case
+            continue
+        for nummer, dreieck in enumerate(erwartet):
+            suffix = "_2" if nummer else ""
+            for key, wert in dreieck.items():
+                assert zeile[key + suffix] == pytest.approx(wert, rel=1e-5), (case, key)
+        if len(erwartet) < 2:
+            assert all(math.isnan(zeile[key + "_2"]) for key in TRIANGLE_KEYS), case
+
+
+@pytest.mark.usefixtures("backend")
+def test_triangle_known_values():
+    calculator = GeometryCalculator()
+    wert = calculator.exec("Dreieck", _dreieck(SSS, 3, 4, 5)).value
+    assert wert == {
+        "a": 3.0, "b": 4.0, "c": 5.0, "umfang": 12.0, "flaeche": 6.0,
+        "alpha_grad": 36.8699, "beta_grad": 53.1301, "gamma_grad": 90.0,
+        "hoehe_a": 4.0, "hoehe_b": 3.0, "hoehe_c": 2.4, "inkreisradius": 1.0, "umkreisradius": 2.5,
+    }
+    gleichseitig = calculator.exec("Dreieck", _dreieck(SWS, 2, 2, winkel_c=60)).value
+    assert gleichseitig["c"] == 2.0
+    assert gleichseitig["flaeche"] == round(math.sqrt(3), 5)
+
+
+@pytest.mark.usefixtures("backend")
+def test_ssw_solution_counts():
+    calculator = GeometryCalculator()
+    zwei = calculator.exec("Dreieck", _dreieck(SSW, 6, 10, winkel_a=30)).value
+    assert [dreieck["c"] for dreieck in zwei] == [11.9769, 5.34363]
+    assert [dreieck["beta_grad"] for dreieck in zwei] == [56.4427, 123.557]
+
+    with pytest.raises(ValueError):
+        calculator.exec("Dreieck", _dreieck(SSW, 10, 10, winkel_a=90))
+
+    # a = b * sin(A): genau ein rechtwinkliges Dreieck
+    eins = calculator.exec("Dreieck", _dreieck(SSW, 5, 10, winkel_a=30)).value
+    assert len(eins) == 1 and eins[0]["beta_grad"] == 90.0
+
+    batch = calculator.exec_batch("Dreieck", [list(c) for c in zip(
+        _dreieck(SSW, 6, 10, winkel_a=30), _dreieck(SSW, 10, 10, winkel_a=90), _dreieck(SSW, 5, 10, winkel_a=30),
+    )])
+    from plugins.geometry.triangles import BATCH_KEYS
+    assert batch[BATCH_KEYS.index("loesungen")] == [2.0, 0.0, 1.0]
+    a = batch[BATCH_KEYS.index("a")]
+    assert a[0] == 6.0 and math.isnan(a[1]) and a[2] == 5.0
+
+
+@pytest.mark.usefixtures("backend")
+def test_circle_and_parallelogram_batch_match_exec():
+    calculator = GeometryCalculator()
+    radien = [1, 2, 0.5, 1e-9, 1e12, 0, -1, "abc"]
+    umfang, flaeche = calculator.exec_batch("Kreis", [radien])
+    for r, u, f in zip(radien, umfang, flaeche):
+        try:
+            erwartet = calculator.exec("Kreis", [r]).value
+        except ValueError:
+            assert math.isnan(u) and math.isnan(f), r
+            continue
+        assert (u, f) == erwartet, r
+    assert (umfang[0], flaeche[0]) == (6.28319, 3.14159)
+
+    faelle = [(3, 4, 2), (5, 5, 5), (1.5, 2.5, 1), (3, 4, 5), (0, 4, 2), ("", 4, 2)]
+    umfang, flaeche = calculator.exec_batch("Parallelogramm", [list(spalte) for spalte in zip(*faelle)])
+    for fall, u, f in zip(faelle, umfang, flaeche):
+        try:
+            erwartet = calculator.exec("Parallelogramm", list(fall)).value
+        except ValueError:
+            assert math.isnan(u) and math.isnan(f), fall
+            continue
+        assert (u, f) == erwartet, fall
+    assert (umfang[0], flaeche[0]) == (14.0, 6.0)
@@ -0,0 +1,224 @@
+import pytest
+
+from plugins.math_functions.primes import (
+    SEGMENT_SIZE, SIEVE_COUNT_LIMIT, PrimeRange, count_primes, is_prime, iter_primes,
+    iter_segments, prime_pi,
+)
+
+
+def simple_sieve(limit):
+    """Referenz: einfaches Sieb des Eratosthenes bis limit (einschliesslich)."""
+    if limit < 2:
+        return []
+    flags = bytearray([1]) * (limit + 1)
+    flags[0] = flags[1] = 0
+    for p in range(2, int(limit**0.5) + 1):
+        if flags[p]:
+            flags[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return [n for n in range(limit + 1) if flags[n]]
+
+
+@pytest.mark.parametrize("untergrenze, obergrenze, segment_size", [
+    (0, 1000, 7),
+    (2, 1000, 8),
+    (101, 2000, 16),
+    (500, 3001, 33),
+    (3, 3, 1),
+])
+def test_iter_primes_small_segments_match_sieve(untergrenze, obergrenze, segment_size):
+    erwartet = [p for p in simple_sieve(obergrenze) if p >= untergrenze]
+    erhalten = [2] if untergrenze <= 2 <= obergrenze else []
+    for start, segment in iter_segments(untergrenze, obergrenze, segment_size):
+        assert start % 2 == 1
+        erhalten += [start + 2 * i for i, flag in enumerate(segment) if flag]
+    assert erhalten == erwartet
+
+
+def test_iter_segments_starts_are_consecutive_odd_numbers():
+    erwartet = 3
+    for start, segment in iter_segments(0, 1001, 10):
+        assert start == erwartet
+        erwartet = start + 2 * len(segment)
+    assert erwartet == 1003
+
+
+def test_iter_primes_crosses_default_segment_boundary():
+    obergrenze = 3 * SEGMENT_SIZE
+    assert list(iter_primes(2, obergrenze)) == simple_sieve(obergrenze)
+
+
+def test_iter_primes_large_window_matches_miller_rabin():
+    untergrenze = 10**9
+    obergrenze = untergrenze + 10**6
+    primes = list(iter_primes(untergrenze, obergrenze))
+
+    assert all(p % 2 == 1 for p in primes)
+    tail = [n for n in range(obergrenze - 2000, obergrenze + 1) if is_prime(n)]
+    assert primes[-len(tail):] == tail
+    head = [n for n in range(untergrenze, untergrenze + 2000) if is_prime(n)]
+    assert primes[:len(head)] == head
+
+
+@pytest.mark.parametrize("n, erwartet", [
+    (10**6, 78498),
+    (10**7, 664579),
+    (10**7 + 1, 664579),
+    (2 * 10**7, 1270607),
+])
+def test_prime_pi_known_values(n, erwartet):
+    assert prime_pi(n) == erwartet
+    assert count_primes(0, n) == erwartet
+    assert PrimeRange(2, n).count == erwartet
+
+
+def test_count_primes_small_ranges_match_sieve():
+    primes = simple_sieve(5000)
+    for untergrenze, obergrenze in [(0, 1), (2, 2), (3, 100), (90, 4999), (1000, 5000)]:
+        erwartet = sum(1 for p in primes if untergrenze <= p <= obergrenze)
+        assert count_primes(untergrenze, obergrenze) == erwartet
+
+
+@pytest.mark.parametrize("offset", [-1, 0, 1, 2])
+def test_sieve_and_pi_paths_agree_at_limit(offset):
+    n = SIEVE_COUNT_LIMIT + offset
+    sieb = PrimeRange(2, n).count
+    assert prime_pi(n) == sieb
+    # Breite ueber der Grenze: pi(obergrenze) - pi(untergrenze - 1)
+    assert count_primes(0, n + 1) == sieb + (1 if is_prime(n + 1) else 0)
+
+
+def test_prime_range_late_pages_match_sieve():
+    obergrenze = 4 * SEGMENT_SIZE + 12345
+    primes = simple_sieve(obergrenze)
+    bereich = PrimeRange(2, obergrenze)
+
+    assert bereich.count == len(primes)
+    assert bereich.last == primes[-1]
+    assert list(bereich) == primes
+    letzte_seite = (len(primes) - 1) // 100
+    for seite in list(range(0, letzte_seite, 97)) + [letzte_seite - 1, letzte_seite]:
+        assert bereich.page(seite) == primes[seite * 100:(seite + 1) * 100]
+    assert bereich.page(letzte_seite + 1) == []
+
+
+def test_prime_range_page_in_high_window():
+    untergrenze = 10**7
+    bereich = PrimeRange(untergrenze, 2 * 10**7)
+    assert bereich.count == 1270607 - 664579
+
+    seite = bereich.page(5000, 50)
+    assert len(seite) == 50
+    assert all(is_prime(p) for p in seite)
+    assert [n for n in range(seite[0], seite[-1] + 1) if is_prime(n)] == seite
+
+
+@pytest.mark.parametrize("untergrenze", [10**15, 10**18 + 3])
+def test_sparse_window_over_several_segments_matches_miller_rabin(untergrenze):
+    # Wurzel ueber BASE_PRIME_LIMIT: nur Vorsieb mit kleinen Primzahlen und Miller-Rabin
+    obergrenze = untergrenze + 20000
+    erhalten = []
+    for start, segment in iter_segments(untergrenze, obergrenze, 1000):
+        assert start % 2 == 1
+        erhalten += [start + 2 * i for i, flag in enumerate(segment) if flag]
+    assert erhalten == [n for n in range(untergrenze, obergrenze + 1) if is_prime(n)]
+
+
+def test_sparse_window_wider_than_default_segment():
+    untergrenze = 10**15
+    grenze = untergrenze + 2 * SEGMENT_SIZE
+    segmente = list(iter_segments(untergrenze, grenze + 3000))
+    assert [start for start, _ in segmente] == [untergrenze + 1, grenze + 1]
+
+    primes = [start + 2 * i for start, segment in segmente for i, flag in enumerate(segment) if flag]
+    erwartet = [n for n in range(grenze - 3000, grenze + 3001) if is_prime(n)]
+    assert [p for p in primes if p >= grenze - 3000] == erwartet
+
+
+@pytest.mark.usefixtures("backend")
+def test_vectorized_math_batch_matches_exec():
+    import math
+
+    from core.rounding import round_significant
+    from plugins.math_functions.math_func import MathFunctions
+
+    rechner = MathFunctions()
+    wurzeln = [0, 1, 2, 144, 0.5, 1e-300, 1e300, -4, "abc", "", "9"]
+    batch = list(rechner.exec_batch("Quadratwurzel", [wurzeln]))
+    for x, wert in zip(wurzeln, batch):
+        try:
+            erwartet = rechner.exec("Quadratwurzel", [x]).value
+        except ValueError:
+            assert math.isnan(wert), x
+            continue
+        assert wert == erwartet, x
+    assert batch[:4] == [0, 1, 1.41421, 12]
+
+    faelle = [(2, 10), (2.5, -3), ("1.1", 3), (10, 0), (-2, 3), (0, 5), (0, 0), (0, -1), ("x", 2)]
+    batch = list(rechner.exec_batch("Potenz", [list(spalte) for spalte in zip(*faelle)]))
+    for (basis, exponent), wert in zip(faelle, batch):
+        try:
+            erwartet = rechner.exec("Potenz", [basis, exponent]).value
+        except (ValueError, ZeroDivisionError):
+            assert math.isnan(wert), (basis, exponent)
+            continue
+        assert wert == pytest.approx(round_significant(float(erwartet), 6), rel=1e-12), (basis, exponent)
+    assert batch[:4] == [1024, 0.064, 1.331, 1]
+
+
+@pytest.mark.parametrize("basis, exponent, erwartet", [
+    ("2", "0.333333333333333", 1.25992),
+    ("8", "2/3", 4),
+    ("-8", "1/3", -2),
+    ("1e400", "1/3", 2.15443e133),
+    ("2", "1/1000000000000000", 1.0),
+])
+def test_potenz_fractional_exponents_finish(basis, exponent, erwartet):
+    from plugins.math_functions.math_func import MathFunctions
+
+    assert MathFunctions().exec("Potenz", [basis, exponent]).value == erwartet
+
+
+@pytest.mark.parametrize("basis, exponent", [("10", "1000.5"), ("1e1000000000", "2"), ("2", "1e-1000000")])
+def test_potenz_out_of_range_raises_value_error(basis, exponent):
+    from plugins.math_functions.math_func import MathFunctions
+
+    with pytest.raises(ValueError):
+        MathFunctions().exec("Potenz", [basis, exponent])
+
+
+@pytest.mark.parametrize("x, stellen, erwartet", [
+    ("1e1000000000", 20, "1E+500000000"),
+    ("4e1000000001", 3, "6.32E+500000000"),
+    ("1e199998", 5, "1E+99999"),
+    ("144", 1, "12"),
+])
+def test_sqrt_digits_huge_exponents(x, stellen, erwartet):
+    from plugins.math_functions.math_func import MathFunctions
+
+    assert str(MathFunctions().exec("Quadratwurzel (Stellen)", [x, stellen]).value) == erwartet
+
+
+@pytest.mark.parametrize("max_nenner", ["0", "-5"])
+def test_naeherungsbrueche_rejects_small_max_denominator(max_nenner):
+    from plugins.math_functions.math_func import MathFunctions
+
+    with pytest.raises(ValueError):
+        MathFunctions().exec("Naeherungsbrueche", ["3.14159", max_nenner])
+
+
+def test_naeherungsbrueche_max_denominator_one():
+    from plugins.math_functions.math_func import MathFunctions
+
+    assert MathFunctions().exec("Naeherungsbrueche", ["3.14159", "1"]).value == [(3, 1)]
+
+
+def test_prime_range_summary_counts_without_sieving(monkeypatch):
+    from plugins.math_functions import primes
+    from plugins.math_functions.math_func import MathFunctions
+
+    ergebnis = MathFunctions().exec("Primzahlen", [0, 10**10])
+    # Zaehlen darf nicht den ganzen Bereich sieben (nur first/last sieben kleine Fenster)
+    monkeypatch.setattr(primes, "_sieve_count", None)
+
+    assert ergebnis.value.count == 455052511
+    assert "455052511 Primzahlen (2 ... 9999999967)" in ergebnis.text
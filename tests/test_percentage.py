@@ -0,0 +1,145 @@
+import math
+
+import pytest
+
+from core.money import MoneyContext, get_money_context, set_money_context
+from plugins.percentage.percentage_calc import PercentageCalculator
+
+# Alle Tests laufen zeilenweise und mit NumPy
+pytestmark = pytest.mark.usefixtures("backend")
+
+
+@pytest.fixture
+def money():
+    """Setzt die Rechenart fuer einen Test und stellt danach die vorherige wieder her."""
+    vorher = get_money_context()
+
+    def setzen(mode, rounding="kaufmaennisch"):
+        set_money_context(MoneyContext(mode, rounding))
+
+    yield setzen
+    set_money_context(vorher)
+
+
+# Betraege mit halben Cent, deren Gleitkommadarstellung knapp unter bzw. ueber der Mitte liegt
+HALF_CENTS = ["1.005", "2.675", "0.125", "0.135", "1.015", "-1.005", "1004.445", "0.5", "7", 1.005, 2.675]
+# Prozentsaetze, auch mit vielen Nachkommastellen (werden exakt als Bruch gefuehrt)
+SAETZE = ["19", "7", "0", "12.5", "0.0050", 16, 19.0005, "-3.25", "0.123456", "0.00005", 19.00005, "1e-7"]
+
+
+@pytest.mark.parametrize("rounding", ["kaufmaennisch", "bankers"])
+@pytest.mark.parametrize("command_name", ["%dazu", "%weg", "%davon", "Bruttopreis", "Nettopreis"])
+def test_cents_batch_matches_exec_on_half_cents(money, rounding, command_name):
+    money("cents", rounding)
+    calculator = PercentageCalculator()
+    cases = [(betrag, satz) for betrag in HALF_CENTS for satz in SAETZE]
+    columns = [list(column) for column in zip(*cases)]
+
+    batch = calculator.exec_batch(command_name, columns)
+
+    expected = [calculator.exec(command_name, list(case)).value for case in cases]
+    assert list(batch) == expected
+
+
+@pytest.mark.parametrize("command_name, params, expected", [
+    ("%dazu", ["1000000", "0.123456"], 1001234.56),
+    ("%davon", ["1000000", "0.00005"], 0.5),
+    ("Nettopreis", ["1000000", "0.123456"], 998766.96),
+])
+def test_cents_batch_keeps_exact_percent(money, command_name, params, expected):
+    money("cents")
+    calculator = PercentageCalculator()
+
+    assert calculator.exec(command_name, params).value == expected
+    assert list(calculator.exec_batch(command_name, [[params[0]], [params[1]]])) == [expected]
+
+
+@pytest.mark.parametrize("command_name, params, expected", [
+    ("Nettopreis", ["100000000000", "19"], 84033613445.38),
+    ("%davon", ["50000000000000", "19"], 9500000000000.0),
+    ("%dazu", ["1", "1e-30"], 1.0),
+])
+def test_cents_batch_does_not_overflow(money, command_name, params, expected):
+    money("cents")
+    calculator = PercentageCalculator()
+    columns = [[params[0], "100"], [params[1], "19"]]
+
+    assert calculator.exec(command_name, params).value == expected
+    assert list(calculator.exec_batch(command_name, columns)) == [
+        expected, calculator.exec(command_name, ["100", "19"]).value
+    ]
+
+
+def test_cents_rounding_of_half_cent_amounts(money):
+    calculator = PercentageCalculator()
+    money("cents", "kaufmaennisch")
+    assert list(calculator.exec_batch("%dazu", [["1.005", "2.675", "0.125"], [0, 0, 0]])) == [1.01, 2.68, 0.13]
+    money("cents", "bankers")
+    assert list(calculator.exec_batch("%dazu", [["1.005", "2.675", "0.125"], [0, 0, 0]])) == [1.0, 2.68, 0.12]
+
+
+def test_cents_batch_marks_malformed_cells(money):
+    money("cents")
+    calculator = PercentageCalculator()
+
+    batch = list(calculator.exec_batch("%davon", [["100", "", "abc", "200", None], ["19", "19", "19", "x", "7"]]))
+
+    assert batch[0] == 19.0
+    assert all(math.isnan(value) for value in batch[1:])
+
+
+RECHNUNGSZEILEN = [
+    ("100", "", "19"),
+    ("", "119", "19"),
+    ("", "", "19"),
+    (None, None, "7"),
+    ("", "abc", "19"),
+    ("12.345", "", "7"),
+    ("", "1.005", "19"),
+    ("50", "999", "19"),
+    ("", "100", "-100"),
+    (" ", "10.70", "7"),
+    ("1000000", "", "0.123456"),
+    ("", "1000000", "0.00005"),
+    ("50000000000000", "", "19"),
+    ("", "100000000000", "19"),
+]
+
+
+def _invoice_expected(calculator, case):
+    try:
+        return calculator.exec("Rechnungszeile", list(case)).value
+    except ValueError:
+        return (math.nan,) * 3
+
+
+@pytest.mark.parametrize("mode", ["float", "cents"])
+def test_invoice_batch_matches_exec_with_blank_rows(money, mode):
+    money(mode)
+    calculator = PercentageCalculator()
+    columns = [list(column) for column in zip(*RECHNUNGSZEILEN)]
+
+    batch = list(zip(*calculator.exec_batch("Rechnungszeile", columns)))
+
+    for erhalten, case in zip(batch, RECHNUNGSZEILEN):
+        erwartet = _invoice_expected(calculator, case)
+        assert [math.isnan(x) for x in erhalten] == [math.isnan(x) for x in erwartet], case
+        assert [x for x in erhalten if x == x] == [x for x in erwartet if x == x], case
+
+
+@pytest.mark.parametrize("command_name", ["%dazu", "%weg", "%davon", "%Satz", "Bruttopreis", "Nettopreis"])
+def test_float_batch_matches_exec(money, command_name):
+    money("float")
+    calculator = PercentageCalculator()
+    cases = [(g, p) for g in ["100", 19.99, "0", "-250.5", "", "abc"] for p in ["19", 7, "0", "-100", "x"]]
+    columns = [list(column) for column in zip(*cases)]
+
+    batch = list(calculator.exec_batch(command_name, columns))
+
+    for case, wert in zip(cases, batch):
+        try:
+            erwartet = calculator.exec(command_name, list(case)).value
+        except (ValueError, ZeroDivisionError):
+            assert math.isnan(wert), case
+            continue
+        assert wert == pytest.approx(erwartet, rel=1e-12, abs=1e-12), case
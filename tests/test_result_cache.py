@@ -0,0 +1,150 @@
+import pytest
+
+from core.money import MoneyContext, get_money_context, set_money_context
+from core.plugin_manager import PluginManager
+from core.result_cache import ResultCache, approximate_size
+from plugins.percentage.percentage_calc import PercentageCalculator
+
+
+class _CountingCalculator(PercentageCalculator):
+    """Prozentrechner, der seine exec-Aufrufe zaehlt."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def exec(self, command_name, params):
+        self.calls += 1
+        return super().exec(command_name, params)
+
+
+@pytest.fixture
+def manager():
+    vorher = get_money_context()
+    manager = PluginManager(cache=ResultCache(max_entries=8))
+    plugin = _CountingCalculator()
+    manager.plugins["percentage"] = plugin
+    manager.plugin_infos["percentage"] = plugin.get_info()
+    yield manager, plugin
+    set_money_context(vorher)
+
+
+def test_cache_hit_and_miss():
+    cache = ResultCache()
+    assert cache.get("a") is None
+    assert cache.put("a", 1.5)
+    assert cache.get("a") == 1.5
+    assert cache.stats() == {
+        "eintraege": 1, "bytes": approximate_size(1.5), "treffer": 1, "fehlschlaege": 1, "verdraengungen": 0,
+    }
+
+
+def test_cache_evicts_least_recently_used_entry():
+    cache = ResultCache(max_entries=3)
+    for key in "abc":
+        cache.put(key, key.upper())
+    assert cache.get("a") == "A"  # a ist jetzt zuletzt genutzt
+    cache.put("d", "D")
+
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in "acd"] == ["A", "C", "D"]
+    assert cache.stats()["verdraengungen"] == 1
+    assert len(cache) == 3
+
+
+def test_cache_respects_byte_limit():
+    cache = ResultCache(max_entries=100, max_bytes=250)
+    assert cache.put("a", "x", size=100)
+    assert cache.put("b", "y", size=100)
+    assert cache.put("c", "z", size=100)
+    assert cache.get("a") is None
+    assert cache.bytes == 200
+    # Zu gross fuer den ganzen Cache: wird nicht gespeichert und verdraengt nichts
+    assert not cache.put("d", "gross", size=251)
+    assert len(cache) == 2
+
+    # Ersetzen eines Eintrags zaehlt seine Groesse nur einmal
+    cache.put("b", "y2", size=50)
+    assert cache.bytes == 150
+
+
+def test_cache_clear_keeps_counters():
+    cache = ResultCache()
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.stats() == {"eintraege": 0, "bytes": 0, "treffer": 1, "fehlschlaege": 1, "verdraengungen": 0}
+
+
+def test_approximate_size_scales_with_sampled_collections():
+    klein = approximate_size([1.5] * 100)
+    gross = approximate_size([1.5] * 100000)
+    assert gross > 500 * klein
+    assert approximate_size({"a": "x" * 1000}) > 1000
+
+
+def test_execute_uses_cache(manager):
+    manager, plugin = manager
+    erstes = manager.execute("percentage", "%dazu", [100, 19])
+    zweites = manager.execute("percentage", "%dazu", [100, 19])
+
+    assert zweites is erstes
+    assert plugin.calls == 1
+    assert manager.cache.stats()["treffer"] == 1
+    assert zweites.value == plugin.exec("%dazu", [100, 19]).value
+
+
+def test_execute_separates_parameter_types(manager):
+    manager, plugin = manager
+    ganz = manager.execute("percentage", "%dazu", [10, 5])
+    komma = manager.execute("percentage", "%dazu", [10.0, 5])
+    text = manager.execute("percentage", "%dazu", ["10", 5])
+
+    assert plugin.calls == 3
+    assert len({id(ganz), id(komma), id(text)}) == 3
+    assert manager.execute("percentage", "%dazu", [10.0, 5]) is komma
+
+
+def test_execute_separates_money_modes(manager):
+    manager, plugin = manager
+    set_money_context(MoneyContext("float"))
+    gleitkomma = manager.execute("percentage", "%dazu", ["10.005", 0])
+    set_money_context(MoneyContext("cents"))
+    cent = manager.execute("percentage", "%dazu", ["10.005", 0])
+    set_money_context(MoneyContext("cents", "bankers"))
+    bankers = manager.execute("percentage", "%dazu", ["10.005", 0])
+
+    assert (gleitkomma.value, cent.value, bankers.value) == (10.005, 10.01, 10.0)
+    assert plugin.calls == 3
+    set_money_context(MoneyContext("cents"))
+    assert manager.execute("percentage", "%dazu", ["10.005", 0]) is cent
+    assert plugin.calls == 3
+
+
+def test_execute_evicts_and_recomputes(manager):
+    manager, plugin = manager
+    for grundwert in range(9):
+        manager.execute("percentage", "%davon", [grundwert, 10])
+    assert len(manager.cache) == 8
+    manager.execute("percentage", "%davon", [0, 10])
+    assert plugin.calls == 10
+    manager.execute("percentage", "%davon", [8, 10])
+    assert plugin.calls == 10
+
+
+def test_execute_skips_uncacheable_and_unhashable(manager):
+    manager, plugin = manager
+    for command in plugin.commands:
+        command.cacheable = command.name != "%davon"
+    manager.execute("percentage", "%davon", [1, 2])
+    manager.execute("percentage", "%davon", [1, 2])
+    assert plugin.calls == 2
+
+    # Nicht hashbare Parameter gehen ohne Cache direkt an exec
+    with pytest.raises(TypeError):
+        manager.execute("percentage", "%dazu", [[1], 2])
+    assert plugin.calls == 3
+    with pytest.raises(ValueError):
+        manager.execute("unbekannt", "%dazu", [1, 2])
+    assert len(manager.cache) == 0
@@ -0,0 +1,54 @@
+import math
+import random
+
+import pytest
+
+from core.rounding import round_array, round_significant, round_significant_array
+
+# Alle Tests laufen zeilenweise und mit NumPy
+pytestmark = pytest.mark.usefixtures("backend")
+
+
+def _log_uniform(seed, count=20000):
+    """Stichprobe ueber den ganzen Wertebereich von float, inklusive subnormaler Zahlen."""
+    rng = random.Random(seed)
+    werte = [rng.choice((-1, 1)) * 10 ** rng.uniform(-320, 308) for _ in range(count)]
+    werte += [rng.choice((-1, 1)) * rng.uniform(0, 1e6) for _ in range(count // 4)]
+    return werte
+
+
+SPECIAL = [
+    0.0, -0.0, math.inf, -math.inf, math.nan, 5e-324, -5e-324, 2.2250738585072014e-308, 1.7976931348623157e308,
+    3.0916199999999997e168, 3.09162e168, 1e22, 1e23, 1e-17, 999999.5, 9999995.0, 1234565.0, 0.1, 1e-5, 2.675,
+    13.205000000000002, 0.3, 1 / 3, 999999.9999999999, 1000000.0000000001,
+]
+
+
+def _same(a, b):
+    return a == b or (a != a and b != b)
+
+
+@pytest.mark.parametrize("digits", [1, 3, 6, 10, 15])
+def test_round_significant_array_matches_scalar(digits):
+    werte = _log_uniform(digits) + SPECIAL
+    erhalten = list(round_significant_array(werte, digits))
+    erwartet = [round_significant(wert, digits) for wert in werte]
+    abweichungen = [(w, e, r) for w, e, r in zip(werte, erhalten, erwartet) if not _same(e, r)]
+    assert abweichungen == []
+
+
+def test_round_significant_known_values():
+    assert round_significant(3.0916199999999997e168) == 3.09162e168
+    assert list(round_significant_array([3.0916199999999997e168, 123456789.0, 0.000123456789, -2.5e-320])) == [
+        3.09162e168, 123457000.0, 0.000123457, -2.5e-320,
+    ]
+
+
+@pytest.mark.parametrize("digits", [-3, 0, 2, 5])
+def test_round_array_matches_round(digits):
+    rng = random.Random(digits)
+    werte = [round(rng.uniform(-1000, 1000), rng.randint(0, 4)) + rng.choice((0, 0.005, 0.0005)) for _ in range(20000)]
+    werte += SPECIAL[:3] + SPECIAL[5:]
+    erhalten = list(round_array(werte, digits))
+    erwartet = [round(wert, digits) for wert in werte]
+    assert [(w, e, r) for w, e, r in zip(werte, erhalten, erwartet) if not _same(e, r)] == []